@@ -12,7 +12,6 @@ See LICENSE file for details.
 - 새로운 사실 발견 시 업데이트
 """
 
-import json
 import os
 import hashlib
 from datetime import datetime, timedelta
@@ -26,7 +25,7 @@ from pathlib import Path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from scripts.utils import truncate_text
+from scripts.utils import truncate_text, extract_markdown_title, dumps_json, load_json_file
 
 logging.basicConfig(
     level=logging.INFO,
@@ -35,6 +34,22 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _load_json_if_exists(path) -> Optional[Dict]:
+    """JSON 파일 로드 (존재 여부를 따로 stat하지 않고 바로 열어 보고, 없으면 None)"""
+    try:
+        return load_json_file(path)
+    except FileNotFoundError:
+        return None
+
+
+def _dump_json(data, path):
+    """JSON 파일 저장 (임시 파일에 쓴 뒤 교체하여 쓰는 도중 실패해도 기존 파일이 깨지지 않도록 함)"""
+    tmp_file = f"{path}.tmp"
+    with open(tmp_file, 'wb') as f:
+        f.write(dumps_json(data))
+    os.replace(tmp_file, path)
+
+
 class ArticleCacheManager:
     """기사 캐싱 및 업데이트 관리"""
     
@@ -46,15 +61,12 @@ class ArticleCacheManager:
         
     def _load_topic_index(self) -> Dict:
         """주제별 인덱스 로드"""
-        if os.path.exists(self.topic_index_file):
-            with open(self.topic_index_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        return {}
+        topic_index = _load_json_if_exists(self.topic_index_file)
+        return topic_index if topic_index is not None else {}
     
     def _save_topic_index(self):
         """주제별 인덱스 저장"""
-        with open(self.topic_index_file, 'w', encoding='utf-8') as f:
-            json.dump(self.topic_index, f, ensure_ascii=False, indent=2)
+        _dump_json(self.topic_index, self.topic_index_file)
     
     def _generate_topic_hash(self, title: str, keywords: List[str]) -> str:
         """주제 해시 생성"""
@@ -65,12 +77,7 @@ class ArticleCacheManager:
     def load_article(self, topic_id: str) -> Optional[Dict]:
         """특정 ID의 기사 로드"""
         cache_file = os.path.join(self.cache_dir, f"{topic_id}.json")
-        
-        if os.path.exists(cache_file):
-            with open(cache_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        
-        return None
+        return _load_json_if_exists(cache_file)
     
     def _calculate_similarity(self, text1: str, text2: str) -> float:
         """두 텍스트의 유사도 계산"""
@@ -105,10 +112,9 @@ class ArticleCacheManager:
                 logger.info(f"유사한 기존 기사 발견: {topic_data['main_title']} (유사도: {total_similarity:.2f})")
                 
                 # 캐시된 데이터 로드
-                cache_file = f"{self.cache_dir}/{topic_id}.json"
-                if os.path.exists(cache_file):
-                    with open(cache_file, 'r', encoding='utf-8') as f:
-                        similar_articles.append((total_similarity, json.load(f)))
+                cached_data = _load_json_if_exists(f"{self.cache_dir}/{topic_id}.json")
+                if cached_data is not None:
+                    similar_articles.append((total_similarity, cached_data))
         
         if len(similar_articles) > 0:
             similar_articles.sort(key=lambda x: x[0], reverse=True)
@@ -133,10 +139,12 @@ class ArticleCacheManager:
         version = article_data.get('version', 1)
         
         # 캐시 데이터 구성
+        now = datetime.now()
         cache_data = {
             'topic_id': topic_id,
-            'created_at': article_data.get('created_at', datetime.now().isoformat()),
-            'last_updated': datetime.now().isoformat(),
+            'created_at': article_data.get('created_at', now.isoformat()),
+            'last_updated': now.isoformat(),
+            'last_updated_epoch': int(now.timestamp()),  # 시간대 해석 없이 비교할 수 있는 정수 시각
             'version': version,
             'main_article': article_data['main_article'],
             'analysis': article_data.get('analysis', {}),
@@ -154,19 +162,15 @@ class ArticleCacheManager:
         
         # 캐시 파일 저장
         cache_file = f"{self.cache_dir}/{topic_id}.json"
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(cache_data, f, ensure_ascii=False, indent=2)
+        _dump_json(cache_data, cache_file)
         
         # 인덱스 업데이트
         # comprehensive_article에서 제목 추출
-        comprehensive_title = article_data['main_article']['title']  # 기본값
-        comprehensive_content = article_data.get('comprehensive_article', '')
-        if comprehensive_content:
-            # 첫 번째 # 제목 찾기
-            import re
-            title_match = re.search(r'^#\s+(.+?)$', comprehensive_content, re.MULTILINE)
-            if title_match:
-                comprehensive_title = title_match.group(1).strip()
+        # 첫 번째 # 제목 찾기 (없으면 원본 기사 제목)
+        comprehensive_title = (
+            extract_markdown_title(article_data.get('comprehensive_article', ''))
+            or article_data['main_article']['title']
+        )
         
         self.topic_index[topic_id] = {
             'main_title': comprehensive_title,
@@ -190,6 +194,20 @@ class ArticleCacheManager:
         logger.info(f"기사 캐시 저장 완료: {topic_id} (버전 {version})")
         return topic_id
     
+    def patch_article_fields(self, topic_id: str, updates: Dict) -> bool:
+        """캐시된 기사의 일부 필드만 갱신 (주제 인덱스는 건드리지 않음)"""
+        cache_file = f"{self.cache_dir}/{topic_id}.json"
+        cached_data = _load_json_if_exists(cache_file)
+        if cached_data is None:
+            logger.error(f"캐시 파일을 찾을 수 없음: {topic_id}")
+            return False
+        
+        cached_data.update(updates)
+        _dump_json(cached_data, cache_file)
+        
+        logger.info(f"기사 캐시 필드 갱신: {topic_id} ({', '.join(updates)})")
+        return True
+    
     def check_for_updates(self, cached_data: Dict, new_articles: List[Dict]) -> Dict:
         """새로운 정보 확인 및 업데이트 필요성 판단"""
         
@@ -236,17 +254,17 @@ class ArticleCacheManager:
         """기존 기사 업데이트"""
         
         cache_file = f"{self.cache_dir}/{topic_id}.json"
-        if not os.path.exists(cache_file):
+        # 기존 데이터 로드 (존재 확인과 읽기를 한 번에)
+        cached_data = _load_json_if_exists(cache_file)
+        if cached_data is None:
             logger.error(f"캐시 파일을 찾을 수 없음: {topic_id}")
             return None
         
-        # 기존 데이터 로드
-        with open(cache_file, 'r', encoding='utf-8') as f:
-            cached_data = json.load(f)
-        
         # 버전 증가
         cached_data['version'] += 1
-        cached_data['last_updated'] = datetime.now().isoformat()
+        now = datetime.now()
+        cached_data['last_updated'] = now.isoformat()
+        cached_data['last_updated_epoch'] = int(now.timestamp())
         
         # 업데이트 이력 추가
         cached_data['update_history'].append({
@@ -271,8 +289,7 @@ class ArticleCacheManager:
                     cached_data['analysis'][key] = value
         
         # 캐시 파일 업데이트
-        with open(cache_file, 'w', encoding='utf-8') as f:
-            json.dump(cached_data, f, ensure_ascii=False, indent=2)
+        _dump_json(cached_data, cache_file)
         
         # 인덱스 업데이트
         if topic_id in self.topic_index:
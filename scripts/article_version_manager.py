@@ -24,6 +24,8 @@ class ArticleVersionManager:
     
     def load_topic_index(self):
         """주제 인덱스 로드"""
+        # get_article_history 결과 캐시 (인덱스를 다시 로드하면 비움)
+        self._history_cache = {}
         if os.path.exists(self.topic_index_path):
             with open(self.topic_index_path, 'r', encoding='utf-8') as f:
                 self.topic_index = json.load(f)
@@ -293,14 +295,38 @@ class ArticleVersionManager:
             # 부모 기사는 삭제하지 않음 (버전 체인 유지)
         
         self.save_topic_index()
+
+        # 새 버전은 기존 기사들의 히스토리(부모 방향 체인)를 바꾸지 않으므로 캐시를 비우지 않고,
+        # 새 기사의 히스토리만 부모의 히스토리 앞에 현재 버전을 붙여 바로 캐시에 넣음
+        history = [{
+            'version': version,
+            'article_id': article_id,
+            'title': article_data['title'],
+            'created_at': self.topic_index[article_id]['created_at'],
+            'is_current': True
+        }]
+        if parent_id:
+            history.extend(dict(version_info, is_current=False) for version_info in self._history(parent_id))
+        history.sort(key=lambda x: x['version'], reverse=True)
+        self._history_cache[article_id] = history
         
         return article_id
     
     def get_article_history(self, article_id: str) -> List[Dict]:
         """기사의 버전 히스토리 가져오기 (부모 버전 포함)"""
+        return [dict(version_info) for version_info in self._history(article_id)]
+
+    def _history(self, article_id: str) -> List[Dict]:
+        """기사의 버전 히스토리 (캐시된 리스트를 그대로 반환하므로 호출자가 수정하면 안 됨)"""
         if article_id not in self.topic_index:
             return []
         
+        # 같은 기사의 히스토리는 다시 계산하지 않음
+        # (버전 생성은 기존 기사의 부모 체인을 바꾸지 않으므로 캐시가 계속 유효함)
+        cached = self._history_cache.get(article_id)
+        if cached is not None:
+            return cached
+        
         history = []
         current_id = article_id
         
@@ -327,4 +353,5 @@ class ArticleVersionManager:
         # 버전 번호로 정렬 (최신 버전이 먼저)
         history.sort(key=lambda x: x['version'], reverse=True)
         
+        self._history_cache[article_id] = history
         return history
\ No newline at end of file
@@ -114,6 +114,12 @@ def deploy_to_site():
         run_command(f"cp cache/articles/topic_index.json {deploy_dir}/")
         print("   - topic_index.json 복사 완료")
     
+    # 키워드 추출 캐시 복사 (다음 실행 때 워크플로가 cache/로 복원해 이전 실행의 제목도 재사용)
+    if Path("cache/keywords/keyword_cache.json").exists():
+        (deploy_dir / "cache" / "keywords").mkdir(parents=True, exist_ok=True)
+        run_command(f"cp cache/keywords/keyword_cache.json {deploy_dir}/cache/keywords/")
+        print("   - keyword_cache.json 복사 완료")
+    
     if Path("news_data/trends").exists():
         (deploy_dir / "trends").mkdir(exist_ok=True)
         run_command(f"cp news_data/trends/*.html {deploy_dir}/trends/ 2>/dev/null || true")
@@ -122,10 +128,7 @@ def deploy_to_site():
         (deploy_dir / "multi_article_analysis").mkdir(exist_ok=True)
         run_command(f"cp multi_article_analysis/*.json {deploy_dir}/multi_article_analysis/ 2>/dev/null || true")
     
-    # static 파일 복사
-    if Path("output/static").exists():
-        run_command(f"cp -r output/static {deploy_dir}/")
-        print("   - static 파일 복사 완료")
+    # static 파일은 4단계에서 output/ 하위 폴더와 함께 이미 복사됨
     
     # 배포 디렉토리에서 모든 기사를 포함한 index.html 재생성
     print("\n5.5. 모든 기사를 포함한 index.html 재생성...")
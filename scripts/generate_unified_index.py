@@ -15,12 +15,28 @@ See LICENSE file for details.
 import os
 import re
 import json
+from operator import itemgetter
 from pathlib import Path
 from datetime import datetime
 from bs4 import BeautifulSoup
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
-from scripts.utils import parse_iso_to_kst, format_kst_time
+from scripts.utils import parse_iso_to_kst, format_kst_time, load_json_file
+
+def _sort_key(dt):
+    """표시 시각(분 단위)과 같은 순서를 갖는 정수 정렬 키 (예: 202507241530)"""
+    return int(dt.strftime("%Y%m%d%H%M"))
+
+def _list_smart_article_times(smart_articles_dir=Path("output/smart_articles")):
+    """smart_articles의 (파일명, 파일명에 포함된 생성 시각) 목록 - 한 번만 스캔해서 재사용"""
+    html_times = []
+    if not smart_articles_dir.exists():
+        return html_times
+    for html_file in smart_articles_dir.glob("article_*.html"):
+        time_match = re.search(r'(\d{8}_\d{6})', html_file.name)
+        if time_match:
+            html_times.append((html_file.name, datetime.strptime(time_match.group(1), "%Y%m%d_%H%M%S")))
+    return html_times
 
 def extract_article_info_from_html(html_path):
     """HTML 파일에서 기사 정보 추출"""
@@ -45,8 +61,10 @@ def extract_article_info_from_html(html_path):
             time_str = time_match.group(1)
             dt = datetime.strptime(time_str, "%Y%m%d_%H%M%S")
             formatted_time = dt.strftime("%Y년 %m월 %d일 %H:%M")
+            sort_ts = _sort_key(dt)
         else:
             formatted_time = "시간 정보 없음"
+            sort_ts = 0
         
         # 세 줄 요약 추출
         summary_lines = []
@@ -73,6 +91,7 @@ def extract_article_info_from_html(html_path):
             'filename': os.path.basename(html_path),
             'title': title_text,
             'time': formatted_time,
+            '_sort_ts': sort_ts,
             'summary': summary,
             'source': 'html',
             'path': str(html_path)
@@ -81,11 +100,14 @@ def extract_article_info_from_html(html_path):
         print(f"Error processing {html_path}: {e}")
         return None
 
-def extract_article_info_from_cache(json_path, topic_id=None):
-    """캐시 JSON에서 기사 정보 추출"""
+def extract_article_info_from_cache(json_path, topic_id=None, html_times=None):
+    """캐시 JSON에서 기사 정보 추출
+
+    html_times: _list_smart_article_times() 결과. 여러 기사를 처리할 때 미리 스캔해서 넘기면
+    기사마다 디렉토리를 다시 읽지 않는다.
+    """
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = load_json_file(json_path)
         
         # 제목 - AI 생성 제목 우선 사용
         title = data.get('generated_title') or data.get('main_article', {}).get('title', '제목 없음')
@@ -95,8 +117,10 @@ def extract_article_info_from_cache(json_path, topic_id=None):
         if time_str:
             dt = datetime.fromisoformat(time_str)
             formatted_time = dt.strftime("%Y년 %m월 %d일 %H:%M")
+            sort_ts = _sort_key(dt)
         else:
             formatted_time = "시간 정보 없음"
+            sort_ts = 0
         
         # article_id와 version 정보 가져오기
         article_id = topic_id or data.get('topic_id', os.path.basename(json_path).replace('.json', ''))
@@ -142,22 +166,20 @@ def extract_article_info_from_cache(json_path, topic_id=None):
         # 대응하는 HTML 파일 찾기
         if not topic_id:
             topic_id = data.get('topic_id', os.path.basename(json_path).replace('.json', ''))
-        smart_articles_dir = Path("output/smart_articles")
+        if html_times is None:
+            html_times = _list_smart_article_times()
         
         # 가장 가까운 시간의 HTML 파일 찾기
         matching_html = None
-        if smart_articles_dir.exists() and time_str:
+        if html_times and time_str:
             target_time = datetime.fromisoformat(time_str)
             min_diff = float('inf')
             
-            for html_file in smart_articles_dir.glob("article_*.html"):
-                time_match = re.search(r'(\d{8}_\d{6})', html_file.name)
-                if time_match:
-                    file_time = datetime.strptime(time_match.group(1), "%Y%m%d_%H%M%S")
-                    diff = abs((file_time - target_time).total_seconds())
-                    if diff < min_diff and diff < (3600 * 24):  # 24시간 이내
-                        min_diff = diff
-                        matching_html = html_file.name
+            for html_name, file_time in html_times:
+                diff = abs((file_time - target_time).total_seconds())
+                if diff < min_diff and diff < (3600 * 24):  # 24시간 이내
+                    min_diff = diff
+                    matching_html = html_name
         
         # 버전 정보
         version = data.get('version', 1)
@@ -169,6 +191,7 @@ def extract_article_info_from_cache(json_path, topic_id=None):
             'filename': matching_html or f"article_{topic_id}.html",
             'title': title,
             'time': formatted_time,
+            '_sort_ts': sort_ts,
             'summary': summary,
             'source': 'cache',
             'path': f"smart_articles/{matching_html}" if matching_html else None,
@@ -181,253 +204,8 @@ def extract_article_info_from_cache(json_path, topic_id=None):
         print(f"Error processing {json_path}: {e}")
         return None
 
-def generate_unified_index():
-    """통합 index.html 생성 (최신 버전만 표시)"""
-    # GitHub Actions 환경에서는 output 디렉토리가 없을 수 있음
-    # 현재 디렉토리에 articles가 있으면 현재 디렉토리를 사용
-    if Path("articles").exists() or Path("smart_articles").exists():
-        output_dir = Path(".")
-    else:
-        output_dir = Path("output")
-    
-    # topic_index 로드 (여러 위치에서 시도)
-    topic_index = {}
-    possible_paths = [
-        Path("topic_index.json"),  # 배포 디렉토리 루트
-        Path("cache/articles/topic_index.json"),
-        Path("../cache/articles/topic_index.json"),
-        output_dir / "topic_index.json"
-    ]
-    
-    for topic_index_path in possible_paths:
-        if topic_index_path.exists():
-            print(f"Found topic_index.json at: {topic_index_path}")
-            with open(topic_index_path, 'r', encoding='utf-8') as f:
-                topic_index = json.load(f)
-            break
-    else:
-        print("Warning: topic_index.json not found in any location")
-        print("Will scan HTML files directly (may include duplicates)")
-    
-    # 최신 버전만 필터링 (parent_id가 없는 것들 = 최상위 버전)
-    latest_articles = []
-    
-    # 각 주제의 최신 버전 찾기
-    # 버전 체인을 따라가서 각 체인의 최신 버전만 선택
-    processed_chains = set()
-    
-    for article_id, info in topic_index.items():
-        # 이미 처리된 체인의 일부인 경우 스킵
-        if article_id in processed_chains:
-            continue
-            
-        # 이 기사가 속한 체인의 최신 버전 찾기
-        chain_articles = []
-        
-        # 같은 주제의 모든 기사 찾기 (제목 기준)
-        base_title = info['main_title']
-        for aid, ainfo in topic_index.items():
-            if ainfo['main_title'] == base_title or aid == article_id:
-                chain_articles.append((aid, ainfo))
-                processed_chains.add(aid)
-        
-        # 버전 번호로 정렬하여 최신 버전 찾기
-        if chain_articles:
-            chain_articles.sort(key=lambda x: x[1].get('version', 1), reverse=True)
-            latest_id, latest_info = chain_articles[0]
-            
-            # 캐시 파일 확인 (없어도 topic_index 정보로 기사 생성)
-            cache_path = Path(f"cache/articles/{latest_id}.json")
-            if cache_path.exists():
-                article_info = extract_article_info_from_cache(cache_path, latest_id)
-            else:
-                # 캐시가 없으면 topic_index 정보로 기사 정보 생성
-                # 하지만 HTML 파일에서 세 줄 요약을 찾아보기
-                summary = latest_info.get('main_title', '제목 없음') + '...'  # 기본값
-                
-                # HTML 파일에서 세 줄 요약 추출 시도
-                version = latest_info.get('version', 1)
-                html_path = Path("output") / f"smart_articles/versions/article_{latest_id}_v{version}.html"
-                if not html_path.exists():
-                    # 버전 파일이 없으면 일반 파일 경로 시도
-                    if latest_info.get('created_at'):
-                        try:
-                            dt = datetime.fromisoformat(latest_info['created_at'])
-                            file_pattern = dt.strftime("article_%Y%m%d_%H%M")
-                            for search_dir in [Path("output/smart_articles"), Path("smart_articles")]:
-                                if search_dir.exists():
-                                    matching_files = list(search_dir.glob(f"{file_pattern}*.html"))
-                                    if matching_files:
-                                        html_path = matching_files[0]
-                                        break
-                        except:
-                            pass
-                
-                if html_path.exists():
-                    try:
-                        with open(html_path, 'r', encoding='utf-8') as f:
-                            html_content = f.read()
-                            # 세 줄 요약 부분 추출
-                            import re
-                            summary_match = re.search(r'<h3>📝 (?:세 줄 )?요약</h3>\s*(.+?)(?=</div>|<h)', html_content, re.DOTALL)
-                            if summary_match:
-                                summary_text = summary_match.group(1)
-                                # HTML 태그와 번호 제거하고 내용만 추출
-                                lines = re.findall(r'<strong>\d+\.</strong>\s*(.+?)</p>', summary_text)
-                                if lines:
-                                    summary = " / ".join(lines[:3])  # 최대 3줄
-                    except Exception as e:
-                        print(f"Warning: Could not extract summary from HTML for {latest_id}: {e}")
-                
-                # KST 시간으로 변환
-                time_str = '시간 정보 없음'
-                if latest_info.get('last_updated') or latest_info.get('created_at'):
-                    iso_time = latest_info.get('last_updated', latest_info.get('created_at', ''))
-                    try:
-                        dt = parse_iso_to_kst(iso_time)
-                        time_str = format_kst_time(dt)
-                    except:
-                        # Fallback to original format if parsing fails
-                        time_str = datetime.fromisoformat(iso_time).strftime("%Y년 %m월 %d일 %H:%M")
-                
-                article_info = {
-                    'filename': f"article_{latest_id}.html",
-                    'title': latest_info.get('generated_title') or latest_info.get('main_title', '제목 없음'),
-                    'time': time_str,
-                    'summary': summary,
-                    'source': 'topic_index',
-                    'path': None,  # 경로는 나중에 찾기
-                    'topic_id': latest_id,
-                    'version': latest_info.get('version', 1)
-                }
-            
-            # topic_index의 generated_title 또는 main_title로 제목을 덮어쓰기
-            if article_info:
-                if latest_info.get('generated_title'):
-                    article_info['title'] = latest_info['generated_title']
-                elif latest_info.get('main_title'):
-                    article_info['title'] = latest_info['main_title']
-            
-            # HTML 파일 경로 찾기
-            if article_info and not article_info.get('path'):
-                # created_at 날짜로 파일명 추정
-                if latest_info.get('created_at'):
-                    try:
-                        dt = datetime.fromisoformat(latest_info['created_at'])
-                        file_pattern = dt.strftime("article_%Y%m%d_%H%M")
-                        
-                        # 가능한 파일 경로들 검색
-                        for search_dir in [Path("articles"), Path("smart_articles")]:
-                            if search_dir.exists():
-                                matching_files = list(search_dir.glob(f"{file_pattern}*.html"))
-                                if matching_files:
-                                    article_info['path'] = f"{search_dir.name}/{matching_files[0].name}"
-                                    break
-                    except:
-                        pass
-            
-            # 경로를 찾지 못해도 topic_index에 있으면 포함
-            if article_info:
-                # 경로가 없으면 기본 경로 생성
-                if not article_info.get('path'):
-                    # topic_id나 날짜 기반으로 기본 경로 설정
-                    if latest_info.get('created_at'):
-                        try:
-                            dt = datetime.fromisoformat(latest_info['created_at'])
-                            filename = dt.strftime("article_%Y%m%d_%H%M%S.html")
-                            article_info['path'] = f"smart_articles/{filename}"
-                        except:
-                            article_info['path'] = f"smart_articles/article_{latest_id}.html"
-                    else:
-                        article_info['path'] = f"smart_articles/article_{latest_id}.html"
-                
-                article_info['version_info'] = f"v{latest_info.get('version', 1)}"
-                article_info['tags'] = latest_info.get('tags', {'category_tags': [], 'content_tags': []})
-                latest_articles.append(article_info)
-    
-    # topic_index에 기사가 없으면 기존 방식으로 HTML 파일 직접 스캔
-    if not latest_articles:
-        print("No articles found in topic_index, scanning HTML files directly...")
-        print("WARNING: This may include duplicate articles!")
-        
-        # 중복 체크를 위한 제목 세트
-        seen_titles = set()
-        all_scanned_articles = []
-        
-        # 여러 위치에서 기사 파일 검색
-        search_locations = [
-            (Path("articles"), "articles"),  # 배포 디렉토리 우선
-            (output_dir / "articles", "articles"),
-            (output_dir / "smart_articles", "smart_articles"),
-            (Path("smart_articles"), "smart_articles"),
-        ]
-        
-        for search_dir, path_prefix in search_locations:
-            if search_dir.exists():
-                print(f"Scanning {search_dir}...")
-                article_files = list(search_dir.glob("article_*.html"))
-                print(f"Found {len(article_files)} files in {search_dir}")
-                
-                for article_file in article_files:
-                    if article_file.stem.endswith('_backup'):
-                        continue
-                        
-                    article_info = extract_article_info_from_html(article_file)
-                    if article_info:
-                        # 경로 조정
-                        article_info['path'] = f"{path_prefix}/{article_file.name}"
-                        article_info['tags'] = {'category_tags': [], 'content_tags': []}
-                        all_scanned_articles.append(article_info)
-        
-        # 시간순 정렬 후 제목 기반 중복 제거
-        all_scanned_articles.sort(key=lambda x: x['time'], reverse=True)
-        
-        for article in all_scanned_articles:
-            title = article['title']
-            if title not in seen_titles:
-                seen_titles.add(title)
-                latest_articles.append(article)
-        
-        print(f"After deduplication: {len(latest_articles)} unique articles")
-    
-    # 시간순 정렬 (최신순)
-    latest_articles.sort(key=lambda x: x['time'], reverse=True)
-    
-    # 모든 태그 수집
-    # 미리 정의된 카테고리 태그 (순서 유지)
-    predefined_categories = ['정치', '경제', '사회', '생활/문화', 'IT/과학', '국제']
-    used_category_tags = set()  # 실제 사용된 카테고리만 수집
-    all_content_tags = set()
-    
-    # 최신 10개 기사의 대표 태그 수집
-    recent_tags = []
-    tag_count = {}
-    
-    for i, article in enumerate(latest_articles):
-        tags = article.get('tags', {'category_tags': [], 'content_tags': []})
-        used_category_tags.update(tags.get('category_tags', []))  # 실제 사용된 카테고리만
-        content_tags = tags.get('content_tags', [])
-        all_content_tags.update(content_tags)
-        
-        # 태그 빈도 계산
-        for tag in content_tags:
-            tag_count[tag] = tag_count.get(tag, 0) + 1
-        
-        # 최신 10개 기사의 첫 번째 태그 저장
-        if i < 10 and content_tags:
-            recent_tags.append(content_tags[0])
-    
-    # 태그 정렬 - 실제 사용된 카테고리만, 미리 정의된 순서대로
-    sorted_category_tags = [cat for cat in predefined_categories if cat in used_category_tags]
-    
-    # 주요 키워드 정렬: 최신 기사 대표 태그 + 나머지 랜덤
-    import random
-    remaining_tags = list(all_content_tags - set(recent_tags))
-    random.shuffle(remaining_tags)
-    sorted_content_tags = recent_tags + remaining_tags
-    
-    # HTML 생성
-    html_content = f"""<!DOCTYPE html>
+# index.html의 정적 부분 (CSS/JS) - 호출마다 f-string으로 다시 만들지 않도록 모듈 상수로 분리
+_INDEX_HEAD = """<!DOCTYPE html>
 <html lang="ko">
 <head>
     <meta charset="UTF-8">
@@ -436,30 +214,30 @@ def generate_unified_index():
     <link rel="icon" type="image/svg+xml" href="static/favicon.svg">
     <link rel="alternate icon" href="static/favicon.svg">
     <style>
-        :root {{
+        :root {
             --primary-color: #1a73e8;
             --text-color: #202124;
             --bg-color: #f8f9fa;
             --card-bg: #ffffff;
             --border-color: #dadce0;
-        }}
-        * {{
+        }
+        * {
             margin: 0;
             padding: 0;
             box-sizing: border-box;
-        }}
-        body {{
+        }
+        body {
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, 'Noto Sans KR', sans-serif;
             color: var(--text-color);
             background-color: var(--bg-color);
             line-height: 1.6;
-        }}
-        .container {{
+        }
+        .container {
             max-width: 1200px;
             margin: 0 auto;
             padding: 0 20px;
-        }}
-        header {{
+        }
+        header {
             background-color: var(--card-bg);
             border-bottom: 1px solid var(--border-color);
             padding: 15px 0;
@@ -468,32 +246,32 @@ def generate_unified_index():
             position: sticky;
             top: 0;
             z-index: 1000;
-        }}
-        h1 {{
+        }
+        h1 {
             font-size: 2.2rem;
             color: var(--primary-color);
             margin: 0;
-        }}
-        h1 a {{
+        }
+        h1 a {
             color: inherit;
             text-decoration: none;
             transition: opacity 0.2s ease;
-        }}
-        h1 a:hover {{
+        }
+        h1 a:hover {
             opacity: 0.8;
-        }}
-        .header-content {{
+        }
+        .header-content {
             display: flex;
             flex-direction: row;
             align-items: baseline;
             gap: 20px;
-        }}
-        .tagline {{
+        }
+        .tagline {
             color: #5f6368;
             font-size: 1.1rem;
             margin: 0;
-        }}
-        .update-info {{
+        }
+        .update-info {
             background: #e8f0fe;
             padding: 20px;
             border-radius: 8px;
@@ -501,42 +279,42 @@ def generate_unified_index():
             display: flex;
             align-items: center;
             gap: 15px;
-        }}
-        .update-info .badge {{
+        }
+        .update-info .badge {
             background: var(--primary-color);
             color: white;
             padding: 5px 12px;
             border-radius: 20px;
             font-size: 0.9rem;
             font-weight: 500;
-        }}
-        .articles-count {{
+        }
+        .articles-count {
             background: #28a745;
             color: white;
             padding: 5px 12px;
             border-radius: 20px;
             font-size: 0.9rem;
             font-weight: 500;
-        }}
-        .tag-filter-section {{
+        }
+        .tag-filter-section {
             background: white;
             padding: 20px;
             border-radius: 8px;
             margin-bottom: 30px;
             box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        }}
-        .tag-filter-header {{
+        }
+        .tag-filter-header {
             display: flex;
             align-items: center;
             justify-content: space-between;
             margin-bottom: 15px;
-        }}
-        .tag-filter-title {{
+        }
+        .tag-filter-title {
             font-size: 1.1rem;
             font-weight: 600;
             color: var(--text-color);
-        }}
-        .tag-reset-btn {{
+        }
+        .tag-reset-btn {
             display: none;
             padding: 6px 16px;
             background: #dc3545;
@@ -546,31 +324,31 @@ def generate_unified_index():
             cursor: pointer;
             font-size: 0.9rem;
             transition: all 0.3s ease;
-        }}
-        .tag-reset-btn.active {{
+        }
+        .tag-reset-btn.active {
             display: block;
-        }}
-        .tag-reset-btn:hover {{
+        }
+        .tag-reset-btn:hover {
             background: #c82333;
-        }}
-        .tag-groups {{
+        }
+        .tag-groups {
             display: flex;
             flex-direction: column;
             gap: 15px;
-        }}
-        .tag-group {{
+        }
+        .tag-group {
             display: flex;
             flex-wrap: wrap;
             gap: 8px;
             align-items: center;
-        }}
-        .tag-group-label {{
+        }
+        .tag-group-label {
             font-size: 0.9rem;
             color: #666;
             margin-right: 10px;
             min-width: 80px;
-        }}
-        .tag-btn {{
+        }
+        .tag-btn {
             padding: 5px 12px;
             background: #f0f0f0;
             border: 1px solid #ddd;
@@ -579,28 +357,28 @@ def generate_unified_index():
             font-size: 0.85rem;
             transition: all 0.2s ease;
             user-select: none;
-        }}
-        .tag-btn:hover {{
+        }
+        .tag-btn:hover {
             background: #e0e0e0;
             border-color: #bbb;
-        }}
-        .tag-btn.active {{
+        }
+        .tag-btn.active {
             background: var(--primary-color);
             color: white;
             border-color: var(--primary-color);
-        }}
-        .no-results {{
+        }
+        .no-results {
             text-align: center;
             padding: 60px 20px;
             color: #666;
-        }}
-        .articles-grid {{
+        }
+        .articles-grid {
             display: grid;
             grid-template-columns: repeat(auto-fill, minmax(350px, 1fr));
             gap: 25px;
             margin-bottom: 50px;
-        }}
-        .article-card {{
+        }
+        .article-card {
             background: var(--card-bg);
             border-radius: 12px;
             padding: 0;
@@ -614,37 +392,37 @@ def generate_unified_index():
             flex-direction: column;
             position: relative;
             overflow: hidden;
-        }}
-        .article-top {{
+        }
+        .article-top {
             display: flex;
             gap: 20px;
             padding: 20px 20px 15px 20px;
-        }}
-        .article-thumbnail {{
+        }
+        .article-thumbnail {
             flex-shrink: 0;
             width: 100px;
             height: 100px;
             border-radius: 8px;
             overflow: hidden;
             background: #f5f5f5;
-        }}
-        .article-thumbnail img {{
+        }
+        .article-thumbnail img {
             width: 100%;
             height: 100%;
             object-fit: cover;
-        }}
-        .article-title-section {{
+        }
+        .article-title-section {
             flex: 1;
             min-width: 0;
-        }}
-        .article-bottom {{
+        }
+        .article-bottom {
             padding: 0 20px 20px 20px;
-        }}
-        .article-card:hover {{
+        }
+        .article-card:hover {
             transform: translateY(-3px);
             box-shadow: 0 4px 16px rgba(0,0,0,0.12);
-        }}
-        .article-card h2 {{
+        }
+        .article-card h2 {
             font-size: 1.2rem;
             margin: 0;
             line-height: 1.4;
@@ -653,8 +431,8 @@ def generate_unified_index():
             display: -webkit-box;
             -webkit-line-clamp: 3;
             -webkit-box-orient: vertical;
-        }}
-        .article-meta {{
+        }
+        .article-meta {
             display: flex;
             justify-content: space-between;
             margin-bottom: 12px;
@@ -662,13 +440,13 @@ def generate_unified_index():
             color: #5f6368;
             padding-top: 12px;
             border-top: 1px solid var(--border-color);
-        }}
-        .article-summary {{
+        }
+        .article-summary {
             color: #5f6368;
             line-height: 1.6;
             font-size: 0.9rem;
-        }}
-        .version-badge {{
+        }
+        .version-badge {
             position: absolute;
             top: 10px;
             right: 10px;
@@ -678,46 +456,46 @@ def generate_unified_index():
             border-radius: 12px;
             font-size: 0.8rem;
             font-weight: 500;
-        }}
-        .no-articles {{
+        }
+        .no-articles {
             text-align: center;
             padding: 60px 20px;
             color: #5f6368;
-        }}
-        .no-articles h2 {{
+        }
+        .no-articles h2 {
             color: var(--text-color);
             margin-bottom: 10px;
-        }}
-        footer {{
+        }
+        footer {
             background: var(--card-bg);
             border-top: 1px solid var(--border-color);
             padding: 30px 0;
             margin-top: 60px;
             text-align: center;
             color: #5f6368;
-        }}
-        footer a {{
+        }
+        footer a {
             color: var(--primary-color);
             text-decoration: none;
-        }}
-        footer a:hover {{
+        }
+        footer a:hover {
             text-decoration: underline;
-        }}
-        .admin-link {{
+        }
+        .admin-link {
             margin-top: 20px;
-        }}
-        .admin-link a {{
+        }
+        .admin-link a {
             background: var(--primary-color);
             color: white;
             padding: 10px 20px;
             border-radius: 5px;
             text-decoration: none;
             display: inline-block;
-        }}
-        .admin-link a:hover {{
+        }
+        .admin-link a:hover {
             background: #1557b0;
-        }}
-        .about-btn {{
+        }
+        .about-btn {
             background: var(--primary-color);
             color: white;
             padding: 8px 16px;
@@ -727,60 +505,60 @@ def generate_unified_index():
             font-weight: 500;
             transition: background 0.3s;
             white-space: nowrap;
-        }}
-        .about-btn:hover {{
+        }
+        .about-btn:hover {
             background: #1557b0;
-        }}
-        .header-content {{
+        }
+        .header-content {
             display: flex;
             align-items: center;
             justify-content: space-between;
             width: 100%;
-        }}
-        .header-left {{
+        }
+        .header-left {
             display: flex;
             align-items: center;
             gap: 20px;
-        }}
-        .tagline {{
+        }
+        .tagline {
             margin: 0;
             line-height: 1.3;
-        }}
-        .tagline div:first-child {{
+        }
+        .tagline div:first-child {
             color: #5f6368;
             font-size: 1.1rem;
-        }}
-        .tagline div:last-child {{
+        }
+        .tagline div:last-child {
             color: #5f6368;
             font-size: 0.95rem;
             margin-top: 2px;
-        }}
+        }
         /* 키워드 섹션 스타일 */
-        .keywords-section {{
+        .keywords-section {
             cursor: pointer;
             position: relative;
-        }}
-        .keywords-container {{
+        }
+        .keywords-container {
             position: relative;
-        }}
-        .keywords-collapsed {{
+        }
+        .keywords-collapsed {
             display: flex;
             flex-wrap: wrap;
             gap: 8px;
             align-items: center;
             max-height: 40px;
             overflow: hidden;
-        }}
-        .expand-indicator {{
+        }
+        .expand-indicator {
             color: var(--primary-color);
             font-weight: 500;
             margin-left: 8px;
             white-space: nowrap;
-        }}
-        .keywords-expanded {{
+        }
+        .keywords-expanded {
             margin-top: 15px;
-        }}
-        .keyword-search {{
+        }
+        .keyword-search {
             width: 100%;
             max-width: 300px;
             padding: 8px 12px;
@@ -789,37 +567,37 @@ def generate_unified_index():
             margin-bottom: 15px;
             font-size: 0.9rem;
             outline: none;
-        }}
-        .keyword-search:focus {{
+        }
+        .keyword-search:focus {
             border-color: var(--primary-color);
-        }}
-        .selected-keywords {{
+        }
+        .selected-keywords {
             margin-bottom: 15px;
             padding-bottom: 15px;
             border-bottom: 1px solid var(--border-color);
             min-height: 20px;
-        }}
-        .selected-keywords:empty {{
+        }
+        .selected-keywords:empty {
             display: none;
-        }}
-        .selected-keywords .tag-btn {{
+        }
+        .selected-keywords .tag-btn {
             background: var(--primary-color);
             color: white;
-        }}
-        .all-keywords {{
+        }
+        .all-keywords {
             display: flex;
             flex-wrap: wrap;
             gap: 8px;
             max-height: 120px;
             overflow-y: auto;
             padding-right: 10px;
-        }}
-        .all-keywords .tag-btn.hidden {{
+        }
+        .all-keywords .tag-btn.hidden {
             display: none;
-        }}
+        }
         
         /* 하단 네비게이션 바 */
-        .bottom-nav {{
+        .bottom-nav {
             position: fixed;
             bottom: 0;
             left: 0;
@@ -831,8 +609,8 @@ def generate_unified_index():
             box-shadow: 0 -2px 4px rgba(0,0,0,0.1);
             z-index: 999;
             border-top: 1px solid var(--border-color);
-        }}
-        .bottom-nav-item {{
+        }
+        .bottom-nav-item {
             display: flex;
             flex-direction: column;
             align-items: center;
@@ -844,23 +622,23 @@ def generate_unified_index():
             background: none;
             border: none;
             font-family: inherit;
-        }}
-        .bottom-nav-item:hover {{
+        }
+        .bottom-nav-item:hover {
             color: var(--primary-color);
-        }}
-        .bottom-nav-item.active {{
+        }
+        .bottom-nav-item.active {
             color: var(--primary-color);
-        }}
-        .bottom-nav-item .icon {{
+        }
+        .bottom-nav-item .icon {
             font-size: 1.5rem;
             margin-bottom: 3px;
-        }}
-        .bottom-nav-item .label {{
+        }
+        .bottom-nav-item .label {
             font-size: 0.75rem;
-        }}
+        }
         
         /* 태그 드로어 */
-        .tag-drawer {{
+        .tag-drawer {
             position: fixed;
             top: 0;
             right: -300px;
@@ -873,11 +651,11 @@ def generate_unified_index():
             overflow-y: auto;
             z-index: 1001;
             padding: 20px;
-        }}
-        .tag-drawer.open {{
+        }
+        .tag-drawer.open {
             right: 0;
-        }}
-        .drawer-overlay {{
+        }
+        .drawer-overlay {
             position: fixed;
             top: 0;
             left: 0;
@@ -886,121 +664,121 @@ def generate_unified_index():
             background: rgba(0,0,0,0.5);
             display: none;
             z-index: 1000;
-        }}
-        .drawer-overlay.active {{
+        }
+        .drawer-overlay.active {
             display: block;
-        }}
-        .drawer-header {{
+        }
+        .drawer-header {
             display: flex;
             justify-content: space-between;
             align-items: center;
             margin-bottom: 20px;
             padding-bottom: 15px;
             border-bottom: 1px solid var(--border-color);
-        }}
-        .drawer-title {{
+        }
+        .drawer-title {
             font-size: 1.2rem;
             font-weight: 600;
-        }}
-        .drawer-close {{
+        }
+        .drawer-close {
             background: none;
             border: none;
             font-size: 1.5rem;
             cursor: pointer;
             color: #666;
-        }}
+        }
         
         /* 모바일 최적화 */
-        @media (max-width: 768px) {{
-            header {{
+        @media (max-width: 768px) {
+            header {
                 padding: 10px 0;
                 margin-bottom: 15px;
-            }}
-            .header-content {{
+            }
+            .header-content {
                 flex-direction: row;
                 gap: 10px;
                 align-items: center; /* 수직 가운데 정렬 */
-            }}
-            h1 {{
+            }
+            h1 {
                 font-size: 1.3rem;
                 margin-bottom: 0;
-            }}
-            .header-left {{
+            }
+            .header-left {
                 gap: 10px;
-            }}
-            .tagline {{
+            }
+            .tagline {
                 margin: 0;
-            }}
-            .tagline div:first-child {{
+            }
+            .tagline div:first-child {
                 font-size: 0.7rem;
-            }}
-            .tagline div:last-child {{
+            }
+            .tagline div:last-child {
                 font-size: 0.65rem;
                 margin-top: 1px;
-            }}
-            .about-btn {{
+            }
+            .about-btn {
                 padding: 6px 12px;
                 font-size: 0.75rem;
-            }}
-            .update-info {{
+            }
+            .update-info {
                 padding: 10px;
                 margin-bottom: 15px;
                 flex-wrap: wrap;
                 font-size: 0.85rem;
-            }}
-            .update-info .badge {{
+            }
+            .update-info .badge {
                 padding: 4px 10px;
                 font-size: 0.8rem;
-            }}
-            .articles-grid {{
+            }
+            .articles-grid {
                 grid-template-columns: 1fr;
                 padding-bottom: 80px; /* 하단 네비게이션 공간 */
-            }}
-            .tag-groups {{
+            }
+            .tag-groups {
                 gap: 10px;
-            }}
-            .tag-chip {{
+            }
+            .tag-chip {
                 font-size: 0.85rem;
                 padding: 6px 10px;
-            }}
-            .bottom-nav {{
+            }
+            .bottom-nav {
                 display: flex;
-            }}
-            .tag-filter-section {{
+            }
+            .tag-filter-section {
                 display: none; /* 모바일에서는 태그 필터 숨김 */
-            }}
+            }
             /* 모바일 태그 드로어 내부 스타일 */
-            .tag-drawer .all-keywords {{
+            .tag-drawer .all-keywords {
                 max-height: calc(100vh - 200px); /* 화면 높이에서 헤더와 여백을 뺀 높이 */
                 overflow-y: auto;
                 -webkit-overflow-scrolling: touch;
-            }}
-            .tag-drawer .keywords-expanded {{
+            }
+            .tag-drawer .keywords-expanded {
                 display: block !important; /* 모바일에서는 항상 확장 상태 */
-            }}
-            .tag-drawer .keywords-collapsed {{
+            }
+            .tag-drawer .keywords-collapsed {
                 display: none !important; /* 모바일에서는 축소 상태 숨김 */
-            }}
-            .tag-drawer .keyword-search {{
+            }
+            .tag-drawer .keyword-search {
                 margin-bottom: 15px;
-            }}
+            }
             /* 모바일에서 썸네일 크기 조정 */
-            .article-thumbnail {{
+            .article-thumbnail {
                 width: 80px;
                 height: 80px;
-            }}
-            .article-top {{
+            }
+            .article-top {
                 padding: 15px 15px 10px 15px;
                 gap: 15px;
-            }}
-            .article-bottom {{
+            }
+            .article-bottom {
                 padding: 0 15px 15px 15px;
-            }}
-            .article-card h2 {{
+            }
+            .article-card h2 {
                 font-size: 1.1rem;
                 -webkit-line-clamp: 2;
-            }}
-        }}
+            }
+        }
     </style>
 </head>
 <body>
@@ -1022,199 +800,96 @@ def generate_unified_index():
     <main class="container">
         <div class="update-info">
             <span class="badge">LIVE</span>
-            <span>최신 AI 생성 뉴스 - {datetime.now().strftime('%Y년 %m월 %d일 %H:%M')} 업데이트</span>
-            <span class="articles-count">총 {len(latest_articles)}개 기사</span>
-        </div>
-        
-        <div class="tag-filter-section">
-            <div class="tag-filter-header">
-                <h3 class="tag-filter-title">🏷️ 태그로 필터링</h3>
-                <button class="tag-reset-btn" onclick="resetAllTags()">모든 태그 해제</button>
-            </div>
-            <div class="tag-groups">
 """
 
-    # 카테고리 태그 추가
-    if sorted_category_tags:
-        html_content += '                <div class="tag-group">\n'
-        html_content += '                    <span class="tag-group-label">카테고리:</span>\n'
-        for tag in sorted_category_tags:
-            html_content += f'                    <button class="tag-btn category-tag" data-tag="{tag}" onclick="toggleTag(this, event)">{tag}</button>\n'
-        html_content += '                </div>\n'
-    
-    # 콘텐츠 태그 추가
-    if sorted_content_tags:
-        html_content += '                <div class="tag-group keywords-section" onclick="toggleKeywordsExpansion(event)">\n'
-        html_content += '                    <span class="tag-group-label">주요 키워드:</span>\n'
-        html_content += '                    <div class="keywords-container">\n'
-        html_content += '                        <div class="keywords-collapsed">\n'
-        # 첫 줄에 표시할 태그들 (약 10개 정도)
-        for i, tag in enumerate(sorted_content_tags[:10]):
-            html_content += f'                            <button class="tag-btn content-tag" data-tag="{tag}" onclick="toggleTag(this, event)">{tag}</button>\n'
-        html_content += '                            <span class="expand-indicator">... 더보기</span>\n'
-        html_content += '                        </div>\n'
-        html_content += '                        <div class="keywords-expanded" style="display: none;">\n'
-        html_content += '                            <input type="text" class="keyword-search" placeholder="키워드 검색..." oninput="searchKeywords(this)">\n'
-        html_content += '                            <div class="selected-keywords"></div>\n'
-        html_content += '                            <div class="all-keywords">\n'
-        for tag in sorted_content_tags:
-            html_content += f'                                <button class="tag-btn content-tag" data-tag="{tag}" onclick="toggleTag(this, event)">{tag}</button>\n'
-        html_content += '                            </div>\n'
-        html_content += '                        </div>\n'
-        html_content += '                    </div>\n'
-        html_content += '                </div>\n'
-    
-    html_content += '            </div>\n'
-    html_content += '        </div>\n'
-    
-    html_content += '''        <div class="no-results" style="display: none;"></div>
-'''
-    
-    if latest_articles:
-        html_content += '        <div class="articles-grid">\n'
-        for article in latest_articles:
-            if article.get('path'):
-                version_badge = f'<span class="version-badge">v{article.get("version", 1)}</span>' if article.get('version', 1) > 1 else ''
-                tags = article.get('tags', {'category_tags': [], 'content_tags': []})
-                all_tags = tags.get('category_tags', []) + tags.get('content_tags', [])
-                # 태그를 파이프(|) 문자로 구분하여 저장
-                tags_data = '|'.join(all_tags)
-                
-                # 썸네일 이미지 처리
-                thumbnail_html = ''
-                if article.get('image_path'):
-                    # 이미지 경로 처리
-                    image_url = article['image_path']
-                    if not image_url.startswith('/'):
-                        image_url = '/' + image_url
-                    thumbnail_html = f'''
-                    <div class="article-thumbnail">
-                        <img src="{image_url}" alt="{article['title']}" loading="lazy" onerror="this.style.display='none'; this.parentElement.style.display='none';">
-                    </div>'''
-                
-                html_content += f'''            <a href="{article['path']}" class="article-card" data-tags="{tags_data}" onclick="this.href = '{article['path']}#' + Array.from(selectedTags).join(',')">
-                <div class="article-top">
-                    {thumbnail_html}
-                    <div class="article-title-section">
-                        <h2>{article['title']}</h2>
-                    </div>
-                </div>
-                <div class="article-bottom">
-                    <div class="article-meta">
-                        <span>📅 {article['time']}</span>
-                        <span>🤖 AI 생성</span>
-                    </div>
-                    <p class="article-summary">{article['summary']}</p>
-                </div>
-                {version_badge}
-            </a>
-'''
-        html_content += '        </div>\n'
-    else:
-        html_content += '''        <div class="no-articles">
-            <h2>아직 생성된 뉴스가 없습니다</h2>
-            <p>KONA 시스템이 새로운 뉴스를 생성 중입니다.</p>
-        </div>
-'''
-
-    html_content += f'''    </main>
-    
-    <footer>
-        <div class="container">
-            <p>© 2025 KONA Project</p>
-            <p style="margin-top: 10px; font-size: 0.85rem;">
-                생성 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S KST')}
-            </p>
-        </div>
-    </footer>
-    
+_INDEX_SCRIPTS = """    
     <script>
         let selectedTags = new Set();
         
-        function toggleTag(button, event) {{
-            if (event) {{
+        function toggleTag(button, event) {
+            if (event) {
                 event.stopPropagation();
-            }}
+            }
             
             const tag = button.getAttribute('data-tag');
             
-            if (button.classList.contains('active')) {{
+            if (button.classList.contains('active')) {
                 button.classList.remove('active');
                 selectedTags.delete(tag);
-            }} else {{
+            } else {
                 button.classList.add('active');
                 selectedTags.add(tag);
-            }}
+            }
             
             // 선택된 태그 업데이트
             updateSelectedKeywords();
             
             // 태그 해제 버튼 표시/숨김
             const resetBtn = document.querySelector('.tag-reset-btn');
-            if (selectedTags.size > 0) {{
+            if (selectedTags.size > 0) {
                 resetBtn.classList.add('active');
-            }} else {{
+            } else {
                 resetBtn.classList.remove('active');
-            }}
+            }
             
             filterArticles();
-        }}
+        }
         
-        function toggleKeywordsExpansion(event) {{
+        function toggleKeywordsExpansion(event) {
             // 태그 버튼 클릭은 무시
-            if (event.target.classList.contains('tag-btn')) {{
+            if (event.target.classList.contains('tag-btn')) {
                 return;
-            }}
+            }
             
             const section = event.currentTarget;
             const collapsed = section.querySelector('.keywords-collapsed');
             const expanded = section.querySelector('.keywords-expanded');
             
-            if (collapsed.style.display === 'none') {{
+            if (collapsed.style.display === 'none') {
                 collapsed.style.display = 'flex';
                 expanded.style.display = 'none';
-            }} else {{
+            } else {
                 collapsed.style.display = 'none';
                 expanded.style.display = 'block';
                 // 검색창에 포커스
                 expanded.querySelector('.keyword-search').focus();
-            }}
-        }}
+            }
+        }
         
-        function searchKeywords(input) {{
+        function searchKeywords(input) {
             const searchText = input.value.toLowerCase();
             const allKeywords = document.querySelectorAll('.all-keywords .tag-btn');
             
-            allKeywords.forEach(btn => {{
+            allKeywords.forEach(btn => {
                 const tagText = btn.textContent.toLowerCase();
-                if (tagText.includes(searchText)) {{
+                if (tagText.includes(searchText)) {
                     btn.classList.remove('hidden');
-                }} else {{
+                } else {
                     btn.classList.add('hidden');
-                }}
-            }});
-        }}
+                }
+            });
+        }
         
-        function updateSelectedKeywords() {{
+        function updateSelectedKeywords() {
             const selectedContainer = document.querySelector('.selected-keywords');
             const allButtons = document.querySelectorAll('.tag-btn.content-tag');
             
             // 선택된 태그들을 상단에 표시
             selectedContainer.innerHTML = '';
-            allButtons.forEach(btn => {{
-                if (btn.classList.contains('active')) {{
+            allButtons.forEach(btn => {
+                if (btn.classList.contains('active')) {
                     const clone = btn.cloneNode(true);
                     clone.onclick = (e) => toggleTag(btn, e);
                     selectedContainer.appendChild(clone);
-                }}
-            }});
-        }}
+                }
+            });
+        }
         
-        function resetAllTags() {{
+        function resetAllTags() {
             // 모든 태그 버튼의 active 클래스 제거
-            document.querySelectorAll('.tag-btn').forEach(btn => {{
+            document.querySelectorAll('.tag-btn').forEach(btn => {
                 btn.classList.remove('active');
-            }});
+            });
             
             // 선택된 태그 초기화
             selectedTags.clear();
@@ -1224,52 +899,52 @@ def generate_unified_index():
             
             // 모든 기사 표시
             filterArticles();
-        }}
+        }
         
-        function filterArticles() {{
+        function filterArticles() {
             const articles = document.querySelectorAll('.article-card');
             let visibleCount = 0;
             
-            articles.forEach(article => {{
-                if (selectedTags.size === 0) {{
+            articles.forEach(article => {
+                if (selectedTags.size === 0) {
                     // 태그가 선택되지 않은 경우 모든 기사 표시
                     article.style.display = 'block';
                     visibleCount++;
-                }} else {{
+                } else {
                     // 기사의 태그 가져오기 (파이프로 구분)
                     const articleTags = article.getAttribute('data-tags').split('|').filter(tag => tag);
                     
                     // OR 조건: 선택된 태그 중 하나라도 있으면 표시
                     const hasSelectedTag = Array.from(selectedTags).some(tag => articleTags.includes(tag));
                     
-                    if (hasSelectedTag) {{
+                    if (hasSelectedTag) {
                         article.style.display = 'block';
                         visibleCount++;
-                    }} else {{
+                    } else {
                         article.style.display = 'none';
-                    }}
-                }}
-            }});
+                    }
+                }
+            });
             
             // 결과가 없을 때 메시지 표시
             const articlesGrid = document.querySelector('.articles-grid');
             const existingNoResults = document.querySelector('.no-results');
             
-            if (visibleCount === 0 && selectedTags.size > 0) {{
-                if (!existingNoResults) {{
+            if (visibleCount === 0 && selectedTags.size > 0) {
+                if (!existingNoResults) {
                     const noResultsDiv = document.createElement('div');
                     noResultsDiv.className = 'no-results';
                     noResultsDiv.innerHTML = '<h3>선택한 태그와 일치하는 기사가 없습니다.</h3>';
                     articlesGrid.parentNode.insertBefore(noResultsDiv, articlesGrid.nextSibling);
-                }}
+                }
                 articlesGrid.style.display = 'none';
-            }} else {{
-                if (existingNoResults) {{
+            } else {
+                if (existingNoResults) {
                     existingNoResults.remove();
-                }}
+                }
                 articlesGrid.style.display = 'grid';
-            }}
-        }}
+            }
+        }
     </script>
     
     <!-- 하단 네비게이션 바 -->
@@ -1298,57 +973,444 @@ def generate_unified_index():
     
     <script>
         // 태그 드로어 토글
-        function toggleTagDrawer() {{
+        function toggleTagDrawer() {
             const drawer = document.querySelector('.tag-drawer');
             const overlay = document.querySelector('.drawer-overlay');
             const isOpen = drawer.classList.contains('open');
             
-            if (!isOpen) {{
+            if (!isOpen) {
                 // 태그 필터 내용 복사
                 const tagFilterSection = document.querySelector('.tag-filter-section');
                 const drawerContent = document.querySelector('.drawer-content');
-                if (tagFilterSection && drawerContent) {{
+                if (tagFilterSection && drawerContent) {
                     drawerContent.innerHTML = tagFilterSection.innerHTML;
                     // 이벤트 리스너 다시 연결
                     initializeDrawerTags();
-                }}
-            }}
+                }
+            }
             
             drawer.classList.toggle('open');
             overlay.classList.toggle('active');
-        }}
+        }
         
         // 드로어 내 태그 초기화
-        function initializeDrawerTags() {{
+        function initializeDrawerTags() {
             const drawerContent = document.querySelector('.drawer-content');
             if (!drawerContent) return;
             
             // 태그 버튼 이벤트 리스너
-            drawerContent.querySelectorAll('.tag-btn').forEach(btn => {{
-                btn.addEventListener('click', function() {{
+            drawerContent.querySelectorAll('.tag-btn').forEach(btn => {
+                btn.addEventListener('click', function() {
                     const tag = this.dataset.tag;
                     filterByTag(tag);
                     toggleTagDrawer(); // 선택 후 드로어 닫기
-                }});
-            }});
+                });
+            });
             
             // 초기화 버튼
             const resetBtn = drawerContent.querySelector('.tag-reset-btn');
-            if (resetBtn) {{
-                resetBtn.addEventListener('click', function() {{
+            if (resetBtn) {
+                resetBtn.addEventListener('click', function() {
                     resetTagFilter();
                     toggleTagDrawer(); // 초기화 후 드로어 닫기
-                }});
-            }}
-        }}
+                });
+            }
+        }
     </script>
 </body>
-</html>'''
+</html>"""
+
+def generate_unified_index():
+    """통합 index.html 생성 (최신 버전만 표시)"""
+    # GitHub Actions 환경에서는 output 디렉토리가 없을 수 있음
+    # 현재 디렉토리에 articles가 있으면 현재 디렉토리를 사용
+    if Path("articles").exists() or Path("smart_articles").exists():
+        output_dir = Path(".")
+    else:
+        output_dir = Path("output")
+    
+    # topic_index 로드 (여러 위치에서 시도)
+    topic_index = {}
+    possible_paths = [
+        Path("topic_index.json"),  # 배포 디렉토리 루트
+        Path("cache/articles/topic_index.json"),
+        Path("../cache/articles/topic_index.json"),
+        output_dir / "topic_index.json"
+    ]
+    
+    for topic_index_path in possible_paths:
+        if topic_index_path.exists():
+            print(f"Found topic_index.json at: {topic_index_path}")
+            with open(topic_index_path, 'r', encoding='utf-8') as f:
+                topic_index = json.load(f)
+            break
+    else:
+        print("Warning: topic_index.json not found in any location")
+        print("Will scan HTML files directly (may include duplicates)")
+    
+    # 최신 버전만 필터링 (parent_id가 없는 것들 = 최상위 버전)
+    latest_articles = []
+    
+    # 각 주제의 최신 버전 찾기
+    # 버전 체인을 따라가서 각 체인의 최신 버전만 선택
+    processed_chains = set()
+    # smart_articles HTML 파일 시각 목록 (캐시 기사가 처음 나올 때 한 번만 스캔)
+    smart_html_times = None
+    
+    for article_id, info in topic_index.items():
+        # 이미 처리된 체인의 일부인 경우 스킵
+        if article_id in processed_chains:
+            continue
+            
+        # 이 기사가 속한 체인의 최신 버전 찾기
+        chain_articles = []
+        
+        # 같은 주제의 모든 기사 찾기 (제목 기준)
+        base_title = info['main_title']
+        for aid, ainfo in topic_index.items():
+            if ainfo['main_title'] == base_title or aid == article_id:
+                chain_articles.append((aid, ainfo))
+                processed_chains.add(aid)
+        
+        # 버전 번호로 정렬하여 최신 버전 찾기
+        if chain_articles:
+            chain_articles.sort(key=lambda x: x[1].get('version', 1), reverse=True)
+            latest_id, latest_info = chain_articles[0]
+            
+            # 캐시 파일 확인 (없어도 topic_index 정보로 기사 생성)
+            cache_path = Path(f"cache/articles/{latest_id}.json")
+            if cache_path.exists():
+                if smart_html_times is None:
+                    smart_html_times = _list_smart_article_times()
+                article_info = extract_article_info_from_cache(cache_path, latest_id, smart_html_times)
+            else:
+                # 캐시가 없으면 topic_index 정보로 기사 정보 생성
+                # 하지만 HTML 파일에서 세 줄 요약을 찾아보기
+                summary = latest_info.get('main_title', '제목 없음') + '...'  # 기본값
+                
+                # HTML 파일에서 세 줄 요약 추출 시도
+                version = latest_info.get('version', 1)
+                html_path = Path("output") / f"smart_articles/versions/article_{latest_id}_v{version}.html"
+                if not html_path.exists():
+                    # 버전 파일이 없으면 일반 파일 경로 시도
+                    if latest_info.get('created_at'):
+                        try:
+                            dt = datetime.fromisoformat(latest_info['created_at'])
+                            file_pattern = dt.strftime("article_%Y%m%d_%H%M")
+                            for search_dir in [Path("output/smart_articles"), Path("smart_articles")]:
+                                if search_dir.exists():
+                                    matching_files = list(search_dir.glob(f"{file_pattern}*.html"))
+                                    if matching_files:
+                                        html_path = matching_files[0]
+                                        break
+                        except:
+                            pass
+                
+                if html_path.exists():
+                    try:
+                        with open(html_path, 'r', encoding='utf-8') as f:
+                            html_content = f.read()
+                            # 세 줄 요약 부분 추출
+                            import re
+                            summary_match = re.search(r'<h3>📝 (?:세 줄 )?요약</h3>\s*(.+?)(?=</div>|<h)', html_content, re.DOTALL)
+                            if summary_match:
+                                summary_text = summary_match.group(1)
+                                # HTML 태그와 번호 제거하고 내용만 추출
+                                lines = re.findall(r'<strong>\d+\.</strong>\s*(.+?)</p>', summary_text)
+                                if lines:
+                                    summary = " / ".join(lines[:3])  # 최대 3줄
+                    except Exception as e:
+                        print(f"Warning: Could not extract summary from HTML for {latest_id}: {e}")
+                
+                # KST 시간으로 변환
+                time_str = '시간 정보 없음'
+                sort_ts = 0
+                if latest_info.get('last_updated') or latest_info.get('created_at'):
+                    iso_time = latest_info.get('last_updated', latest_info.get('created_at', ''))
+                    try:
+                        dt = parse_iso_to_kst(iso_time)
+                        time_str = format_kst_time(dt)
+                    except:
+                        # Fallback to original format if parsing fails
+                        dt = datetime.fromisoformat(iso_time)
+                        time_str = dt.strftime("%Y년 %m월 %d일 %H:%M")
+                    sort_ts = _sort_key(dt)
+                
+                article_info = {
+                    'filename': f"article_{latest_id}.html",
+                    'title': latest_info.get('generated_title') or latest_info.get('main_title', '제목 없음'),
+                    'time': time_str,
+                    '_sort_ts': sort_ts,
+                    'summary': summary,
+                    'source': 'topic_index',
+                    'path': None,  # 경로는 나중에 찾기
+                    'topic_id': latest_id,
+                    'version': latest_info.get('version', 1)
+                }
+            
+            # topic_index의 generated_title 또는 main_title로 제목을 덮어쓰기
+            if article_info:
+                if latest_info.get('generated_title'):
+                    article_info['title'] = latest_info['generated_title']
+                elif latest_info.get('main_title'):
+                    article_info['title'] = latest_info['main_title']
+            
+            # HTML 파일 경로 찾기
+            if article_info and not article_info.get('path'):
+                # created_at 날짜로 파일명 추정
+                if latest_info.get('created_at'):
+                    try:
+                        dt = datetime.fromisoformat(latest_info['created_at'])
+                        file_pattern = dt.strftime("article_%Y%m%d_%H%M")
+                        
+                        # 가능한 파일 경로들 검색
+                        for search_dir in [Path("articles"), Path("smart_articles")]:
+                            if search_dir.exists():
+                                matching_files = list(search_dir.glob(f"{file_pattern}*.html"))
+                                if matching_files:
+                                    article_info['path'] = f"{search_dir.name}/{matching_files[0].name}"
+                                    break
+                    except:
+                        pass
+            
+            # 경로를 찾지 못해도 topic_index에 있으면 포함
+            if article_info:
+                # 경로가 없으면 기본 경로 생성
+                if not article_info.get('path'):
+                    # topic_id나 날짜 기반으로 기본 경로 설정
+                    if latest_info.get('created_at'):
+                        try:
+                            dt = datetime.fromisoformat(latest_info['created_at'])
+                            filename = dt.strftime("article_%Y%m%d_%H%M%S.html")
+                            article_info['path'] = f"smart_articles/{filename}"
+                        except:
+                            article_info['path'] = f"smart_articles/article_{latest_id}.html"
+                    else:
+                        article_info['path'] = f"smart_articles/article_{latest_id}.html"
+                
+                article_info['version_info'] = f"v{latest_info.get('version', 1)}"
+                article_info['tags'] = latest_info.get('tags', {'category_tags': [], 'content_tags': []})
+                latest_articles.append(article_info)
+    
+    # topic_index에 기사가 없으면 기존 방식으로 HTML 파일 직접 스캔
+    if not latest_articles:
+        print("No articles found in topic_index, scanning HTML files directly...")
+        print("WARNING: This may include duplicate articles!")
+        
+        # 중복 체크를 위한 제목 세트
+        seen_titles = set()
+        all_scanned_articles = []
+        
+        # 여러 위치에서 기사 파일 검색
+        search_locations = [
+            (Path("articles"), "articles"),  # 배포 디렉토리 우선
+            (output_dir / "articles", "articles"),
+            (output_dir / "smart_articles", "smart_articles"),
+            (Path("smart_articles"), "smart_articles"),
+        ]
+        
+        for search_dir, path_prefix in search_locations:
+            if search_dir.exists():
+                print(f"Scanning {search_dir}...")
+                article_files = list(search_dir.glob("article_*.html"))
+                print(f"Found {len(article_files)} files in {search_dir}")
+                
+                for article_file in article_files:
+                    if article_file.stem.endswith('_backup'):
+                        continue
+                        
+                    article_info = extract_article_info_from_html(article_file)
+                    if article_info:
+                        # 경로 조정
+                        article_info['path'] = f"{path_prefix}/{article_file.name}"
+                        article_info['tags'] = {'category_tags': [], 'content_tags': []}
+                        all_scanned_articles.append(article_info)
+        
+        # 시간순 정렬 후 제목 기반 중복 제거
+        all_scanned_articles.sort(key=itemgetter('_sort_ts'), reverse=True)
+        
+        for article in all_scanned_articles:
+            title = article['title']
+            if title not in seen_titles:
+                seen_titles.add(title)
+                latest_articles.append(article)
+        
+        print(f"After deduplication: {len(latest_articles)} unique articles")
+    
+    # 시간순 정렬 (최신순)
+    latest_articles.sort(key=itemgetter('_sort_ts'), reverse=True)
+    
+    # 모든 태그 수집
+    # 미리 정의된 카테고리 태그 (순서 유지)
+    predefined_categories = ['정치', '경제', '사회', '생활/문화', 'IT/과학', '국제']
+    used_category_tags = set()  # 실제 사용된 카테고리만 수집
+    all_content_tags = set()
+    
+    # 최신 10개 기사의 대표 태그 수집
+    recent_tags = []
+    tag_count = {}
+    
+    for i, article in enumerate(latest_articles):
+        tags = article.get('tags', {'category_tags': [], 'content_tags': []})
+        used_category_tags.update(tags.get('category_tags', []))  # 실제 사용된 카테고리만
+        content_tags = tags.get('content_tags', [])
+        all_content_tags.update(content_tags)
+        
+        # 태그 빈도 계산
+        for tag in content_tags:
+            tag_count[tag] = tag_count.get(tag, 0) + 1
+        
+        # 최신 10개 기사의 첫 번째 태그 저장
+        if i < 10 and content_tags:
+            recent_tags.append(content_tags[0])
+    
+    # 태그 정렬 - 실제 사용된 카테고리만, 미리 정의된 순서대로
+    sorted_category_tags = [cat for cat in predefined_categories if cat in used_category_tags]
+    
+    # 주요 키워드 정렬: 최신 기사 대표 태그 + 나머지 랜덤
+    import random
+    remaining_tags = list(all_content_tags - set(recent_tags))
+    random.shuffle(remaining_tags)
+    sorted_content_tags = recent_tags + remaining_tags
+    
+    # HTML 생성 (업데이트 시각과 생성 시간 표기에 같은 시각 사용)
+    now = datetime.now()
+    parts = [_INDEX_HEAD]
+    parts.append(f"""            <span>최신 AI 생성 뉴스 - {now.strftime('%Y년 %m월 %d일 %H:%M')} 업데이트</span>
+            <span class="articles-count">총 {len(latest_articles)}개 기사</span>
+        </div>
+        
+        <div class="tag-filter-section">
+            <div class="tag-filter-header">
+                <h3 class="tag-filter-title">🏷️ 태그로 필터링</h3>
+                <button class="tag-reset-btn" onclick="resetAllTags()">모든 태그 해제</button>
+            </div>
+            <div class="tag-groups">
+""")
+
+    # 카테고리 태그 추가
+    if sorted_category_tags:
+        parts.append('                <div class="tag-group">\n')
+        parts.append('                    <span class="tag-group-label">카테고리:</span>\n')
+        for tag in sorted_category_tags:
+            parts.append(f'                    <button class="tag-btn category-tag" data-tag="{tag}" onclick="toggleTag(this, event)">{tag}</button>\n')
+        parts.append('                </div>\n')
+    
+    # 콘텐츠 태그 추가
+    if sorted_content_tags:
+        parts.append('                <div class="tag-group keywords-section" onclick="toggleKeywordsExpansion(event)">\n')
+        parts.append('                    <span class="tag-group-label">주요 키워드:</span>\n')
+        parts.append('                    <div class="keywords-container">\n')
+        parts.append('                        <div class="keywords-collapsed">\n')
+        # 첫 줄에 표시할 태그들 (약 10개 정도)
+        for i, tag in enumerate(sorted_content_tags[:10]):
+            parts.append(f'                            <button class="tag-btn content-tag" data-tag="{tag}" onclick="toggleTag(this, event)">{tag}</button>\n')
+        parts.append('                            <span class="expand-indicator">... 더보기</span>\n')
+        parts.append('                        </div>\n')
+        parts.append('                        <div class="keywords-expanded" style="display: none;">\n')
+        parts.append('                            <input type="text" class="keyword-search" placeholder="키워드 검색..." oninput="searchKeywords(this)">\n')
+        parts.append('                            <div class="selected-keywords"></div>\n')
+        parts.append('                            <div class="all-keywords">\n')
+        for tag in sorted_content_tags:
+            parts.append(f'                                <button class="tag-btn content-tag" data-tag="{tag}" onclick="toggleTag(this, event)">{tag}</button>\n')
+        parts.append('                            </div>\n')
+        parts.append('                        </div>\n')
+        parts.append('                    </div>\n')
+        parts.append('                </div>\n')
+    
+    parts.append('            </div>\n')
+    parts.append('        </div>\n')
+    
+    parts.append('''        <div class="no-results" style="display: none;"></div>
+''')
+    
+    # 기사 페이지의 관련 기사 목록용 최소 인덱스 (index.html을 브라우저에서 다시 파싱하지 않도록)
+    related_index = []
+
+    if latest_articles:
+        parts.append('        <div class="articles-grid">\n')
+        for article in latest_articles:
+            if article.get('path'):
+                version_badge = f'<span class="version-badge">v{article.get("version", 1)}</span>' if article.get('version', 1) > 1 else ''
+                tags = article.get('tags', {'category_tags': [], 'content_tags': []})
+                all_tags = tags.get('category_tags', []) + tags.get('content_tags', [])
+                # 태그를 파이프(|) 문자로 구분하여 저장
+                tags_data = '|'.join(all_tags)
+                
+                # 썸네일 이미지 처리
+                thumbnail_html = ''
+                image_url = None
+                if article.get('image_path'):
+                    # 이미지 경로 처리
+                    image_url = article['image_path']
+                    if not image_url.startswith('/'):
+                        image_url = '/' + image_url
+                    thumbnail_html = f'''
+                    <div class="article-thumbnail">
+                        <img src="{image_url}" alt="{article['title']}" loading="lazy" onerror="this.style.display='none'; this.parentElement.style.display='none';">
+                    </div>'''
+                
+                parts.append(f'''            <a href="{article['path']}" class="article-card" data-tags="{tags_data}" data-topic-id="{article.get('topic_id') or ''}" onclick="this.href = '{article['path']}#' + Array.from(selectedTags).join(',')">
+                <div class="article-top">
+                    {thumbnail_html}
+                    <div class="article-title-section">
+                        <h2>{article['title']}</h2>
+                    </div>
+                </div>
+                <div class="article-bottom">
+                    <div class="article-meta">
+                        <span>📅 {article['time']}</span>
+                        <span>🤖 AI 생성</span>
+                    </div>
+                    <p class="article-summary">{article['summary']}</p>
+                </div>
+                {version_badge}
+            </a>
+''')
+                related_index.append({
+                    'topic_id': article.get('topic_id'),
+                    'title': article['title'],
+                    'link': '/' + article['path'],
+                    'date': article['time'],
+                    'tags': all_tags,
+                    'thumbnail': image_url,
+                })
+        parts.append('        </div>\n')
+    else:
+        parts.append('''        <div class="no-articles">
+            <h2>아직 생성된 뉴스가 없습니다</h2>
+            <p>KONA 시스템이 새로운 뉴스를 생성 중입니다.</p>
+        </div>
+''')
+
+    parts.append(f'''    </main>
+    
+    <footer>
+        <div class="container">
+            <p>© 2025 KONA Project</p>
+            <p style="margin-top: 10px; font-size: 0.85rem;">
+                생성 시간: {now.strftime('%Y-%m-%d %H:%M:%S KST')}
+            </p>
+        </div>
+    </footer>
+''')
+    parts.append(_INDEX_SCRIPTS)
 
     # 파일 저장
+    # 조각 단위로 UTF-8 인코딩하여 바이너리 모드로 순차 기록 (전체 문자열을 한 번에 만들지 않음)
     output_path = output_dir / "index.html"
-    with open(output_path, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    with os.fdopen(fd, 'wb') as f:
+        if hasattr(os, 'posix_fadvise'):
+            # 순차 쓰기임을 커널에 알림 (힌트일 뿐이므로 실패해도 그대로 기록)
+            try:
+                os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+            except OSError:
+                pass
+        f.writelines(part.encode('utf-8') for part in parts)
+    
+    with open(output_dir / "related_index.json", 'w', encoding='utf-8') as f:
+        json.dump(related_index, f, ensure_ascii=False, separators=(',', ':'))
     
     print(f"Generated unified index.html with {len(latest_articles)} articles (latest versions only)")
     print(f"Total topics in index: {len(topic_index)}")
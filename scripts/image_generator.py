@@ -20,12 +20,11 @@ from pydantic import BaseModel
 from datetime import datetime
 import requests
 from pathlib import Path
-import openai
 from dotenv import load_dotenv
 import base64
 import asyncio
 
-from scripts.utils import setup_logging, APIKeyManager, RateLimiter
+from scripts.utils import setup_logging, APIKeyManager, RateLimiter, get_openai_client
 from scripts.token_tracker import TokenTracker
 from scripts.external_search import RunwareImageGenerator
 
@@ -43,7 +42,7 @@ class NewsImageGenerator:
         if not self.api_manager.has_valid_key():
             raise ValueError("No valid API key found")
         
-        self.client = openai.OpenAI(api_key=self.api_manager.get_active_key())
+        self.client = get_openai_client(self.api_manager.get_active_key())
         self.rate_limiter = RateLimiter(calls_per_minute=50)  # 이미지 생성은 더 높은 제한
         self.token_tracker = TokenTracker()
         
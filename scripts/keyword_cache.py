@@ -0,0 +1,196 @@
+"""
+Copyright (c) 2025 pjeehoon and KONA Project Contributors
+This file is part of KONA (Korean Open News by AI).
+Unauthorized commercial use is prohibited.
+See LICENSE file for details.
+"""
+
+"""
+키워드 추출 결과 캐시
+- 같은 제목/본문에 대한 반복 LLM 호출 방지
+- 모델명 + 제목 + 본문 앞부분의 SHA-256을 키로 디스크에 저장
+- 본문 없이 제목만으로 추출한 경우, 거의 같은 제목(문자 3-gram 자카드 유사도)도 재사용
+- 새 항목은 메모리에만 반영하고 flush() 때(일괄 추출 후, 프로세스 종료 시) 파일로 기록
+"""
+
+import atexit
+import os
+import hashlib
+import threading
+from collections import Counter
+from typing import Dict, FrozenSet, List, Optional
+import sys
+from pathlib import Path
+
+# 프로젝트 루트 경로 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from scripts.utils import setup_logging, dumps_json, load_json_file
+
+logger = setup_logging("keyword_cache")
+
+# 거의 같은 제목으로 볼 문자 3-gram 자카드 유사도 하한 (구두점/공백 제외)
+# 실제 한국어 헤드라인 쌍으로 측정한 값:
+# - 구두점·따옴표만 다른 제목 1.0, '[속보]' 같은 짧은 말머리만 붙은 제목 0.75
+# - 다른 사실을 전하는 제목 (동결/인하, 10호골/11호골, 코스피/코스닥 등) 최대 0.67
+# 조사만 바뀐 제목(0.57~0.64)은 다른 사실과 구분되지 않아 일부러 재사용하지 않음
+TITLE_SIMILARITY_THRESHOLD = 0.7
+
+
+class KeywordCache:
+    """키워드 추출 결과를 디스크에 보관하는 내용 기반 캐시"""
+
+    def __init__(self, cache_file: str = "cache/keywords/keyword_cache.json", max_entries: int = 5000):
+        self.cache_file = cache_file
+        self.max_entries = max_entries
+        os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+        self.entries = self._load()
+        self.hits = 0
+        self.similar_hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._dirty = False  # 파일에 기록하지 않은 변경이 있는지
+        # 제목 유사도 검색용 역색인 {3-gram: {캐시 키}} (처음 사용할 때 생성)
+        self._shingle_index = None
+        self._shingles = {}
+        # 프로세스 종료 시 남은 변경 기록
+        atexit.register(self.flush)
+
+    def _load(self) -> Dict:
+        """캐시 파일 로드 (손상된 경우 빈 캐시로 시작)"""
+        try:
+            return load_json_file(self.cache_file)
+        except FileNotFoundError:
+            return {}
+        except (ValueError, OSError) as e:
+            logger.warning(f"키워드 캐시 로드 실패, 새로 시작: {e}")
+            return {}
+
+    def flush(self):
+        """변경된 캐시를 파일로 저장 (임시 파일에 쓴 뒤 교체, 변경이 없으면 아무것도 하지 않음)"""
+        with self._lock:
+            if not self._dirty:
+                return
+            tmp_file = f"{self.cache_file}.tmp"
+            with open(tmp_file, 'wb') as f:
+                f.write(dumps_json(self.entries))
+            os.replace(tmp_file, self.cache_file)
+            self._dirty = False
+
+    @staticmethod
+    def make_key(model_name: str, title: str, article_content: Optional[str] = None) -> str:
+        """모델명 + 제목 + 본문 앞 300자로 캐시 키 생성"""
+        raw = f"{model_name}|{title}|{(article_content or '')[:300]}"
+        return hashlib.sha256(raw.encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _title_shingles(title: str) -> FrozenSet[str]:
+        """공백과 구두점을 제거한 제목의 문자 3-gram 집합"""
+        compact = "".join(char for char in title if char.isalnum())
+        if len(compact) < 3:
+            return frozenset([compact]) if compact else frozenset()
+        return frozenset(compact[i:i + 3] for i in range(len(compact) - 2))
+
+    def _index_entry(self, key: str, entry: Dict):
+        """제목만으로 추출한 항목을 유사도 역색인에 추가"""
+        if not entry.get('title_only') or 'model' not in entry:
+            return
+        shingles = self._title_shingles(entry['title'])
+        self._shingles[key] = shingles
+        for shingle in shingles:
+            self._shingle_index.setdefault(shingle, set()).add(key)
+
+    def _unindex_entry(self, key: str):
+        """유사도 역색인에서 항목 제거"""
+        for shingle in self._shingles.pop(key, ()):
+            keys = self._shingle_index.get(shingle)
+            if keys:
+                keys.discard(key)
+
+    def _ensure_shingle_index(self):
+        """유사도 역색인 생성 (최초 1회)"""
+        if self._shingle_index is None:
+            self._shingle_index = {}
+            for key, entry in self.entries.items():
+                self._index_entry(key, entry)
+
+    def find_similar(self, model_name: str, title: str, threshold: float = TITLE_SIMILARITY_THRESHOLD) -> Optional[List[str]]:
+        """
+        거의 같은 제목으로 추출해 둔 키워드 반환
+        
+        같은 모델로 제목만 사용해 추출한 항목 중 문자 3-gram 자카드 유사도가
+        threshold 이상인 가장 비슷한 항목의 키워드를 돌려줍니다.
+        """
+        shingles = self._title_shingles(title)
+        if not shingles:
+            return None
+        with self._lock:
+            self._ensure_shingle_index()
+            overlaps = Counter()
+            for shingle in shingles:
+                overlaps.update(self._shingle_index.get(shingle, ()))
+
+            best_key, best_score = None, threshold
+            for key, overlap in overlaps.items():
+                entry = self.entries.get(key)
+                if not entry or entry.get('model') != model_name:
+                    continue
+                score = overlap / (len(shingles) + len(self._shingles[key]) - overlap)
+                if score >= best_score:
+                    best_key, best_score = key, score
+
+            if best_key is None:
+                return None
+            self.similar_hits += 1
+            logger.info(f"유사 제목 키워드 재사용: '{title}' ≈ '{self.entries[best_key]['title']}' ({best_score:.2f})")
+            return list(self.entries[best_key]['keywords'])
+
+    def get(self, key: str, model_name: Optional[str] = None, title: Optional[str] = None) -> Optional[List[str]]:
+        """
+        캐시된 키워드 반환 (없으면 None)
+        
+        title이 주어지면 키가 정확히 일치하는 항목이 없을 때 find_similar()로
+        거의 같은 제목의 항목도 찾습니다. 미적중은 두 조회가 모두 실패했을 때 한 번만 셉니다.
+        """
+        with self._lock:
+            entry = self.entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                return list(entry['keywords'])
+        if title is not None:
+            similar = self.find_similar(model_name, title)
+            if similar is not None:
+                return similar
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def set(self, key: str, title: str, keywords: List[str], model_name: Optional[str] = None,
+            title_only: bool = False):
+        """키워드 저장 (최대 개수를 넘으면 오래된 항목부터 제거)"""
+        with self._lock:
+            self.entries.pop(key, None)
+            entry = {'title': title, 'keywords': list(keywords)}
+            if model_name:
+                entry['model'] = model_name
+                entry['title_only'] = title_only
+            self.entries[key] = entry
+            while len(self.entries) > self.max_entries:
+                oldest_key = next(iter(self.entries))
+                del self.entries[oldest_key]
+                if self._shingle_index is not None:
+                    self._unindex_entry(oldest_key)
+            if self._shingle_index is not None:
+                self._unindex_entry(key)
+                self._index_entry(key, entry)
+            self._dirty = True
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 적중 통계"""
+        return {
+            'hits': self.hits,
+            'similar_hits': self.similar_hits,
+            'misses': self.misses,
+            'entries': len(self.entries),
+        }
@@ -16,16 +16,18 @@ See LICENSE file for details.
 import requests
 from bs4 import BeautifulSoup
 import json
+import copy
+import hashlib
 import logging
 from datetime import datetime
 import time
-import openai
+from concurrent.futures import ThreadPoolExecutor
 import os
 from dotenv import load_dotenv
 from urllib.parse import quote
 from typing import Dict, List
 from scripts.naver_news_cluster_collector import NaverNewsClusterCollector
-from scripts.utils import APIKeyManager, RateLimiter, clean_text, truncate_text
+from scripts.utils import APIKeyManager, RateLimiter, get_openai_client, clean_text, truncate_text
 import subprocess
 import re
 
@@ -40,6 +42,9 @@ logger = setup_logging("multi_article_deep_analyzer")
 class MultiArticleDeepAnalyzer:
     """동일 주제 다중 기사 심층 분석기"""
 
+    ANALYSIS_CACHE_TTL = 3600  # analyze_topic 결과 재사용 시간 (초)
+    ANALYSIS_CACHE_MAX_ENTRIES = 32  # analyze_topic 결과 캐시 최대 항목 수 (항목마다 기사 본문 전체를 보관)
+
     def __init__(self):
         self.headers = {
             "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36"
@@ -50,7 +55,7 @@ class MultiArticleDeepAnalyzer:
         if not self.api_manager.has_valid_key():
             raise ValueError("No valid API key found")
 
-        self.client = openai.OpenAI(api_key=self.api_manager.get_active_key())
+        self.client = get_openai_client(self.api_manager.get_active_key())
         self.rate_limiter = RateLimiter(calls_per_minute=20)  # OpenAI rate limit
 
         # 모델명을 환경 변수에서 가져오기
@@ -61,6 +66,63 @@ class MultiArticleDeepAnalyzer:
         self.current_article_id = None  # 현재 처리 중인 기사 ID
         self.current_article_title = None  # 현재 처리 중인 기사 제목
 
+        # analyze_topic 결과 캐시: {(url, title, category, version, 이전 기사 해시): (저장 시각, 결과)}
+        self._analysis_cache = {}
+        self.analysis_cache_hits = 0
+        self.analysis_cache_misses = 0
+
+        # 클러스터 기사 미리 수집 (네트워크 작업만 백그라운드에서 수행): {url: Future}
+        self._prefetch_pool = None
+        self._cluster_prefetches = {}
+
+    def prefetch_cluster(self, main_news_url: str):
+        """
+        다음에 분석할 기사의 네이버 뉴스 클러스터를 백그라운드에서 미리 수집
+        
+        작업 스레드는 처음 호출될 때 만들고 clear_cluster_prefetches()에서 정리합니다.
+        이미 실행 중인 수집은 중간에 멈출 수 없으므로, 프로세스 종료 시 인터프리터가
+        진행 중인 수집(최대 20개 페이지)이 끝날 때까지 기다릴 수 있습니다.
+        """
+        if not main_news_url or main_news_url in self._cluster_prefetches:
+            return
+        if self._prefetch_pool is None:
+            self._prefetch_pool = ThreadPoolExecutor(max_workers=1)
+        logger.info(f"클러스터 미리 수집 시작: {main_news_url}")
+        self._cluster_prefetches[main_news_url] = self._prefetch_pool.submit(
+            NaverNewsClusterCollector().collect_comprehensive_coverage,
+            main_news_url,
+            max_articles=20,
+        )
+
+    def clear_cluster_prefetches(self):
+        """
+        사용되지 않은 미리 수집 작업 정리
+        
+        대기 중인 작업은 취소하고 작업 스레드 풀을 종료합니다 (기다리지 않음).
+        이미 실행 중인 수집은 끝날 때까지 백그라운드에서 계속되며 결과는 버려집니다.
+        """
+        self._cluster_prefetches.clear()
+        if self._prefetch_pool is not None:
+            self._prefetch_pool.shutdown(wait=False, cancel_futures=True)
+            self._prefetch_pool = None
+
+    def _collect_cluster(self, main_news_url: str) -> dict:
+        """클러스터 기사 수집 (미리 수집된 결과가 있으면 사용)"""
+        future = self._cluster_prefetches.pop(main_news_url, None)
+        if future is not None and not future.cancelled():
+            try:
+                cluster_result = future.result()
+                if cluster_result:
+                    logger.info("미리 수집된 클러스터 결과 사용")
+                    return cluster_result
+            except Exception as e:
+                logger.warning(f"클러스터 미리 수집 실패, 다시 수집: {e}")
+
+        cluster_collector = NaverNewsClusterCollector()
+        return cluster_collector.collect_comprehensive_coverage(
+            main_news_url, max_articles=20  # 10 -> 20으로 증가
+        )
+
     def search_related_articles(self, main_title: str, limit: int = 10) -> list:
         """네이버에서 관련 기사 검색"""
         # 핵심 키워드 추출
@@ -1213,19 +1275,55 @@ Wikipedia 배경: {json.dumps(analysis.get('wikipedia_context', []), ensure_asci
 
     def analyze_topic(self, main_news_url: str, main_title: str, news_category: str = None, 
                      version: int = 1, previous_article_content: str = None) -> dict:
+        """주제에 대한 종합 분석 (같은 입력은 1시간 동안 결과 재사용)"""
+
+        cache_key = (
+            main_news_url,
+            main_title,
+            news_category,
+            version,
+            hashlib.sha256((previous_article_content or "").encode("utf-8")).hexdigest(),
+        )
+        cached = self._analysis_cache.get(cache_key)
+        if cached and time.time() - cached[0] < self.ANALYSIS_CACHE_TTL:
+            self.analysis_cache_hits += 1
+            logger.info(
+                f"캐시된 심층 분석 결과 재사용: {main_title} "
+                f"(적중 {self.analysis_cache_hits}회, 미적중 {self.analysis_cache_misses}회)"
+            )
+            return copy.deepcopy(cached[1])
+
+        self.analysis_cache_misses += 1
+        result = self._analyze_topic_uncached(
+            main_news_url, main_title, news_category, version, previous_article_content
+        )
+        if result:
+            self._store_analysis(cache_key, result)
+        return result
+
+    def _store_analysis(self, cache_key: tuple, result: dict):
+        """분석 결과 캐시에 저장 (만료된 항목과 최대 개수를 넘는 오래된 항목은 제거)"""
+        now = time.time()
+        # 저장 순서 = 저장 시각 순서가 되도록 같은 키는 빼고 맨 뒤에 다시 넣음
+        self._analysis_cache.pop(cache_key, None)
+        for key, (stored_at, _) in list(self._analysis_cache.items()):
+            if now - stored_at < self.ANALYSIS_CACHE_TTL:
+                break
+            del self._analysis_cache[key]
+        self._analysis_cache[cache_key] = (now, copy.deepcopy(result))
+        while len(self._analysis_cache) > self.ANALYSIS_CACHE_MAX_ENTRIES:
+            del self._analysis_cache[next(iter(self._analysis_cache))]
+
+    def _analyze_topic_uncached(self, main_news_url: str, main_title: str, news_category: str = None, 
+                                version: int = 1, previous_article_content: str = None) -> dict:
         """주제에 대한 종합 분석"""
 
         logger.info(f"=== 다중 기사 심층 분석 시작 ===")
         logger.info(f"메인 기사: {main_title}")
 
-        # 네이버 뉴스 클러스터 수집기 사용
-        cluster_collector = NaverNewsClusterCollector()
-
         # 1. 클러스터 기사 수집 (동일 주제의 다양한 언론사 기사)
         logger.info("\n1단계: 네이버 뉴스 클러스터 수집")
-        cluster_result = cluster_collector.collect_comprehensive_coverage(
-            main_news_url, max_articles=20  # 10 -> 20으로 증가
-        )
+        cluster_result = self._collect_cluster(main_news_url)
 
         if not cluster_result or not cluster_result.get("main_article"):
             # 클러스터 수집 실패 시 기존 방식으로 폴백
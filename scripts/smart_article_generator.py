@@ -12,14 +12,18 @@ See LICENSE file for details.
 - 중복 방지
 """
 
+import hashlib
 import json
 import logging
 from datetime import datetime, timezone
 import os
 import sys
 import re
+import string
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Dict, List, Optional, Any, Tuple
-import markdown
 
 # 프로젝트 루트에서 실행되도록 경로 설정
 from pathlib import Path
@@ -33,10 +37,12 @@ from scripts.article_version_manager import ArticleVersionManager
 from scripts.realtime_trend_analyzer import RealtimeTrendAnalyzer
 from scripts.multi_article_deep_analyzer import MultiArticleDeepAnalyzer
 from scripts.token_tracker import TokenTracker
-from scripts.utils import APIKeyManager, RateLimiter, clean_text, truncate_text, get_kst_now, KST
+from scripts.utils import (
+    APIKeyManager, RateLimiter, get_openai_client, clean_text, truncate_text, get_kst_now, KST,
+    extract_markdown_title, dumps_json, loads_json, load_json_file,
+)
 from scripts.article_quality_evaluator import ArticleQualityEvaluator
-from scripts.image_generator import generate_news_image
-import openai
+from scripts.keyword_cache import KeywordCache
 from dotenv import load_dotenv
 
 load_dotenv()
@@ -47,142 +53,100 @@ from scripts.utils import setup_logging
 logger = setup_logging("smart_article_generator")
 
 
-class SmartArticleGenerator:
-    """
-    스마트 기사 생성 시스템
-    
-    기존 기사를 재사용하고 새로운 정보만 업데이트하여 효율적으로 기사를 생성합니다.
-    토큰 사용량을 추적하고, 중복을 방지하며, 버전 관리를 통해 기사의 진화를 추적합니다.
-    
-    Attributes:
-        cache_manager: 기사 캐시 관리자
-        version_manager: 기사 버전 관리자
-        trend_analyzer: 실시간 트렌드 분석기
-        article_analyzer: 다중 기사 심층 분석기
-        token_tracker: 토큰 사용량 추적기
-        model_name: 사용할 AI 모델명
-    """
-
-    def __init__(self) -> None:
-        """SmartArticleGenerator 초기화. 필요한 모든 컴포넌트와 API 클라이언트를 설정합니다."""
-        self.cache_manager = ArticleCacheManager()
-        self.version_manager = ArticleVersionManager()
-        self.trend_analyzer = RealtimeTrendAnalyzer()
-        self.article_analyzer = MultiArticleDeepAnalyzer()
-        self.token_tracker = TokenTracker()
-        self.quality_evaluator = ArticleQualityEvaluator()
-
-        # API Key Manager 사용
-        self.api_manager = APIKeyManager()
-        if not self.api_manager.has_valid_key():
-            raise ValueError("No valid API key found")
-
-        self.client = openai.OpenAI(api_key=self.api_manager.get_active_key())
-        self.rate_limiter = RateLimiter(calls_per_minute=20)  # OpenAI rate limit
-
-        # 모델명을 환경 변수에서 가져오기
-        self.model_name = os.getenv("DETAIL_MODEL", "gpt-4.1-nano")
-        logger.info(f"Using model: {self.model_name}")
-
-        self.total_tokens_used = 0
-        self.total_cost = 0
-
-    def sanitize_exclusive_terms(self, text: str) -> str:
-        """
-        독점 보도 관련 표현 제거
-        
-        뉴스 제목이나 본문에서 [단독], [속보] 등의 독점적 표현을 제거합니다.
-        
-        Args:
-            text: 처리할 텍스트
-            
-        Returns:
-            독점 관련 표현이 제거된 텍스트
-        """
-        # 제거할 표현들
-        exclusive_terms = [
-            "[단독]",
-            "【단독】",
-            "〈단독〉",
-            "＜단독＞",
-            "(단독)",
-            "[독점]",
-            "【독점】",
-            "〈독점〉",
-            "＜독점＞",
-            "(독점)",
-            "[속보]",
-            "【속보】",
-            "〈속보〉",
-            "＜속보＞",
-            "(속보)",
-            "[긴급]",
-            "【긴급】",
-            "〈긴급〉",
-            "＜긴급＞",
-            "(긴급)",
-            "[특종]",
-            "【특종】",
-            "〈특종〉",
-            "＜특종＞",
-            "(특종)",
-            "단독:",
-            "독점:",
-            "속보:",
-            "긴급:",
-            "특종:",
-            "단독 -",
-            "독점 -",
-            "속보 -",
-            "긴급 -",
-            "특종 -",
-            "단독-",
-            "독점-",
-            "속보-",
-            "긴급-",
-            "특종-",
-            "<단독>",
-            "<독점>",
-            "<속보>",
-            "<긴급>",
-            "<특종>",
-        ]
-
-        # 먼저 clean_text로 기본 정리 (HTML 태그 제거, 공백 정리 등)
-        result = clean_text(text)
-
-        # 독점 보도 관련 표현 제거
-        for term in exclusive_terms:
-            result = result.replace(term, "").strip()
-
-        # 맨 앞에 오는 하이픈이나 콜론 제거
-        result = re.sub(r"^[-:]\s*", "", result)
-
-        return result.strip()
-
-    def extract_keywords_from_title(self, title: str, article_content: str = None) -> List[str]:
-        """
-        ChatGPT API를 사용하여 제목과 내용에서 주요 키워드 추출
-        
-        뉴스 제목과 선택적으로 본문 내용을 분석하여 검색과 태그에
-        최적화된 키워드를 추출합니다.
-        
-        Args:
-            title: 키워드를 추출할 제목
-            article_content: 선택적 기사 본문 (더 정확한 키워드 추출을 위해)
-            
-        Returns:
-            추출된 키워드 리스트 (최대 5개)
-        """
-        import json
-        
-        try:
-            # ChatGPT API를 사용한 스마트 키워드 추출
-            prompt = f"""
+# 제거할 독점 보도 관련 표현들
+EXCLUSIVE_TERMS = (
+    "[단독]",
+    "【단독】",
+    "〈단독〉",
+    "＜단독＞",
+    "(단독)",
+    "[독점]",
+    "【독점】",
+    "〈독점〉",
+    "＜독점＞",
+    "(독점)",
+    "[속보]",
+    "【속보】",
+    "〈속보〉",
+    "＜속보＞",
+    "(속보)",
+    "[긴급]",
+    "【긴급】",
+    "〈긴급〉",
+    "＜긴급＞",
+    "(긴급)",
+    "[특종]",
+    "【특종】",
+    "〈특종〉",
+    "＜특종＞",
+    "(특종)",
+    "단독:",
+    "독점:",
+    "속보:",
+    "긴급:",
+    "특종:",
+    "단독 -",
+    "독점 -",
+    "속보 -",
+    "긴급 -",
+    "특종 -",
+    "단독-",
+    "독점-",
+    "속보-",
+    "긴급-",
+    "특종-",
+    "<단독>",
+    "<독점>",
+    "<속보>",
+    "<긴급>",
+    "<특종>",
+)
+
+# 모든 표현을 한 번에 찾는 패턴 (목록 순서대로 우선 매칭)
+_EXCLUSIVE_TERMS_RE = re.compile("|".join(re.escape(term) for term in EXCLUSIVE_TERMS))
+_LEADING_PUNCT_RE = re.compile(r"^[-:]\s*")
+
+# 키워드 추출 폴백에서 우선 선택할 주요 키워드
+IMPORTANT_KEYWORDS = (
+    "장관",
+    "후보",
+    "지명",
+    "철회",
+    "임명",
+    "청문회",
+    "논란",
+    "의혹",
+    "폭우",
+    "사고",
+    "화재",
+    "대통령",
+    "갑질",
+)
+_IMPORTANT_KEYWORDS_RE = re.compile("|".join(re.escape(kw) for kw in IMPORTANT_KEYWORDS))
+# 카테고리 태그로 허용하는 값
+VALID_CATEGORY_TAGS = frozenset(("정치", "경제", "사회", "생활/문화", "국제", "IT/과학"))
+# 태그 생성 시 LLM이 카테고리를 주지 않았을 때 제목으로 추측하는 키워드 (앞에 있는 카테고리 우선)
+CATEGORY_FALLBACK_KEYWORDS = (
+    ("정치", ("대통령", "국회", "정부", "선거", "정당")),
+    ("경제", ("경제", "금융", "주식", "부동산", "기업")),
+    ("IT/과학", ("AI", "인공지능", "IT", "기술", "과학")),
+)
+_CATEGORY_BY_KEYWORD = {
+    kw: category for category, keywords in reversed(CATEGORY_FALLBACK_KEYWORDS) for kw in keywords
+}
+# 전방탐색으로 겹치는 위치의 키워드까지 제목을 한 번만 훑어 모두 찾음
+_CATEGORY_KEYWORDS_RE = re.compile(
+    "(?=(" + "|".join(re.escape(kw) for kw in _CATEGORY_BY_KEYWORD) + "))"
+)
+# 키워드 양 끝에서 제거할 구두점/괄호/따옴표
+_KEYWORD_STRIP_CHARS = ",.!?;:()[]{}\"'"
+
+# 키워드 추출 프롬프트와 응답 스키마 (호출마다 다시 만들지 않도록 모듈 상수로 유지)
+_KEYWORDS_PROMPT = string.Template("""
 다음 뉴스 제목에서 태그와 검색에 사용할 핵심 키워드를 추출해주세요.
 
-제목: {title}
-{f'본문 요약: {article_content[:300]}...' if article_content else ''}
+제목: $title
+$content
 
 요구사항:
 1. 태그로 사용하기 적합한 핵심 키워드 5개
@@ -191,162 +155,1042 @@ class SmartArticleGenerator:
 4. 중복 없이 다양한 관점의 키워드
 
 응답 형식 (JSON):
-{{
+{
     "keywords": ["키워드1", "키워드2", "키워드3", "키워드4", "키워드5"]
-}}
-"""
-
-            # Rate limiting 적용
-            self.rate_limiter.wait_if_needed()
-            
-            response = self.client.chat.completions.create(
-                model=self.model_name,
-                messages=[{"role": "user", "content": prompt}],
-                temperature=0.3,
-                max_tokens=200,
-                response_format={
-                    "type": "json_schema",
-                    "json_schema": {
-                        "name": "keywords_extraction",
-                        "schema": {
-                            "type": "object",
-                            "properties": {
-                                "keywords": {
-                                    "type": "array",
-                                    "items": {"type": "string"},
-                                    "minItems": 5,
-                                    "maxItems": 5,
-                                    "description": "핵심 키워드 5개"
-                                }
-                            },
-                            "required": ["keywords"],
-                            "additionalProperties": False
-                        },
-                        "strict": True
-                    }
+}
+""")
+_KEYWORDS_JSON_SCHEMA = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "keywords_extraction",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "keywords": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "minItems": 5,
+                    "maxItems": 5,
+                    "description": "핵심 키워드 5개"
                 }
-            )
-            
-            # 토큰 사용량 추적
-            if hasattr(self, "current_article_id"):
-                self.token_tracker.track_api_call(
-                    response,
-                    "gpt-4.1-nano",
-                    self.current_article_id,
-                    getattr(self, "current_article_title", None),
-                )
-            
-            # 응답 파싱
-            result = json.loads(response.choices[0].message.content)
-            keywords = result.get("keywords", [])
-            
-            # 유효한 키워드만 필터링
-            valid_keywords = [k.strip() for k in keywords if k.strip() and len(k.strip()) <= 20]
-            
-            logger.info(f"ChatGPT로 추출된 키워드: {valid_keywords[:5]}")
-            return valid_keywords[:5]
-            
-        except Exception as e:
-            logger.error(f"ChatGPT 키워드 추출 실패: {e}")
-            # 폴백: 간단한 패턴 기반 추출
-            normalized_title = title.replace('"', "'").replace('"', "'").replace('"', "'")
-
-            # 주요 키워드
-            important_keywords = [
-                "장관",
-                "후보",
-                "지명",
-                "철회",
-                "임명",
-                "청문회",
-                "논란",
-                "의혹",
-                "폭우",
-                "사고",
-                "화재",
-                "대통령",
-                "갑질",
-            ]
-
-            # 단어 분리
-            words = normalized_title.split()
-
-            for word in words:
-                # 끝에 있는 구두점 제거
-                clean_word = word.rstrip(",.!?;:").strip()
-
-                # 괄호나 따옴표 제거
-                clean_word = clean_word.strip("()[]{}\"'" "").strip()
-
-                # 중요 키워드 체크
-                for kw in important_keywords:
-                    if kw in clean_word and clean_word not in keywords:
-                        keywords.append(clean_word)
-                        break
-
-            # 키워드가 없으면 일반적인 단어 추출
-            if not keywords:
-                words = normalized_title.split()
-                keywords = [w.strip(",.!?;:()[]{}\"'" "") for w in words if len(w) > 2][:3]
-
-            # 기본 단어 추출
-            words = title.split()
-            keywords = [w.strip(",.!?;:()[]{}\"'" "") for w in words if len(w) >= 3][:5]
-
-        return keywords[:5]  # 상위 5개만
-
-    def generate_or_update_article(self, rank: int = 1) -> Dict[str, Any]:
-        """
-        스마트하게 기사 생성 또는 업데이트
-        
-        트렌드를 분석하여 지정된 순위의 뉴스에 대한 기사를 생성합니다.
-        기존 관련 기사가 있다면 업데이트하고, 없다면 새로 생성합니다.
+            },
+            "required": ["keywords"],
+            "additionalProperties": False
+        },
+        "strict": True
+    }
+}
+# 3줄 요약과 태그를 한 번에 생성할 때의 응답 스키마
+_ARTICLE_METADATA_JSON_SCHEMA = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "article_metadata",
+        "schema": {
+            "type": "object",
+            "properties": {
+                "line1": {"type": "string", "description": "첫 번째 요약 문장"},
+                "line2": {"type": "string", "description": "두 번째 요약 문장"},
+                "line3": {"type": "string", "description": "세 번째 요약 문장"},
+                "category_tags": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "카테고리 태그 (최대 2개)"
+                },
+                "content_tags": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "내용 태그 (3-5개)"
+                }
+            },
+            "required": ["line1", "line2", "line3", "category_tags", "content_tags"],
+            "additionalProperties": False
+        },
+        "strict": True
+    }
+}
+
+# 마크다운 변환 결과의 링크 태그 (외부 링크에 target="_blank"를 붙이기 위해 사용)
+_ANCHOR_HREF_RE = re.compile(r'<a href="([^"]+)">')
+# 마크다운 변환에 사용하는 확장 목록
+_MARKDOWN_EXTENSIONS = ['extra', 'nl2br', 'sane_lists', 'smarty']
+
+# 기사 페이지 공통 스타일시트 (동적인 값이 없으므로 f-string 템플릿 밖의 상수로 유지)
+_ARTICLE_CSS = """        body {
+            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
+            max-width: 900px;
+            margin: 0 auto;
+            padding: 20px;
+            line-height: 1.8;
+            background: #f5f5f5;
+        }
+        .container {
+            background: white;
+            padding: 30px;
+            border-radius: 10px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
+        .header {
+            background: #f8f9fa;
+            padding: 20px;
+            border-radius: 10px;
+            margin-bottom: 30px;
+        }
+        .version-badge {
+            background: #17a2b8;
+            color: white;
+            padding: 5px 15px;
+            border-radius: 20px;
+            display: inline-block;
+            font-weight: bold;
+            margin-bottom: 10px;
+        }
+        .update-info {
+            background: #d4edda;
+            border: 1px solid #c3e6cb;
+            padding: 15px;
+            border-radius: 5px;
+            margin: 20px 0;
+        }
+        .article-content {
+            margin: 30px 0;
+            font-size: 17px;
+            line-height: 1.9;
+        }
+        .article-content h3 {
+            font-size: 1.4rem;
+            color: #333;
+            margin: 30px 0 15px 0;
+            padding-bottom: 10px;
+            border-bottom: 2px solid #e9ecef;
+        }
+        .article-content p {
+            margin: 15px 0;
+            text-align: justify;
+        }
+        .meta {
+            margin: 20px 0;
+            padding: 15px;
+            background: #e9ecef;
+            border-radius: 8px;
+        }
+        .version-history {
+            margin: 30px 0;
+            padding: 20px;
+            background: #f8f9fa;
+            border-radius: 8px;
+            border: 1px solid #dee2e6;
+        }
+        .version-history h3 {
+            margin-top: 0;
+            color: #495057;
+            cursor: pointer;
+            user-select: none;
+            display: flex;
+            align-items: center;
+            justify-content: space-between;
+        }
+        .version-history h3:hover {
+            color: #343a40;
+        }
+        .version-toggle {
+            font-size: 0.9em;
+            color: #6c757d;
+            transition: transform 0.3s ease;
+        }
+        .version-toggle.open {
+            transform: rotate(180deg);
+        }
+        .version-list {
+            max-height: 0;
+            overflow: hidden;
+            transition: max-height 0.3s ease;
+        }
+        .version-list.open {
+            max-height: 500px;
+            overflow-y: auto;
+        }
+        .version-item {
+            margin: 10px 0;
+            padding: 10px;
+            background: white;
+            border-radius: 4px;
+            border-left: 3px solid #17a2b8;
+        }
+        .version-item.current {
+            border-left-color: #28a745;
+            font-weight: bold;
+        }
+        .version-date {
+            font-size: 14px;
+            color: #6c757d;
+        }
+        .sources-section {
+            margin-top: 40px;
+            padding: 20px;
+            background: #f8f9fa;
+            border-radius: 8px;
+            border: 1px solid #dee2e6;
+        }
+        .sources-section h4 {
+            margin: 0 0 10px 0;
+            font-size: 1.1rem;
+            color: #495057;
+        }
+        .source-list {
+            margin: 5px 0;
+            font-size: 0.9rem;
+        }
+        .source-list a {
+            color: #1a73e8;
+            text-decoration: none;
+            margin-right: 10px;
+        }
+        .source-list a:hover {
+            text-decoration: underline;
+        }
         
-        Args:
-            rank: 생성할 뉴스의 순위 (1-10, 기본값: 1)
-            
-        Returns:
-            생성된 기사 정보 디텍셔너리 (생성 실패 시 None)
-            {
-                "article_id": 기사 ID,
-                "title": 제목,
-                "content": 본문,
-                "url": 원본 URL,
-                "keywords": 키워드 리스트,
-                "created_at": 생성 시간,
-                "is_new": 새 기사 여부,
-                "status": 상태 메시지
+        /* Floating Action Button */
+        .fab {
+            position: fixed;
+            bottom: 20px;
+            right: 20px;
+            width: 56px;
+            height: 56px;
+            background: #0066cc;
+            color: white;
+            border-radius: 28px;
+            border: none;
+            box-shadow: 0 2px 10px rgba(0,102,204,0.3);
+            cursor: pointer;
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            text-decoration: none;
+            font-size: 24px;
+            transition: transform 0.2s, box-shadow 0.2s;
+            z-index: 1000;
+        }
+        
+        .fab:hover {
+            transform: scale(1.1);
+            box-shadow: 0 4px 20px rgba(0,102,204,0.4);
+        }
+        
+        /* Related Articles Section */
+        .related-articles {
+            margin-top: 50px;
+            padding: 20px;
+            background: #f8f9fa;
+            border-radius: 8px;
+            border: 1px solid #dee2e6;
+        }
+        
+        .related-articles h3 {
+            margin: 0 0 20px 0;
+            color: #495057;
+            font-size: 1.3rem;
+        }
+        
+        .related-article-item {
+            display: flex;
+            gap: 15px;
+            padding: 15px;
+            margin-bottom: 10px;
+            background: white;
+            border-radius: 4px;
+            border-left: 3px solid #0066cc;
+            transition: transform 0.2s;
+            text-decoration: none;
+            color: inherit;
+        }
+        
+        .related-article-item:hover {
+            transform: translateX(5px);
+            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
+        }
+        
+        .related-article-thumbnail {
+            flex-shrink: 0;
+            width: 60px;
+            height: 60px;
+            border-radius: 4px;
+            overflow: hidden;
+            background: #f5f5f5;
+        }
+        
+        .related-article-thumbnail img {
+            width: 100%;
+            height: 100%;
+            object-fit: cover;
+        }
+        
+        .related-article-content {
+            flex: 1;
+            min-width: 0;
+        }
+        
+        .related-article-content h4 {
+            margin: 0 0 5px 0;
+            font-size: 1rem;
+            font-weight: 500;
+            color: #333;
+            line-height: 1.3;
+        }
+        
+        .related-article-item:hover .related-article-content h4 {
+            color: #0066cc;
+        }
+        
+        .related-article-meta {
+            font-size: 0.85rem;
+            color: #6c757d;
+        }
+        
+        .loading-message {
+            text-align: center;
+            color: #6c757d;
+            padding: 20px;
+        }
+        
+        /* Mobile responsiveness */
+        @media (max-width: 768px) {
+            .fab {
+                bottom: 70px;
+                right: 15px;
             }
-        """
+        }
+"""
 
-        logger.info("=== 스마트 기사 생성 시작 ===")
+# 기사 페이지 HTML 템플릿 (CSS/JS 중괄호를 이스케이프할 필요 없도록 $ 자리표시자 사용, 스타일시트는 미리 포함)
+_ARTICLE_HTML_TEMPLATE = ("""<!DOCTYPE html>
+<html lang="ko">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>$title - $current_time</title>
+    <link rel="icon" type="image/svg+xml" href="/static/favicon.svg">
+    <link rel="alternate icon" href="/static/favicon.svg">
+    <meta name="current-topic-id" content="$topic_id">
+    <meta name="article-tags" content="$all_tags">$category_tags_meta$content_tags_meta
+    <style>
+""" + _ARTICLE_CSS + """    </style>
+    <script>
+        // 버전 히스토리 요소는 페이지 로드 시 한 번만 조회
+        let versionListEl, versionToggleEl;
+        document.addEventListener('DOMContentLoaded', () => {
+            versionListEl = document.getElementById('version-list');
+            versionToggleEl = document.getElementById('version-toggle');
+        });
+        
+        function toggleVersionHistory() {
+            const open = versionListEl.classList.toggle('open');
+            versionToggleEl.classList.toggle('open', open);
+        }
+        
+        // index.html의 기사 카드 패턴 (related_index.json이 없을 때만 사용)
+        const ARTICLE_CARD_RE = /<a href="([^"]*)" class="article-card" data-tags="([^"]*)"(?: data-topic-id="([^"]*)")?[^>]*>([\\s\\S]*?)<\\/a>/g;
+        const CARD_TITLE_RE = /<h2>([^<]*)<\\/h2>/;
+        const CARD_DATE_RE = /📅 ([^<]*)<\\/span>/;
+        const CARD_THUMBNAIL_RE = /<img src="([^"]*)"/;
+        
+        // 관련 기사 후보 목록: 빌드 시 생성된 JSON을 우선 사용하고,
+        // 없으면 index.html을 DOM으로 파싱하지 않고 문자열에서 바로 추출
+        async function fetchArticleIndex() {
+            try {
+                const response = await fetch('/related_index.json');
+                if (response.ok) {
+                    return await response.json();
+                }
+            } catch (error) {
+                // index.html로 대체
+            }
+            
+            const response = await fetch('/index.html');
+            const html = await response.text();
+            const articles = [];
+            for (const card of html.matchAll(ARTICLE_CARD_RE)) {
+                const title = card[4].match(CARD_TITLE_RE);
+                const date = card[4].match(CARD_DATE_RE);
+                if (!title || !date) continue;
+                const thumbnail = card[4].match(CARD_THUMBNAIL_RE);
+                articles.push({
+                    topic_id: card[3],
+                    title: title[1],
+                    link: '/' + card[1],
+                    date: date[1].trim(),
+                    tags: card[2].split('|').filter(tag => tag),
+                    thumbnail: thumbnail ? thumbnail[1] : null
+                });
+            }
+            return articles;
+        }
+        
+        // Load related articles based on current filter state
+        async function loadRelatedArticles() {
+            const relatedSection = document.getElementById('related-articles-list');
+            const currentTopicId = document.querySelector('meta[name="current-topic-id"]').content;
+            // current_time 형식: 2025-07-24 02:00:29 (ISO 형태로 바꿔 한 번만 숫자 타임스탬프로 변환)
+            const currentTs = Date.parse('$current_time'.replace(' ', 'T'));
+            
+            // console.log('Loading related articles...');
+            // console.log('Current timestamp:', currentTs);
+            
+            try {
+                // Get the current filter state from URL hash
+                const hash = window.location.hash.slice(1);
+                const filters = hash ? hash.split(',').map(tag => decodeURIComponent(tag)) : [];
+                // console.log('Active filters:', filters);
+                
+                const articles = await fetchArticleIndex();
+                // 필터는 Set으로 한 번만 만들어 두고 기사 태그마다 O(1)로 확인
+                const filterSet = new Set(filters);
+                const hasFilters = filterSet.size > 0;
+                
+                const filteredArticles = articles.filter(article => {
+                    // Skip the current article
+                    if (article.topic_id === currentTopicId) {
+                        return false;
+                    }
+                    
+                    // Parse the article date
+                    // 날짜 형식이 고정("2025년 07월 24일 01:03")이므로 정규식 대신 위치로 잘라 ISO 문자열 구성
+                    const date = article.date;
+                    article.timestamp = Date.parse(
+                        date.slice(0, 4) + '-' + date.slice(6, 8) + '-' + date.slice(10, 12) +
+                        'T' + date.slice(14, 16) + ':' + date.slice(17, 19)
+                    );
+                    if (Number.isNaN(article.timestamp)) {
+                        return false;
+                    }
+                    
+                    // 현재 기사보다 오래된 기사만 표시
+                    if (article.timestamp >= currentTs) {
+                        return false;
+                    }
+                    
+                    // If filters are applied, check if article matches
+                    return !hasFilters || article.tags.some(tag => filterSet.has(tag));
+                });
+                
+                // Sort by date (newest first among older articles)
+                filteredArticles.sort((a, b) => b.timestamp - a.timestamp);
+                
+                // Display up to 5 articles
+                if (filteredArticles.length > 0) {
+                    // Create articles using DOM methods to avoid CSP issues
+                    // 프래그먼트에 모아 두었다가 한 번에 교체 (DOM 변경 1회)
+                    const fragment = document.createDocumentFragment();
+                    filteredArticles.slice(0, 5).forEach(article => {
+                        const itemLink = document.createElement('a');
+                        itemLink.className = 'related-article-item';
+                        itemLink.href = article.link;
+                        
+                        // Add thumbnail if available
+                        if (article.thumbnail) {
+                            const thumbnailDiv = document.createElement('div');
+                            thumbnailDiv.className = 'related-article-thumbnail';
+                            
+                            const img = document.createElement('img');
+                            img.src = article.thumbnail;
+                            img.alt = article.title;
+                            img.loading = 'lazy';
+                            img.onerror = function() {
+                                this.style.display = 'none';
+                                thumbnailDiv.style.display = 'none';
+                            };
+                            
+                            thumbnailDiv.appendChild(img);
+                            itemLink.appendChild(thumbnailDiv);
+                        }
+                        
+                        // Content section
+                        const contentDiv = document.createElement('div');
+                        contentDiv.className = 'related-article-content';
+                        
+                        const titleElement = document.createElement('h4');
+                        titleElement.textContent = article.title;
+                        
+                        const metaDiv = document.createElement('div');
+                        metaDiv.className = 'related-article-meta';
+                        metaDiv.textContent = article.date;
+                        
+                        contentDiv.appendChild(titleElement);
+                        contentDiv.appendChild(metaDiv);
+                        itemLink.appendChild(contentDiv);
+                        
+                        fragment.appendChild(itemLink);
+                    });
+                    relatedSection.replaceChildren(fragment);
+                } else {
+                    const message = document.createElement('p');
+                    message.className = 'loading-message';
+                    if (filters.length > 0) {
+                        message.textContent = '선택한 필터에 해당하는 이전 기사가 없습니다.';
+                    } else {
+                        message.textContent = '이전 기사가 없습니다.';
+                    }
+                    relatedSection.replaceChildren(message);
+                }
+                
+            } catch (error) {
+                console.error('Error loading related articles:', error);
+                const errorMessage = document.createElement('p');
+                errorMessage.className = 'loading-message';
+                errorMessage.textContent = '기사 목록을 불러올 수 없습니다.';
+                relatedSection.replaceChildren(errorMessage);
+            }
+        }
+        
+        // 관련 기사 영역이 화면에 가까워질 때 불러옴 (초기 렌더링과 네트워크를 다투지 않도록)
+        document.addEventListener('DOMContentLoaded', () => {
+            const relatedSection = document.getElementById('related-articles-list');
+            if (!('IntersectionObserver' in window)) {
+                loadRelatedArticles();
+                return;
+            }
+            const observer = new IntersectionObserver((entries) => {
+                if (entries.some(entry => entry.isIntersecting)) {
+                    observer.disconnect();
+                    loadRelatedArticles();
+                }
+            }, { rootMargin: '200px' });
+            observer.observe(relatedSection);
+        });
+    </script>
+</head>
+<body>
+    <div class="container">
+        <div class="header">
+            <h1>$title</h1>
+            <p>
+                분석 시간: $current_time
+                $version_badge
+            </p>
+        </div>
+        
+        $summary_section
+        
+        $ai_image_section
+        
+        <div class="article-content">
+$article_body
+        </div>
+        
+        $version_history
+        
+        $sources_section
+        
+        <!-- Related Articles Section -->
+        <div class="related-articles">
+            <h3>📰 다른 기사</h3>
+            <div id="related-articles-list">
+                <p class="loading-message">기사 목록을 불러오는 중...</p>
+            </div>
+        </div>
+        
+        <hr>
+        <p><small>이 기사는 AI가 자동으로 생성하고 관리하는 스마트 기사입니다.</small></p>
+    </div>
+    
+    <!-- Floating Home Button -->
+    <a href="/index.html" class="fab" title="홈으로">🏠</a>
+</body>
+</html>""")
 
-        # 1. 현재 트렌드 분석
-        logger.info("1단계: 실시간 트렌드 분석")
-        trends = self.trend_analyzer.analyze_realtime_trends()
 
-        if not trends or not trends.get("hot_news"):
-            logger.error("트렌드 분석 실패")
-            return None
+def _split_template(template: str) -> Tuple[str, ...]:
+    """
+    $이름 자리표시자를 기준으로 템플릿을 미리 분할
+    
+    짝수 번째 항목은 고정 문자열, 홀수 번째 항목은 자리표시자 이름입니다.
+    렌더링할 때 템플릿 전체를 다시 훑지 않고 값만 끼워 넣어 한 번에 합칠 수 있습니다.
+    """
+    return tuple(re.split(r"\$([A-Za-z_][A-Za-z0-9_]*)", template))
 
-        # 지정된 순위의 뉴스 선택
-        if len(trends["hot_news"]) < rank:
-            logger.warning(f"{rank}위 뉴스가 없음. 1위로 대체")
-            rank = 1
 
-        target_news = trends["hot_news"][rank - 1]
-        title = self.sanitize_exclusive_terms(target_news["title"])  # 독점 보도 표현 제거
-        url = target_news["link"]
-        category = target_news.get("category", None)  # 카테고리 정보 추출
+def _fill_template(parts: Tuple[str, ...], **fields: str) -> str:
+    """_split_template로 나눈 템플릿에 값을 채워 하나의 문자열로 합침 (값이 없으면 KeyError)"""
+    pieces = list(parts)
+    pieces[1::2] = [fields[name] for name in parts[1::2]]
+    return "".join(pieces)
 
-        # 토큰 추적을 위한 article_id 설정
-        timestamp = get_kst_now().strftime("%Y%m%d_%H%M%S")
-        self.current_article_id = f"article_{timestamp}"
-        self.current_article_title = title
 
-        logger.info(f"대상 뉴스: {title}")
-        if category:
-            logger.info(f"카테고리: {category}")
+_ARTICLE_HTML_PARTS = _split_template(_ARTICLE_HTML_TEMPLATE)
+
+# 버전 히스토리 항목 템플릿 (버전마다 f-string을 다시 평가하지 않고 값만 채움)
+_VERSION_ITEM_PARTS = _split_template("""
+            <div class="$version_class">
+                <div style="display: flex; justify-content: space-between; align-items: center;">
+                    <div>
+                        <a href="$version_link" target="_blank" style="text-decoration: none; color: inherit;">
+                            <strong>버전 $version_num</strong>
+                        </a>
+                        $current_marker
+                    </div>
+                    <div class="version-date">$formatted_date</div>
+                </div>
+                $title_block
+                <div style="margin-top: 5px; font-size: 13px;">
+                    <a href="$version_link" target="_blank" style="color: #1a73e8; text-decoration: none;">
+                        이 버전 보기 →
+                    </a>
+                </div>
+            </div>
+            """)
+
+
+@lru_cache(maxsize=2048)
+def _parse_iso_utc(timestamp: str) -> datetime:
+    """ISO 형식 문자열 파싱 ('Z' 접미사 처리, timezone이 없으면 UTC로 가정). 같은 문자열은 캐시된 결과 사용"""
+    if timestamp.endswith("Z"):
+        timestamp = timestamp.replace("Z", "+00:00")
+    parsed = datetime.fromisoformat(timestamp)
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+
+_SOURCE_TITLE_MAX_LENGTH = 30  # 참조 소스 링크에 표시할 제목 최대 글자 수
+
+
+def _shorten_title(title: str, max_length: int = _SOURCE_TITLE_MAX_LENGTH) -> str:
+    """긴 제목을 max_length자로 줄이고 '...'을 붙임 (짧으면 그대로)"""
+    return title if len(title) <= max_length else title[:max_length] + "..."
+
+
+def _source_anchors(items: Optional[List[Dict]], limit: int) -> List[str]:
+    """참조 소스 링크 목록 (앞에서 limit개 중 제목과 링크가 모두 있는 항목만, 긴 제목은 줄여서 표시)"""
+    anchors = []
+    for item in (items or [])[:limit]:
+        title = item.get("title", "")
+        link = item.get("link", item.get("url", ""))  # link 또는 url 키 사용
+        if title and link:
+            anchors.append(f'<a href="{link}" target="_blank">{_shorten_title(title)}</a>')
+    return anchors
+
+
+@lru_cache(maxsize=4096)
+def _format_created_at(created_at: str) -> str:
+    """버전 생성 시각을 표시 형식으로 변환 (파싱 실패 시 원문 그대로). 같은 문자열은 캐시된 결과 사용"""
+    try:
+        return datetime.fromisoformat(created_at).strftime("%Y년 %m월 %d일 %H:%M")
+    except Exception as e:
+        logger.debug("Date formatting failed: %s", e)
+        return created_at
+
+
+class SmartArticleGenerator:
+    """
+    스마트 기사 생성 시스템
+    
+    기존 기사를 재사용하고 새로운 정보만 업데이트하여 효율적으로 기사를 생성합니다.
+    토큰 사용량을 추적하고, 중복을 방지하며, 버전 관리를 통해 기사의 진화를 추적합니다.
+    
+    Attributes:
+        cache_manager: 기사 캐시 관리자
+        version_manager: 기사 버전 관리자
+        trend_analyzer: 실시간 트렌드 분석기
+        article_analyzer: 다중 기사 심층 분석기
+        token_tracker: 토큰 사용량 추적기
+        model_name: 사용할 AI 모델명
+    """
+
+    TRENDS_CACHE_TTL = 300  # 트렌드 분석 결과 재사용 시간 (초)
+    BODY_HTML_CACHE_MAX_CHARS = 16 * 1024 * 1024  # 본문 HTML 캐시에 보관할 최대 글자 수 (HTML 기준)
+    SECTION_HTML_CACHE_MAX_ENTRIES = 512  # 버전 히스토리/소스 섹션 HTML 캐시 최대 항목 수
+
+    def __init__(self) -> None:
+        """SmartArticleGenerator 초기화. 필요한 모든 컴포넌트와 API 클라이언트를 설정합니다."""
+        self.cache_manager = ArticleCacheManager()
+        self.version_manager = ArticleVersionManager()
+        self.trend_analyzer = RealtimeTrendAnalyzer()
+        self.article_analyzer = MultiArticleDeepAnalyzer()
+        self.token_tracker = TokenTracker()
+        self.quality_evaluator = ArticleQualityEvaluator()
+        self.keyword_cache = KeywordCache()
+
+        # API Key Manager 사용
+        self.api_manager = APIKeyManager()
+        if not self.api_manager.has_valid_key():
+            raise ValueError("No valid API key found")
+
+        self.client = get_openai_client(self.api_manager.get_active_key())
+        self.rate_limiter = RateLimiter(calls_per_minute=20)  # OpenAI rate limit
+
+        # 모델명을 환경 변수에서 가져오기
+        self.model_name = os.getenv("DETAIL_MODEL", "gpt-4.1-nano")
+        logger.info(f"Using model: {self.model_name}")
+
+        # 품질 평가는 기사 페이지에 표시되지 않으므로 환경 변수로 켤 때만 수행
+        self.enable_quality_eval = os.getenv("ENABLE_QUALITY_EVAL", "false").lower() in ("1", "true", "yes")
+
+        self.total_tokens_used = 0
+        self.total_cost = 0
+
+        # 트렌드 분석 결과 캐시 (저장 시각, 결과) - 같은 실행 안에서 순위마다 다시 분석하지 않도록 함
+        self._trends_cache = None
+
+        # 출력 디렉토리는 시작할 때 한 번만 생성
+        ensure_output_dirs()
+        self.output_dir = get_smart_articles_dir()
+        self.versions_dir = f"{self.output_dir}/versions"
+        os.makedirs(self.versions_dir, exist_ok=True)
+
+        # 마크다운 변환기 (처음 사용할 때 한 번만 생성하고 reset()으로 재사용)
+        self._md = None
+        # 본문 HTML 캐시 {본문 해시: 변환된 HTML} - 같은 본문은 다시 변환하지 않음
+        self._body_html_cache = {}
+        self._body_html_cache_chars = 0
+        # 섹션 HTML 캐시 {(섹션 종류, 입력 데이터 해시): HTML} - 같은 입력은 다시 만들지 않음
+        self._section_html_cache = {}
+
+    def _get_trends(self) -> Optional[Dict[str, Any]]:
+        """실시간 트렌드 분석 결과 반환 (TRENDS_CACHE_TTL 동안은 캐시된 결과 재사용)"""
+        if self._trends_cache and time.monotonic() - self._trends_cache[0] < self.TRENDS_CACHE_TTL:
+            logger.info("캐시된 트렌드 분석 결과 사용")
+            return self._trends_cache[1]
+
+        trends = self.trend_analyzer.analyze_realtime_trends()
+        if trends and trends.get("hot_news"):
+            self._trends_cache = (time.monotonic(), trends)
+        return trends
+
+    def _evaluate_quality(self, content: str) -> Tuple[str, str, Dict]:
+        """
+        기사 품질 평가 (ENABLE_QUALITY_EVAL이 꺼져 있으면 건너뜀)
+        
+        Returns:
+            (품질 등급, 이모지, 세부 평가) - 평가하지 않으면 ("", "", {})
+        """
+        if not self.enable_quality_eval:
+            return "", "", {}
+        return self.quality_evaluator.evaluate_article({
+            "comprehensive_article": content,
+            "generated_article": content
+        })
+
+    def _run_with_quality_eval(self, content: str, task, *args) -> Tuple[Any, Tuple[str, str, Dict]]:
+        """
+        task(*args) 실행 결과와 content의 품질 평가 결과를 함께 반환
+        
+        품질 평가를 켠 경우에만 task(LLM 호출)를 백그라운드에서 진행하며 평가를 겹쳐 수행하고,
+        꺼져 있으면 겹칠 작업이 없으므로 현재 스레드에서 바로 실행합니다.
+        """
+        if not self.enable_quality_eval:
+            return task(*args), ("", "", {})
+
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            future = pool.submit(task, *args)
+            quality = self._evaluate_quality(content)
+            logger.info(f"업데이트된 기사 품질: {quality[0]} {quality[1]}")
+            return future.result(), quality
+
+    def _persist_article(
+        self,
+        article_id: str,
+        version: int,
+        html_output: str,
+        latest_filename: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+        now: Optional[datetime] = None,
+    ) -> Dict[str, Optional[str]]:
+        """
+        생성/업데이트된 기사 파일 저장
+        
+        버전별 HTML을 저장하고, 최신 HTML은 버전 파일의 하드링크로 만듭니다.
+        metadata가 주어지면 JSON 메타데이터도 함께 저장합니다.
+        
+        Args:
+            article_id: 기사 ID
+            version: 기사 버전
+            html_output: 완성된 HTML 문서
+            latest_filename: 최신 HTML 파일명 (없으면 article_<타임스탬프>.html)
+            metadata: 함께 저장할 JSON 메타데이터
+            now: 타임스탬프 파일명에 사용할 현재 시각 (없으면 지금 시각)
+            
+        Returns:
+            저장된 파일 경로 디텍셔너리 (version_path, html_path, json_path)
+        """
+        if latest_filename is None:
+            latest_filename = f"article_{(now or get_kst_now()).strftime('%Y%m%d_%H%M%S')}.html"
+
+        version_path = f"{self.versions_dir}/article_{article_id}_v{version}.html"
+        html_path = f"{self.output_dir}/{latest_filename}"
+        json_path = f"{self.output_dir}/article_{article_id}.json" if metadata is not None else None
+
+        # 버전별 HTML과 JSON 메타데이터 동시 저장 후 최신 HTML은 버전 파일의 하드링크로 생성
+        html_bytes = html_output.encode("utf-8")
+        files = [(version_path, html_bytes)]
+        if json_path:
+            files.append((json_path, dumps_json(metadata)))
+        self._write_outputs(files)
+        self._link_output(version_path, html_path, html_bytes)
+
+        # 기사 생성 중 누적한 토큰/이미지 사용량 메타데이터를 한 번에 기록
+        # (기사 파일은 이미 저장되었으므로 기록 실패로 기사를 실패 처리하지 않음,
+        #  기록하지 못한 항목은 버퍼에 남아 다음 flush 때 다시 시도)
+        try:
+            self.token_tracker.flush()
+        except Exception as e:
+            logger.error(f"토큰 사용량 메타데이터 기록 실패 (다음 기록 때 재시도): {e}")
+
+        return {"version_path": version_path, "html_path": html_path, "json_path": json_path}
+
+    def _write_outputs(self, files: List[Tuple[str, bytes]]) -> None:
+        """
+        결과 파일들을 동시에 저장
+        
+        버전 HTML, 최신 HTML, JSON 메타데이터처럼 서로 독립적인 작은 파일들을
+        스레드 풀에서 병렬로 기록합니다. 각 파일은 임시 파일에 쓴 뒤 교체하므로,
+        기존 파일을 하드링크로 공유하는 최신 HTML은 덮어써지지 않고 이전 내용을 유지합니다.
+        
+        Args:
+            files: (경로, 내용 바이트) 튜플 리스트
+        """
+        def write_file(item: Tuple[str, bytes]) -> None:
+            path, data = item
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+
+        if len(files) == 1:
+            write_file(files[0])
+            return
+
+        with ThreadPoolExecutor(max_workers=min(4, len(files))) as pool:
+            # list()로 소비해야 쓰기 중 발생한 예외가 호출자에게 전달됨
+            list(pool.map(write_file, files))
+
+    def _link_output(self, source_path: str, link_path: str, data: bytes) -> None:
+        """
+        이미 저장한 파일과 내용이 같은 파일을 하드링크로 생성
+        
+        버전 HTML과 최신 HTML처럼 내용이 똑같은 파일을 두 번 쓰지 않도록
+        link_path를 source_path의 하드링크로 만듭니다. 기존 파일이 있으면 교체하며,
+        하드링크를 지원하지 않는 환경에서는 data를 직접 기록합니다.
+        
+        Args:
+            source_path: 이미 저장된 파일 경로
+            link_path: 생성할 파일 경로
+            data: 하드링크 생성 실패 시 기록할 내용
+        """
+        tmp_path = f"{link_path}.tmp"
+        try:
+            if os.path.lexists(tmp_path):
+                os.remove(tmp_path)
+            os.link(source_path, tmp_path)
+            os.replace(tmp_path, link_path)
+        except (OSError, AttributeError, NotImplementedError) as e:
+            logger.debug("하드링크 생성 실패, 파일 직접 저장: %s (%s)", link_path, e)
+            # 링크는 만들었지만 교체에 실패한 경우 임시 파일이 source_path와 inode를 공유하므로
+            # 그대로 열어 쓰면 버전 파일까지 바뀜 → 먼저 제거
+            if os.path.lexists(tmp_path):
+                os.remove(tmp_path)
+            self._write_outputs([(link_path, data)])
+
+    def sanitize_exclusive_terms(self, text: str) -> str:
+        """
+        독점 보도 관련 표현 제거
+        
+        뉴스 제목이나 본문에서 [단독], [속보] 등의 독점적 표현을 제거합니다.
+        
+        Args:
+            text: 처리할 텍스트
+            
+        Returns:
+            독점 관련 표현이 제거된 텍스트
+        """
+
+        # 먼저 clean_text로 기본 정리 (HTML 태그 제거, 공백 정리 등)
+        result = clean_text(text)
+
+        # 독점 보도 관련 표현 제거 (한 번의 정규식 탐색으로 모두 제거)
+        result = _EXCLUSIVE_TERMS_RE.sub("", result).strip()
+
+        # 맨 앞에 오는 하이픈이나 콜론 제거
+        result = _LEADING_PUNCT_RE.sub("", result)
+
+        return result.strip()
+
+    def extract_keywords_from_title(self, title: str, article_content: str = None) -> List[str]:
+        """
+        ChatGPT API를 사용하여 제목과 내용에서 주요 키워드 추출
+        
+        뉴스 제목과 선택적으로 본문 내용을 분석하여 검색과 태그에
+        최적화된 키워드를 추출합니다.
+        
+        Args:
+            title: 키워드를 추출할 제목
+            article_content: 선택적 기사 본문 (더 정확한 키워드 추출을 위해)
+            
+        Returns:
+            추출된 키워드 리스트 (최대 5개)
+        """
+        keywords, usage_chunk = self._extract_keywords_with_usage(title, article_content)
+
+        # 토큰 사용량 추적
+        if hasattr(self, "current_article_id") and usage_chunk is not None:
+            self.token_tracker.track_api_call(
+                usage_chunk,
+                "gpt-4.1-nano",
+                self.current_article_id,
+                getattr(self, "current_article_title", None),
+            )
+
+        return keywords
+
+    def _extract_keywords_with_usage(self, title: str, article_content: str = None) -> Tuple[List[str], Any]:
+        """
+        키워드 추출 후 (키워드, API usage 청크)를 반환 (토큰 추적은 호출자가 담당)
+        
+        캐시를 사용했거나 API를 호출하지 않은 경우 usage 청크는 None입니다.
+        """
+        # 같은 모델/제목/본문으로 추출한 적이 있으면 API 호출 없이 재사용
+        # (제목만으로 추출하는 경우 거의 같은 제목의 결과도 재사용)
+        cache_key = self.keyword_cache.make_key(self.model_name, title, article_content)
+        cached_keywords = self.keyword_cache.get(
+            cache_key, self.model_name, title if not article_content else None
+        )
+        if cached_keywords is not None:
+            logger.info(f"캐시된 키워드 사용: {cached_keywords} (캐시 통계: {self.keyword_cache.stats()})")
+            return cached_keywords, None
+        
+        usage_chunk = None
+        try:
+            # ChatGPT API를 사용한 스마트 키워드 추출
+            content_part = f"본문 요약: {article_content[:300]}..." if article_content else ""
+            prompt = _KEYWORDS_PROMPT.substitute(title=title, content=content_part)
+
+            # Rate limiting 적용
+            self.rate_limiter.wait_if_needed()
+            
+            response = self.client.chat.completions.create(
+                model=self.model_name,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.3,
+                max_tokens=200,
+                response_format=_KEYWORDS_JSON_SCHEMA,
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            
+            # 스트리밍 응답을 받는 대로 누적 (마지막 청크에 usage 포함)
+            content_parts = []
+            for chunk in response:
+                if chunk.choices:
+                    content_parts.append(chunk.choices[0].delta.content or "")
+                if getattr(chunk, "usage", None):
+                    usage_chunk = chunk
+            
+            # 응답 파싱
+            content = "".join(content_parts)
+            result = loads_json(content)
+            keywords = result.get("keywords", [])
+            
+            # 유효한 키워드만 필터링
+            valid_keywords = [k.strip() for k in keywords if k.strip() and len(k.strip()) <= 20]
+            
+            logger.info(f"ChatGPT로 추출된 키워드: {valid_keywords[:5]}")
+            # 빈 결과는 캐시하지 않음 (다음 실행에서 다시 추출을 시도하도록)
+            if valid_keywords:
+                self.keyword_cache.set(
+                    cache_key, title, valid_keywords[:5],
+                    model_name=self.model_name, title_only=not article_content,
+                )
+            return valid_keywords[:5], usage_chunk
+            
+        except Exception as e:
+            logger.error(f"ChatGPT 키워드 추출 실패: {e}")
+            # 폴백: 간단한 패턴 기반 추출
+            keywords = []
+
+            # 단어 분리
+            words = title.split()
+
+            for word in words:
+                # 구두점, 괄호, 따옴표를 한 번에 제거
+                clean_word = word.strip(_KEYWORD_STRIP_CHARS)
+
+                # 중요 키워드 체크 (모든 키워드를 한 번의 정규식 탐색으로 확인)
+                if _IMPORTANT_KEYWORDS_RE.search(clean_word) and clean_word not in keywords:
+                    keywords.append(clean_word)
+
+            # 중요 키워드가 없으면 기본 단어 추출
+            if not keywords:
+                keywords = [w.strip(_KEYWORD_STRIP_CHARS) for w in words if len(w) >= 3][:5]
+
+        return keywords[:5], usage_chunk  # 상위 5개만
+
+    def generate_or_update_article(
+        self,
+        rank: int = 1,
+        trends: Optional[Dict[str, Any]] = None,
+        keyword_usage: Optional[List[Any]] = None,
+    ) -> Dict[str, Any]:
+        """
+        스마트하게 기사 생성 또는 업데이트
+        
+        트렌드를 분석하여 지정된 순위의 뉴스에 대한 기사를 생성합니다.
+        기존 관련 기사가 있다면 업데이트하고, 없다면 새로 생성합니다.
+        
+        Args:
+            rank: 생성할 뉴스의 순위 (1-10, 기본값: 1)
+            trends: 이미 분석된 트렌드 결과 (없으면 분석하거나 캐시된 결과 사용)
+            keyword_usage: 일괄 생성에서 미리 추출한 제목 키워드 API의 usage 청크 목록
+                (이 기사의 article_id로 기록한 뒤 비움)
+            
+        Returns:
+            생성된 기사 정보 디텍셔너리 (생성 실패 시 None)
+            {
+                "article_id": 기사 ID,
+                "title": 제목,
+                "content": 본문,
+                "url": 원본 URL,
+                "keywords": 키워드 리스트,
+                "created_at": 생성 시간,
+                "is_new": 새 기사 여부,
+                "status": 상태 메시지
+            }
+        """
+
+        logger.info("=== 스마트 기사 생성 시작 ===")
+
+        # 1. 현재 트렌드 분석
+        logger.info("1단계: 실시간 트렌드 분석")
+        if trends is None:
+            trends = self._get_trends()
+
+        if not trends or not trends.get("hot_news"):
+            logger.error("트렌드 분석 실패")
+            return None
+
+        # 지정된 순위의 뉴스 선택
+        if len(trends["hot_news"]) < rank:
+            logger.warning(f"{rank}위 뉴스가 없음. 1위로 대체")
+            rank = 1
+
+        target_news = trends["hot_news"][rank - 1]
+        title = self.sanitize_exclusive_terms(target_news["title"])  # 독점 보도 표현 제거
+        url = target_news["link"]
+        category = target_news.get("category", None)  # 카테고리 정보 추출
+
+        # 토큰 추적을 위한 article_id 설정
+        timestamp = get_kst_now().strftime("%Y%m%d_%H%M%S")
+        self.current_article_id = f"article_{timestamp}"
+        self.current_article_title = title
+
+        # 일괄 생성에서 미리 추출해 둔 제목 키워드의 토큰 사용량을 이 기사로 기록
+        if keyword_usage:
+            for usage_chunk in keyword_usage:
+                self.token_tracker.track_api_call(
+                    usage_chunk, "gpt-4.1-nano", self.current_article_id, title
+                )
+            keyword_usage.clear()
+
+        logger.info(f"대상 뉴스: {title}")
+        if category:
+            logger.info(f"카테고리: {category}")
 
         # 2. 먼저 심층 분석을 수행하여 소스 기사 URL들을 얻음 (키워드 추출을 위해 순서 변경)
         logger.info("2단계: 심층 분석으로 소스 기사 수집")
@@ -432,7 +1276,7 @@ class SmartArticleGenerator:
         # 트렌드 분석 (한 번만)
         logger.info("📊 실시간 트렌드 분석 중...")
         try:
-            trends = self.trend_analyzer.analyze_realtime_trends()
+            trends = self._get_trends()
             logger.info(f"트렌드 분석 결과: {type(trends)}")
 
             if not trends:
@@ -455,19 +1299,47 @@ class SmartArticleGenerator:
         # 실제 처리할 범위 조정
         actual_end_rank = min(end_rank, available_count)
 
+        # 순위별 제목 키워드 추출은 서로 독립적이므로 병렬로 미리 수행
+        # (API 호출 속도는 공유 RateLimiter가 계속 제한)
+        # 미리 추출하는 시점에는 순위별 article_id가 아직 없으므로 각 순위의 usage 청크는
+        # 그 순위의 기사를 생성할 때 기록하고, 기사를 만들지 않은 순위의 사용량은
+        # 다른 기사에 얹지 않고 배치 단위 오버헤드로 모아 두었다가 마지막에 기록
+        batch_keyword_usage = []
+        ranks = list(range(start_rank, actual_end_rank + 1))
+        titles = {
+            rank: self.sanitize_exclusive_terms(trends["hot_news"][rank - 1]["title"])  # 독점 보도 표현 제거
+            for rank in ranks
+        }
+        with ThreadPoolExecutor(max_workers=max(1, min(4, len(ranks)))) as pool:
+            keyword_futures = {
+                rank: pool.submit(self._extract_keywords_with_usage, titles[rank], None)
+                for rank in ranks
+            }
+        # 미리 추출한 키워드를 캐시 파일에 한 번에 기록
+        self.keyword_cache.flush()
+
+        # 중복 생성 판단 기준 시각 (순위마다 새로 만들지 않고 배치 시작 시 한 번만 계산)
+        batch_started_at = datetime.now(KST)
+        now_epoch = int(batch_started_at.timestamp())
+
         # 각 순위의 뉴스 처리
-        for rank in range(start_rank, actual_end_rank + 1):
+        for rank in ranks:
             logger.info(f"\n{'─'*50}")
             logger.info(f"📰 {rank}위 뉴스 처리 중...")
 
             target_news = trends["hot_news"][rank - 1]
-            title = self.sanitize_exclusive_terms(target_news["title"])  # 독점 보도 표현 제거
+            title = titles[rank]
             url = target_news["link"]
 
+            # 다음 순위의 클러스터 기사를 현재 순위 처리 중에 미리 수집 (네트워크 대기 겹치기)
+            if rank < actual_end_rank:
+                self.article_analyzer.prefetch_cluster(trends["hot_news"][rank]["link"])
+
             logger.info(f"제목: {title[:50]}...")
 
             # 키워드 추출 (임시로 제목만 사용)
-            keywords = self.extract_keywords_from_title(title, None)
+            keywords, usage_chunk = keyword_futures[rank].result()
+            rank_keyword_usage = [usage_chunk] if usage_chunk is not None else []
             logger.info(f"키워드: {keywords}")
 
             # 관련 기사 확인
@@ -478,28 +1350,21 @@ class SmartArticleGenerator:
                 existing_article = self.cache_manager.load_article(related_article_id)
                 if existing_article:
                     # 마지막 업데이트 시간 확인 (업데이트가 있었다면 그 시간, 없으면 생성 시간)
+                    # 정수 epoch가 저장된 캐시는 문자열 파싱 없이 바로 비교
+                    last_epoch = existing_article.get("last_updated_epoch")
                     last_time = existing_article.get(
                         "last_updated", existing_article.get("created_at", "")
                     )
-                    if last_time:
+                    if last_epoch is not None or last_time:
                         try:
-                            # ISO format 문자열을 파싱하고 timezone 처리
-                            if last_time.endswith("Z"):
-                                last_datetime = datetime.fromisoformat(
-                                    last_time.replace("Z", "+00:00")
-                                )
-                            else:
-                                last_datetime = datetime.fromisoformat(last_time)
-
-                            # timezone이 없으면 UTC로 가정
-                            if last_datetime.tzinfo is None:
-                                last_datetime = last_datetime.replace(tzinfo=timezone.utc)
+                            if last_epoch is None:
+                                # 이전 형식의 캐시: ISO format 문자열을 파싱하고 timezone 처리
+                                last_epoch = int(_parse_iso_utc(last_time).timestamp())
 
-                            # 현재 시간도 UTC로
-                            current_time = datetime.now(KST)
-                            time_diff = (current_time - last_datetime).total_seconds() / 3600
+                            age_seconds = now_epoch - last_epoch
 
-                            if time_diff < 1.0:  # 1시간 이내
+                            if age_seconds < 3600:  # 1시간 이내
+                                time_diff = age_seconds / 3600
                                 logger.info(
                                     f"⏭️  건너뜀: 동일 토픽 기사가 {time_diff:.1f}시간 전에 작성/업데이트됨"
                                 )
@@ -512,14 +1377,17 @@ class SmartArticleGenerator:
                                     }
                                 )
                                 results["total_skipped"] += 1
+                                batch_keyword_usage.extend(rank_keyword_usage)
                                 continue
                         except Exception as e:
-                            logger.debug(f"Created time parsing failed: {e}")
+                            logger.debug("Created time parsing failed: %s", e)
 
             # 새 기사 생성
             try:
                 logger.info("✍️  새 기사 생성 중...")
-                result = self.generate_or_update_article(rank)
+                result = self.generate_or_update_article(
+                    rank, trends=trends, keyword_usage=rank_keyword_usage
+                )
 
                 if result and result["status"] in ["created", "updated"]:
                     if result["status"] == "created":
@@ -565,11 +1433,23 @@ class SmartArticleGenerator:
                 results["failed"].append({"rank": rank, "title": title, "reason": str(e)})
                 results["total_failed"] += 1
 
-            # 잠시 대기 (API 제한 고려)
-            if rank < actual_end_rank:
-                import time
+            # 기사 ID를 정하기 전에 생성이 중단되어 기록되지 않은 사용량도 배치 오버헤드로 처리
+            batch_keyword_usage.extend(rank_keyword_usage)
 
-                time.sleep(2)
+        # 건너뛴 순위 등으로 사용되지 않은 미리 수집 작업 정리
+        self.article_analyzer.clear_cluster_prefetches()
+
+        # 기사를 만들지 않은 순위의 키워드 사용량은 배치 ID로 기록 (기사 수에는 포함되지 않음)
+        if batch_keyword_usage:
+            batch_id = f"{TokenTracker.BATCH_ID_PREFIX}{batch_started_at.strftime('%Y%m%d_%H%M%S')}"
+            for usage_chunk in batch_keyword_usage:
+                self.token_tracker.track_api_call(
+                    usage_chunk, "gpt-4.1-nano", batch_id, "배치 제목 키워드 추출 (기사 미생성 순위)"
+                )
+            try:
+                self.token_tracker.flush()
+            except Exception as e:
+                logger.error(f"토큰 사용량 메타데이터 기록 실패 (다음 기록 때 재시도): {e}")
 
         # 결과 요약 출력
         logger.info(f"\n{'='*60}")
@@ -759,19 +1639,18 @@ class SmartArticleGenerator:
         article_content = analysis_result["comprehensive_article"]
         
         # 품질 평가 수행
-        quality_rating, quality_emoji, quality_details = self.quality_evaluator.evaluate_article({
-            "comprehensive_article": article_content,
-            "generated_article": article_content
-        })
+        quality_rating, quality_emoji, quality_details = self._evaluate_quality(article_content)
         
-        logger.info(f"기사 품질 평가 결과: {quality_rating} {quality_emoji}")
+        if self.enable_quality_eval:
+            logger.info(f"기사 품질 평가 결과: {quality_rating} {quality_emoji}")
 
         # 태그 확인 및 생성
         logger.info("5단계: 기사 최종 처리")
         tags = analysis_result.get("tags", {"category_tags": [], "content_tags": []})
+        summary_lines = None
         if not tags.get("category_tags") or not tags.get("content_tags"):
             logger.info("태그가 없거나 불완전함. 태그 재생성 중...")
-            tags = self._generate_tags_for_article(title, article_content)
+            tags, summary_lines = self._generate_tags_and_summary(title, article_content)
 
         # 최종 기사 데이터
         final_article_data = {
@@ -823,44 +1702,38 @@ class SmartArticleGenerator:
             first_paragraph = article_content.split('\n\n')[0] if article_content else ""
             final_article_data["three_line_summary"] = first_paragraph[:200]  # 최대 200자
         
-        image_result = generate_news_image(final_article_data)
+        # 이미지 생성 모듈은 실제로 이미지를 만들 때만 로드 (Pillow/Runware 등 무거운 의존성)
+        from scripts.image_generator import generate_news_image
+
+        # 이미지 생성(가장 오래 걸리는 단계)을 백그라운드에서 진행하는 동안 요약 섹션(LLM 호출) 생성
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            image_future = pool.submit(generate_news_image, final_article_data)
+            summary_section = self._generate_summary_section(final_article_data, summary_lines)
+            image_result = image_future.result()
+
         if image_result and image_result.get("success"):
             final_article_data["generated_image_path"] = image_result["image_path"]
             logger.info(f"이미지 생성 완료: {image_result['image_path']}")
-            # 캐시 업데이트
-            self.cache_manager.save_article_cache(final_article_data, keywords)
+            # 캐시 업데이트 (이미지 경로만 갱신)
+            self.cache_manager.patch_article_fields(
+                article_id, {"generated_image_path": image_result["image_path"]}
+            )
         else:
             logger.warning(f"이미지 생성 실패: {image_result.get('error', 'Unknown error') if image_result else 'No result'}")
 
-        # HTML 생성
+        # HTML 생성 (분석 시간과 파일명 타임스탬프는 같은 시각 사용)
+        now = get_kst_now()
         html_output = self._generate_html(
-            final_article_data, analysis_result.get("related_articles_count", 1)
+            final_article_data, analysis_result.get("related_articles_count", 1),
+            summary_section=summary_section, now=now,
         )
 
         # 결과 저장
-        ensure_output_dirs()
-        output_dir = get_smart_articles_dir()
-
-        timestamp = get_kst_now().strftime("%Y%m%d_%H%M%S")
-
-        # 버전별 파일명
-        version_filename = f"article_{article_id}_v{1}.html"
-        version_path = f"{output_dir}/versions/{version_filename}"
-
-        # 버전 디렉토리 생성
-        os.makedirs(f"{output_dir}/versions", exist_ok=True)
-
-        # 버전별 HTML 저장
-        with open(version_path, "w", encoding="utf-8") as f:
-            f.write(html_output)
-
-        # 최신 버전 링크 (기존 방식)
-        html_path = f"{output_dir}/article_{timestamp}.html"
-        with open(html_path, "w", encoding="utf-8") as f:
-            f.write(html_output)
+        paths = self._persist_article(article_id, 1, html_output, now=now)
+        html_path = paths["html_path"]
 
         logger.info(f"새 기사 생성 완료: {html_path}")
-        logger.info(f"버전 파일 저장: {version_path}")
+        logger.info(f"버전 파일 저장: {paths['version_path']}")
 
         return {
             "status": "created",
@@ -900,22 +1773,31 @@ class SmartArticleGenerator:
         # 새로운 기사 내용
         updated_content = analysis_result["comprehensive_article"]
         
-        # 품질 재평가
-        logger.info("업데이트된 기사 품질 평가 중...")
-        quality_rating, quality_emoji, quality_details = self.quality_evaluator.evaluate_article({
-            "comprehensive_article": updated_content,
-            "generated_article": updated_content
-        })
-        
-        logger.info(f"업데이트된 기사 품질: {quality_rating} {quality_emoji}")
-        
-        # 태그 확인 및 생성
+        # 태그 확인 (없으면 요약과 함께 재생성, 있으면 요약만 생성)
         tags = analysis_result.get("tags", {"category_tags": [], "content_tags": []})
-        if not tags.get("category_tags") or not tags.get("content_tags"):
+        needs_tags = not tags.get("category_tags") or not tags.get("content_tags")
+        
+        # LLM 호출(태그/요약 생성)과 품질 재평가
+        if needs_tags:
             logger.info("태그 재생성 중...")
-            tags = self._generate_tags_for_article(
-                cached_data["main_article"]["title"], updated_content
+            llm_result, quality = self._run_with_quality_eval(
+                updated_content, self._generate_tags_and_summary,
+                cached_data["main_article"]["title"], updated_content,
             )
+        else:
+            llm_result, quality = self._run_with_quality_eval(
+                updated_content, self._generate_summary_section,
+                {"comprehensive_article": updated_content},
+            )
+        quality_rating, quality_emoji, quality_details = quality
+        
+        if needs_tags:
+            tags, summary_lines = llm_result
+            summary_section = (
+                self._generate_summary_section(cached_data, summary_lines) if summary_lines else None
+            )
+        else:
+            summary_section = llm_result
         
         # 버전 관리자를 통한 새 버전 생성
         article_data = {
@@ -932,21 +1814,22 @@ class SmartArticleGenerator:
             article_data, parent_id=related_article_id
         )
         
-        # 캐시 업데이트
-        cached_data["generated_article"] = updated_content
-        cached_data["comprehensive_article"] = updated_content
-        cached_data["topic_id"] = new_article_id
-        cached_data["version"] = self.version_manager.topic_index[new_article_id]["version"]
-        cached_data["version_history"] = self.version_manager.get_article_history(new_article_id)
-        cached_data["tags"] = tags
-        cached_data["quality_rating"] = quality_rating
-        cached_data["quality_emoji"] = quality_emoji
-        cached_data["quality_details"] = quality_details
-        cached_data["source_articles"] = source_articles or []  # 소스 기사 URL 업데이트
-        
-        # 분석 결과 업데이트
-        cached_data["analysis"] = analysis_result.get("analysis", {})
-        cached_data["related_articles"] = analysis_result.get("related_articles", [])
+        # 캐시 업데이트 (바뀐 필드만 한 번에 반영)
+        cached_data.update({
+            "generated_article": updated_content,
+            "comprehensive_article": updated_content,
+            "topic_id": new_article_id,
+            "version": self.version_manager.topic_index[new_article_id]["version"],
+            "version_history": self.version_manager.get_article_history(new_article_id),
+            "tags": tags,
+            "quality_rating": quality_rating,
+            "quality_emoji": quality_emoji,
+            "quality_details": quality_details,
+            "source_articles": source_articles or [],  # 소스 기사 URL 업데이트
+            # 분석 결과 업데이트
+            "analysis": analysis_result.get("analysis", {}),
+            "related_articles": analysis_result.get("related_articles", []),
+        })
         
         # 새 버전으로 캐시 저장
         self.cache_manager.save_article_cache(cached_data, cached_data.get("keywords", []))
@@ -955,37 +1838,22 @@ class SmartArticleGenerator:
         html_output = self._generate_html(
             cached_data, 
             analysis_result.get("related_articles_count", 1), 
-            is_update=True
+            is_update=True,
+            summary_section=summary_section,
         )
         
-        # 결과 저장
-        ensure_output_dirs()
-        output_dir = get_smart_articles_dir()
-        
-        # 버전별 파일명
-        version_filename = f"article_{new_article_id}_v{cached_data['version']}.html"
-        version_path = f"{output_dir}/versions/{version_filename}"
-        
-        # 버전 디렉토리 생성
-        os.makedirs(f"{output_dir}/versions", exist_ok=True)
-        
-        # 버전별 HTML 저장
-        with open(version_path, "w", encoding="utf-8") as f:
-            f.write(html_output)
-        
-        logger.info(f"업데이트된 기사 저장: {version_path}")
-        
-        # 최신 버전 링크 업데이트
-        latest_filename = f"article_{new_article_id}_latest.html"
-        latest_path = f"{output_dir}/{latest_filename}"
-        with open(latest_path, "w", encoding="utf-8") as f:
-            f.write(html_output)
+        # 결과 저장 (버전별 HTML, 최신 HTML, JSON 메타데이터)
+        paths = self._persist_article(
+            new_article_id,
+            cached_data["version"],
+            html_output,
+            latest_filename=f"article_{new_article_id}_latest.html",
+            metadata=cached_data,
+        )
+        latest_path = paths["html_path"]
+        json_path = paths["json_path"]
         
-        # JSON 메타데이터 저장
-        json_filename = f"article_{new_article_id}.json"
-        json_path = f"{output_dir}/{json_filename}"
-        with open(json_path, "w", encoding="utf-8") as f:
-            json.dump(cached_data, f, ensure_ascii=False, indent=2)
+        logger.info(f"업데이트된 기사 저장: {paths['version_path']}")
         
         return {
             "status": "updated",
@@ -1024,31 +1892,27 @@ class SmartArticleGenerator:
             업데이트 결과 디텍셔너리
         """
 
+        # 업데이트 시각 (프롬프트 날짜, HTML 분석 시간, 파일명 타임스탬프에 공통 사용)
+        now = get_kst_now()
+
         # 새로운 정보로 추가 분석
         new_analysis = {
             "new_developments": updates.get("new_developments", []),
-            "updated_at": get_kst_now().isoformat(),
+            "updated_at": now.isoformat(),
         }
 
         # 업데이트된 기사 생성
         updated_content = self._generate_updated_content(
-            cached_data["generated_article"], updates, new_articles
+            cached_data["generated_article"], updates, new_articles, now=now
         )
 
-        # 품질 재평가
-        logger.info("업데이트된 기사 품질 평가 중...")
-        quality_rating, quality_emoji, quality_details = self.quality_evaluator.evaluate_article({
-            "comprehensive_article": updated_content,
-            "generated_article": updated_content
-        })
-        
-        logger.info(f"업데이트된 기사 품질: {quality_rating} {quality_emoji}")
-
-        # 업데이트 시에도 태그 재생성
+        # 업데이트 시에도 태그 재생성 (품질 재평가를 켠 경우 함께 진행)
         logger.info("기사 업데이트 시 태그 재생성 중...")
-        updated_tags = self._generate_tags_for_article(
-            cached_data["main_article"]["title"], updated_content
+        (updated_tags, summary_lines), quality = self._run_with_quality_eval(
+            updated_content, self._generate_tags_and_summary,
+            cached_data["main_article"]["title"], updated_content,
         )
+        quality_rating, quality_emoji, quality_details = quality
 
         # 버전 관리자를 통한 새 버전 생성
         article_data = {
@@ -1064,55 +1928,44 @@ class SmartArticleGenerator:
             article_data, parent_id=related_article_id
         )
 
-        # 캐시 업데이트
-        cached_data["generated_article"] = updated_content
-        cached_data["comprehensive_article"] = updated_content
-        cached_data["topic_id"] = new_article_id
-        cached_data["version"] = self.version_manager.topic_index[new_article_id]["version"]
-        cached_data["version_history"] = self.version_manager.get_article_history(new_article_id)
-        cached_data["tags"] = updated_tags  # 태그도 업데이트
-        cached_data["quality_rating"] = quality_rating
-        cached_data["quality_emoji"] = quality_emoji
-        cached_data["quality_details"] = quality_details
+        # 캐시 업데이트 (바뀐 필드만 한 번에 반영)
+        cached_data.update({
+            "generated_article": updated_content,
+            "comprehensive_article": updated_content,
+            "topic_id": new_article_id,
+            "version": self.version_manager.topic_index[new_article_id]["version"],
+            "version_history": self.version_manager.get_article_history(new_article_id),
+            "tags": updated_tags,  # 태그도 업데이트
+            "quality_rating": quality_rating,
+            "quality_emoji": quality_emoji,
+            "quality_details": quality_details,
+        })
+        version = cached_data["version"]
 
         # 새 버전으로 캐시 저장
         self.cache_manager.save_article_cache(cached_data, cached_data.get("keywords", []))
 
-        updated_data = cached_data
-
         # HTML 생성 (버전 히스토리 포함)
-        html_output = self._generate_html(updated_data, len(new_articles), is_update=True)
+        html_output = self._generate_html(
+            cached_data, len(new_articles), is_update=True,
+            summary_section=self._generate_summary_section(cached_data, summary_lines) if summary_lines else None,
+            now=now,
+        )
 
         # 결과 저장
-        ensure_output_dirs()
-        output_dir = get_smart_articles_dir()
-        timestamp = get_kst_now().strftime("%Y%m%d_%H%M%S")
-
-        # 버전별 파일명
-        version_filename = f"article_{new_article_id}_v{updated_data['version']}.html"
-        version_path = f"{output_dir}/versions/{version_filename}"
-
-        # 버전 디렉토리 생성
-        os.makedirs(f"{output_dir}/versions", exist_ok=True)
-
-        # 버전별 HTML 저장
-        with open(version_path, "w", encoding="utf-8") as f:
-            f.write(html_output)
+        paths = self._persist_article(new_article_id, version, html_output, now=now)
+        html_path = paths["html_path"]
+        version_path = paths["version_path"]
 
-        # 최신 버전 링크 (기존 방식)
-        html_path = f"{output_dir}/article_{timestamp}.html"
-        with open(html_path, "w", encoding="utf-8") as f:
-            f.write(html_output)
-
-        logger.info(f"기사 업데이트 완료: {html_path} (버전 {updated_data['version']})")
+        logger.info(f"기사 업데이트 완료: {html_path} (버전 {version})")
         logger.info(f"버전 파일 저장: {version_path}")
 
         return {
             "status": "updated",
-            "message": f'기사 업데이트 완료 (버전 {updated_data["version"]})',
+            "message": f"기사 업데이트 완료 (버전 {version})",
             "article": updated_content,
             "topic_id": new_article_id,
-            "version": updated_data["version"],
+            "version": version,
             "html_path": html_path,
             "updates": updates,
             "significant_changes": significant_changes,
@@ -1120,12 +1973,13 @@ class SmartArticleGenerator:
         }
 
     def _generate_updated_content(
-        self, original_article: str, updates: Dict, new_articles: List[Dict]
+        self, original_article: str, updates: Dict, new_articles: List[Dict],
+        now: Optional[datetime] = None
     ) -> str:
         """업데이트된 기사 내용 생성"""
 
         # 현재 날짜
-        current_date = get_kst_now().strftime("%Y년 %m월 %d일")
+        current_date = (now or get_kst_now()).strftime("%Y년 %m월 %d일")
 
         # 새로운 정보 요약 (출처 URL 포함)
         new_info_summary = []
@@ -1153,6 +2007,11 @@ class SmartArticleGenerator:
             if url:
                 article_sources.append(f"- [{title}]({url})")
 
+        # 프롬프트에 넣을 목록은 미리 한 번씩만 합쳐 두고, 기존 기사 본문은 복사 없이 그대로 삽입
+        new_info_text = "\n".join(new_info_summary)
+        source_urls_text = "\n".join(source_urls) if source_urls else "(URL 정보 없음)"
+        article_sources_text = "\n".join(article_sources) if article_sources else "(관련 기사 없음)"
+
         prompt = f"""
 다음은 기존 기사입니다:
 
@@ -1160,13 +2019,13 @@ class SmartArticleGenerator:
 
 다음은 새롭게 발견된 정보입니다:
 
-{chr(10).join(new_info_summary)}
+{new_info_text}
 
 출처 URL:
-{chr(10).join(source_urls) if source_urls else '(URL 정보 없음)'}
+{source_urls_text}
 
 관련 기사들:
-{chr(10).join(article_sources) if article_sources else '(관련 기사 없음)'}
+{article_sources_text}
 
 현재 날짜: {current_date}
 
@@ -1231,13 +2090,15 @@ class SmartArticleGenerator:
             새로고침 결과 디텍셔너리
         """
 
+        now = get_kst_now()
+
         # 기존 분석 데이터는 유지하면서 표현만 새로고침
         prompt = f"""
 다음은 {cached_data['last_updated']}에 작성된 기사입니다:
 
 {cached_data['generated_article']}
 
-현재 날짜: {get_kst_now().strftime("%Y년 %m월 %d일")}
+현재 날짜: {now.strftime("%Y년 %m월 %d일")}
 
 위 기사를 현재 시점에 맞게 새로고침해주세요.
 - 내용은 동일하게 유지
@@ -1268,7 +2129,7 @@ class SmartArticleGenerator:
                 "article": refreshed_content,
                 "topic_id": cached_data["topic_id"],
                 "version": cached_data["version"],
-                "last_updated": get_kst_now().isoformat(),
+                "last_updated": now.isoformat(),
             }
 
         except Exception as e:
@@ -1281,6 +2142,104 @@ class SmartArticleGenerator:
                 "version": cached_data["version"],
             }
 
+    def _generate_article_metadata(self, title: str, content: str) -> Optional[Dict[str, Any]]:
+        """
+        3줄 요약과 태그를 한 번의 API 호출로 생성
+        
+        _generate_three_line_summary와 _generate_tags_for_article을 따로 호출하면
+        요청이 두 번 오가므로, 두 결과를 하나의 JSON 응답으로 받습니다.
+        
+        Args:
+            title: 기사 제목
+            content: 기사 본문
+            
+        Returns:
+            {"tags": 태그 디텍셔너리, "summary_lines": 요약 문장 리스트 또는 None}
+            실패 시 None (호출자는 개별 생성 방식으로 폴백)
+        """
+        if not content:
+            return None
+
+        try:
+            prompt = f"""
+다음 뉴스 기사의 3줄 요약과 태그를 생성해주세요.
+
+제목: {title}
+
+요약 규칙 (line1, line2, line3):
+1. 반드시 3개의 문장으로 작성 (더 많거나 적으면 안됨)
+2. 각 문장은 핵심 정보를 담되, 너무 길지 않게
+3. 첫 줄: 가장 중요한 핵심 사실
+4. 둘 째 줄: 주요 세부사항이나 배경
+5. 셋 째 줄: 영향이나 전망
+6. 각 줄은 완전한 문장으로 작성
+7. 불필요한 수식어나 감정적 표현 제거
+
+태그 규칙:
+1. category_tags (카테고리 태그): 최대 2개
+   - 다음 중에서만 선택: 정치, 경제, 사회, 생활/문화, 국제, IT/과학
+2. content_tags (내용 태그): 3-5개
+   - 기사의 핵심 키워드, 인물명, 기업명, 사건명 등
+   - 너무 일반적인 단어보다는 구체적인 태그 선호
+
+기사 내용:
+{content[:2000]}
+"""
+
+            # Rate limiting 적용
+            self.rate_limiter.wait_if_needed()
+
+            response = self.client.chat.completions.create(
+                model=self.model_name,
+                messages=[
+                    {"role": "system", "content": "You must respond ONLY with valid JSON format. No other text or explanation."},
+                    {"role": "user", "content": prompt}
+                ],
+                temperature=0.3,
+                max_tokens=500,
+                response_format=_ARTICLE_METADATA_JSON_SCHEMA,
+            )
+
+            # 토큰 사용량 추적
+            if hasattr(self, "current_article_id"):
+                self.token_tracker.track_api_call(
+                    response,
+                    self.model_name,
+                    self.current_article_id,
+                    getattr(self, "current_article_title", None),
+                )
+
+            response_text = response.choices[0].message.content.strip()
+            metadata = loads_json(response_text)
+
+            tags = self._normalize_tags(title, content, metadata)
+            summary_lines = [
+                line.strip()
+                for line in (metadata.get("line1", ""), metadata.get("line2", ""), metadata.get("line3", ""))
+                if line.strip()
+            ]
+
+            return {"tags": tags, "summary_lines": summary_lines or None}
+
+        except Exception as e:
+            logger.warning(f"요약/태그 통합 생성 실패, 개별 생성으로 폴백: {e}")
+            return None
+
+    def _generate_tags_and_summary(
+        self, title: str, content: str
+    ) -> Tuple[Dict[str, Any], Optional[List[str]]]:
+        """
+        태그와 3줄 요약 문장 생성 (통합 호출 실패 시 태그만 개별 생성)
+        
+        Returns:
+            (태그 디텍셔너리, 요약 문장 리스트 또는 None)
+            요약이 None이면 HTML 생성 시 요약을 따로 생성합니다.
+        """
+        metadata = self._generate_article_metadata(title, content)
+        if metadata:
+            return metadata["tags"], metadata["summary_lines"]
+        return self._generate_tags_for_article(title, content), None
+
     def _generate_tags_for_article(self, title: str, content: str) -> Dict[str, Any]:
         """
         기사 제목과 내용을 기반으로 태그 생성
@@ -1349,42 +2308,9 @@ JSON 형식으로 응답해주세요:
             elif "```" in response_text:
                 response_text = response_text.split("```")[1].split("```")[0].strip()
 
-            tags = json.loads(response_text)
-
-            # 유효성 검사 및 기본값 처리
-            if not isinstance(tags, dict):
-                raise ValueError("Invalid tags format")
-
-            # category_tags 검증
-            valid_categories = ["정치", "경제", "사회", "생활/문화", "국제", "IT/과학"]
-            category_tags = []
-            for tag in tags.get("category_tags", []):
-                if tag in valid_categories:
-                    category_tags.append(tag)
-
-            # 최소 1개는 있어야 함
-            if not category_tags:
-                # 제목에서 카테고리 추측
-                if any(word in title for word in ["대통령", "국회", "정부", "선거", "정당"]):
-                    category_tags = ["정치"]
-                elif any(word in title for word in ["경제", "금융", "주식", "부동산", "기업"]):
-                    category_tags = ["경제"]
-                elif any(word in title for word in ["AI", "인공지능", "IT", "기술", "과학"]):
-                    category_tags = ["IT/과학"]
-                else:
-                    category_tags = ["사회"]
-
-            # content_tags 검증
-            content_tags = tags.get("content_tags", [])
-            if not content_tags:
-                # 제목과 내용에서 주요 단어 추출
-                keywords = self.extract_keywords_from_title(title, comprehensive_article[:500])
-                content_tags = keywords[:3] if keywords else ["뉴스"]
+            tags = loads_json(response_text)
 
-            return {
-                "category_tags": category_tags[:2],  # 최대 2개
-                "content_tags": content_tags[:5],  # 최대 5개
-            }
+            return self._normalize_tags(title, content, tags)
 
         except Exception as e:
             logger.error(f"태그 생성 실패: {e}")
@@ -1394,9 +2320,51 @@ JSON 형식으로 응답해주세요:
                 "content_tags": self.extract_keywords_from_title(title, None)[:3] or ["뉴스"],
             }
 
-    def _generate_summary_section(self, article_data: Dict) -> str:
+    def _normalize_tags(self, title: str, content: str, tags: Any) -> Dict[str, Any]:
+        """
+        LLM이 생성한 태그 검증 및 기본값 처리
+        
+        Args:
+            title: 기사 제목
+            content: 기사 본문
+            tags: LLM 응답에서 파싱한 태그 디텍셔너리
+            
+        Returns:
+            태그 디텍셔너리 (카테고리 태그 최대 2개, 내용 태그 최대 5개)
+        """
+        # 유효성 검사 및 기본값 처리
+        if not isinstance(tags, dict):
+            raise ValueError("Invalid tags format")
+
+        # category_tags 검증
+        category_tags = [tag for tag in tags.get("category_tags", []) if tag in VALID_CATEGORY_TAGS]
+
+        # 최소 1개는 있어야 함
+        if not category_tags:
+            # 제목에서 카테고리 추측 (여러 카테고리가 걸리면 우선순위가 높은 것 선택)
+            matched = {_CATEGORY_BY_KEYWORD[kw] for kw in _CATEGORY_KEYWORDS_RE.findall(title)}
+            category_tags = next(
+                ([category] for category, _ in CATEGORY_FALLBACK_KEYWORDS if category in matched),
+                ["사회"],
+            )
+
+        # content_tags 검증
+        content_tags = tags.get("content_tags", [])
+        if not content_tags:
+            # 제목과 내용에서 주요 단어 추출
+            keywords = self.extract_keywords_from_title(title, content[:500])
+            content_tags = keywords[:3] if keywords else ["뉴스"]
+
+        return {
+            "category_tags": category_tags[:2],  # 최대 2개
+            "content_tags": content_tags[:5],  # 최대 5개
+        }
+
+    def _generate_summary_section(
+        self, article_data: Dict, summary_lines: Optional[List[str]] = None
+    ) -> str:
         """세줄 요약 및 품질 평가 섹션 생성 - 요약 실패 시 섹션 자체를 표시하지 않음"""
-        summary = self._generate_three_line_summary(article_data)
+        summary = self._generate_three_line_summary(article_data, summary_lines)
         if summary is None:
             return ""  # 요약 생성 실패 시 빈 문자열 반환
         
@@ -1419,8 +2387,20 @@ JSON 형식으로 응답해주세요:
         </div>
         """
 
-    def _generate_three_line_summary(self, article_data: Dict) -> str:
-        """기사의 3줄 요약 생성"""
+    def _format_summary_lines(self, lines: List[str]) -> str:
+        """요약 문장들을 번호가 붙은 HTML 문단으로 변환 (최대 3줄)"""
+        html_summary = ""
+        for i, line in enumerate(lines[:3]):
+            html_summary += f'<p style="margin: 8px 0;"><strong>{i+1}.</strong> {line}</p>\n'
+        return html_summary
+
+    def _generate_three_line_summary(
+        self, article_data: Dict, summary_lines: Optional[List[str]] = None
+    ) -> str:
+        """기사의 3줄 요약 생성 (summary_lines가 주어지면 API 호출 없이 HTML로만 변환)"""
+        if summary_lines is not None:
+            return self._format_summary_lines(summary_lines)
+
         try:
             # 기사 내용 추출
             article_content = article_data.get(
@@ -1505,8 +2485,7 @@ JSON 형식으로 응답해주세요:
 
             # JSON 응답 파싱
             try:
-                import json
-                summary_json = json.loads(summary)
+                summary_json = loads_json(summary)
                 
                 # JSON에서 3줄 추출
                 cleaned_lines = [
@@ -1541,1131 +2520,205 @@ JSON 형식으로 응답해주세요:
                     return "<p>요약을 생성할 수 없습니다.</p>"
 
             # HTML 형식으로 변환
-            html_summary = ""
-            for i, line in enumerate(cleaned_lines[:3]):
-                html_summary += f'<p style="margin: 8px 0;"><strong>{i+1}.</strong> {line}</p>\n'
-
-            return html_summary
-
-        except Exception as e:
-            logger.error(f"3줄 요약 생성 실패: {e}")
-            return None  # 요약 생성 실패 시 None 반환
-
-    def _convert_markdown_to_html(self, text: str) -> str:
-        """마크다운 텍스트를 HTML로 변환"""
-        
-        # Markdown 라이브러리 설정
-        # extensions:
-        # - extra: 테이블, 코드 블록, 각주, 약어, 속성 리스트 등 추가 기능
-        # - nl2br: 줄바꿈을 <br> 태그로 변환
-        # - sane_lists: 더 나은 리스트 처리
-        # - smarty: 스마트 따옴표, 대시 등
-        md = markdown.Markdown(extensions=['extra', 'nl2br', 'sane_lists', 'smarty'])
-        
-        # 기사 제목 처리를 위한 전처리
-        # 첫 번째 # 제목을 찾아서 h2로 변환하고 스타일 적용
-        lines = text.split('\n')
-        processed_lines = []
-        article_title_found = False
-        
-        for line in lines:
-            if line.startswith('# ') and not article_title_found:
-                # 첫 번째 h1 제목은 건너뛰기 (이미 header에 표시됨)
-                article_title_found = True
-                continue  # 이 줄을 건너뛰고 다음 줄로
-            else:
-                processed_lines.append(line)
-        
-        # 다시 합치기
-        processed_text = '\n'.join(processed_lines)
-        
-        # Markdown을 HTML로 변환
-        html = md.convert(processed_text)
-        
-        # 후처리: 외부 링크에만 target="_blank" 추가
-        # 내부 링크: /, #, /index.html, /article_xxx.html 등으로 시작하는 경우
-        # 외부 링크: http://, https://, //로 시작하는 경우
-        def add_target_blank(match):
-            href = match.group(1)
-            # 외부 링크인 경우에만 target="_blank" 추가
-            if href.startswith(('http://', 'https://', '//')):
-                return f'<a href="{href}" target="_blank">'
-            else:
-                return f'<a href="{href}">'
-        
-        html = re.sub(r'<a href="([^"]+)">', add_target_blank, html)
-        
-        # 후처리: 모든 h2를 h3로 변경 (첫 번째 제목을 제거했으므로)
-        html = html.replace('<h2>', '<h3>').replace('</h2>', '</h3>')
-        
-        return html
-
-    def _generate_html(
-        self, article_data: Dict, related_count: int, is_update: bool = False
-    ) -> str:
-        """
-        HTML 출력 생성
-        
-        기사 데이터를 바탕으로 완전한 HTML 페이지를 생성합니다.
-        
-        Args:
-            article_data: 기사 데이터 디텍셔너리
-            related_count: 관련 기사 수
-            is_update: 업데이트된 기사인지 여부
-            
-        Returns:
-            완전한 HTML 문서
-        """
-
-        # 기본 템플릿
-        current_time = get_kst_now().strftime("%Y-%m-%d %H:%M:%S")
-        version_info = f"(버전 {article_data.get('version', 1)})" if is_update else ""
-
-        # comprehensive_article에서 제목 추출
-        # 1. 먼저 generated_title이 있는지 확인 (가장 우선순위)
-        comprehensive_title = article_data.get('generated_title', None)
-        
-        # 2. generated_title이 없으면 comprehensive_article 내용에서 찾기
-        if not comprehensive_title:
-            comprehensive_content = article_data.get('comprehensive_article', '')
-            if comprehensive_content:
-                # 마크다운 형식에서 첫 번째 # 제목 찾기
-                import re
-                title_match = re.search(r'^#\s+(.+?)$', comprehensive_content, re.MULTILINE)
-                if title_match:
-                    comprehensive_title = title_match.group(1).strip()
-        
-        # 3. 여전히 제목을 찾지 못했다면 main_article 제목 사용 (폴백)
-        if not comprehensive_title:
-            comprehensive_title = article_data["main_article"]["title"]
-        
-        # 제목에서 독점 보도 표현 제거
-        clean_title = self.sanitize_exclusive_terms(comprehensive_title)
-        
-        # 태그 정보 추출
-        tags = article_data.get("tags", {})
-        category_tags = tags.get("category_tags", [])
-        content_tags = tags.get("content_tags", [])
-        all_tags = category_tags + content_tags
-
-        html_template = f"""<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{clean_title} - {current_time}</title>
-    <link rel="icon" type="image/svg+xml" href="/static/favicon.svg">
-    <link rel="alternate icon" href="/static/favicon.svg">
-    <meta name="article-tags" content="{','.join(all_tags)}">{f'''
-    <meta name="article-category-tags" content="{','.join(category_tags)}">''' if category_tags else ''}{f'''
-    <meta name="article-content-tags" content="{','.join(content_tags)}">''' if content_tags else ''}
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 20px;
-            line-height: 1.8;
-            background: #f5f5f5;
-        }}
-        .container {{
-            background: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        .header {{
-            background: #f8f9fa;
-            padding: 20px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-        }}
-        .version-badge {{
-            background: #17a2b8;
-            color: white;
-            padding: 5px 15px;
-            border-radius: 20px;
-            display: inline-block;
-            font-weight: bold;
-            margin-bottom: 10px;
-        }}
-        .update-info {{
-            background: #d4edda;
-            border: 1px solid #c3e6cb;
-            padding: 15px;
-            border-radius: 5px;
-            margin: 20px 0;
-        }}
-        .article-content {{
-            margin: 30px 0;
-            font-size: 17px;
-            line-height: 1.9;
-        }}
-        .article-content h3 {{
-            font-size: 1.4rem;
-            color: #333;
-            margin: 30px 0 15px 0;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #e9ecef;
-        }}
-        .article-content p {{
-            margin: 15px 0;
-            text-align: justify;
-        }}
-        .meta {{
-            margin: 20px 0;
-            padding: 15px;
-            background: #e9ecef;
-            border-radius: 8px;
-        }}
-        .version-history {{
-            margin: 30px 0;
-            padding: 20px;
-            background: #f8f9fa;
-            border-radius: 8px;
-            border: 1px solid #dee2e6;
-        }}
-        .version-history h3 {{
-            margin-top: 0;
-            color: #495057;
-            cursor: pointer;
-            user-select: none;
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-        }}
-        .version-history h3:hover {{
-            color: #343a40;
-        }}
-        .version-toggle {{
-            font-size: 0.9em;
-            color: #6c757d;
-            transition: transform 0.3s ease;
-        }}
-        .version-toggle.open {{
-            transform: rotate(180deg);
-        }}
-        .version-list {{
-            max-height: 0;
-            overflow: hidden;
-            transition: max-height 0.3s ease;
-        }}
-        .version-list.open {{
-            max-height: 500px;
-            overflow-y: auto;
-        }}
-        .version-item {{
-            margin: 10px 0;
-            padding: 10px;
-            background: white;
-            border-radius: 4px;
-            border-left: 3px solid #17a2b8;
-        }}
-        .version-item.current {{
-            border-left-color: #28a745;
-            font-weight: bold;
-        }}
-        .version-date {{
-            font-size: 14px;
-            color: #6c757d;
-        }}
-        .sources-section {{
-            margin-top: 40px;
-            padding: 20px;
-            background: #f8f9fa;
-            border-radius: 8px;
-            border: 1px solid #dee2e6;
-        }}
-        .sources-section h4 {{
-            margin: 0 0 10px 0;
-            font-size: 1.1rem;
-            color: #495057;
-        }}
-        .source-list {{
-            margin: 5px 0;
-            font-size: 0.9rem;
-        }}
-        .source-list a {{
-            color: #1a73e8;
-            text-decoration: none;
-            margin-right: 10px;
-        }}
-        .source-list a:hover {{
-            text-decoration: underline;
-        }}
-        
-        /* Floating Action Button */
-        .fab {{
-            position: fixed;
-            bottom: 20px;
-            right: 20px;
-            width: 56px;
-            height: 56px;
-            background: #0066cc;
-            color: white;
-            border-radius: 28px;
-            border: none;
-            box-shadow: 0 2px 10px rgba(0,102,204,0.3);
-            cursor: pointer;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            text-decoration: none;
-            font-size: 24px;
-            transition: transform 0.2s, box-shadow 0.2s;
-            z-index: 1000;
-        }}
-        
-        .fab:hover {{
-            transform: scale(1.1);
-            box-shadow: 0 4px 20px rgba(0,102,204,0.4);
-        }}
-        
-        /* Related Articles Section */
-        .related-articles {{
-            margin-top: 50px;
-            padding: 20px;
-            background: #f8f9fa;
-            border-radius: 8px;
-            border: 1px solid #dee2e6;
-        }}
-        
-        .related-articles h3 {{
-            margin: 0 0 20px 0;
-            color: #495057;
-            font-size: 1.3rem;
-        }}
-        
-        .related-article-item {{
-            display: flex;
-            gap: 15px;
-            padding: 15px;
-            margin-bottom: 10px;
-            background: white;
-            border-radius: 4px;
-            border-left: 3px solid #0066cc;
-            transition: transform 0.2s;
-            text-decoration: none;
-            color: inherit;
-        }}
-        
-        .related-article-item:hover {{
-            transform: translateX(5px);
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }}
-        
-        .related-article-thumbnail {{
-            flex-shrink: 0;
-            width: 60px;
-            height: 60px;
-            border-radius: 4px;
-            overflow: hidden;
-            background: #f5f5f5;
-        }}
-        
-        .related-article-thumbnail img {{
-            width: 100%;
-            height: 100%;
-            object-fit: cover;
-        }}
-        
-        .related-article-content {{
-            flex: 1;
-            min-width: 0;
-        }}
-        
-        .related-article-content h4 {{
-            margin: 0 0 5px 0;
-            font-size: 1rem;
-            font-weight: 500;
-            color: #333;
-            line-height: 1.3;
-        }}
-        
-        .related-article-item:hover .related-article-content h4 {{
-            color: #0066cc;
-        }}
-        
-        .related-article-meta {{
-            font-size: 0.85rem;
-            color: #6c757d;
-        }}
-        
-        .loading-message {{
-            text-align: center;
-            color: #6c757d;
-            padding: 20px;
-        }}
-        
-        /* Mobile responsiveness */
-        @media (max-width: 768px) {{
-            .fab {{
-                bottom: 70px;
-                right: 15px;
-            }}
-        }}
-    </style>
-    <script>
-        function toggleVersionHistory() {{
-            const versionList = document.querySelector('.version-list');
-            const toggleIcon = document.querySelector('.version-toggle');
-            
-            if (versionList.classList.contains('open')) {{
-                versionList.classList.remove('open');
-                toggleIcon.classList.remove('open');
-            }} else {{
-                versionList.classList.add('open');
-                toggleIcon.classList.add('open');
-            }}
-        }}
-        
-        // Load related articles based on current filter state
-        async function loadRelatedArticles() {{
-            const relatedSection = document.getElementById('related-articles-list');
-            // current_time 형식: 2025-07-24 02:00:29
-            const [datePart, timePart] = '{current_time}'.split(' ');
-            const [year, month, day] = datePart.split('-');
-            const [hour, minute, second] = timePart.split(':');
-            const currentDate = new Date(year, month-1, day, hour, minute, second);
-            
-            // console.log('Loading related articles...');
-            // console.log('Current date:', currentDate);
-            
-            try {{
-                // Get the current filter state from URL hash
-                const hash = window.location.hash.slice(1);
-                const filters = hash ? hash.split(',').map(tag => decodeURIComponent(tag)) : [];
-                // console.log('Active filters:', filters);
-                
-                // Fetch the main index page to get all articles
-                const response = await fetch('/index.html');
-                const html = await response.text();
-                const parser = new DOMParser();
-                const doc = parser.parseFromString(html, 'text/html');
-                
-                // Find all article items
-                const articles = doc.querySelectorAll('.article-card');
-                //console.log('Found articles:', articles.length);
-                const filteredArticles = [];
-                
-                articles.forEach(article => {{
-                    const titleElement = article.querySelector('h2');
-                    const title = titleElement?.textContent;
-                    const rawLink = article.getAttribute('href');
-                    // Fix relative path issue - ensure link starts from root
-                    const link = rawLink ? '/' + rawLink : null;
-                    const dateElement = article.querySelector('.article-meta span');
-                    const dateText = dateElement?.textContent?.replace('📅 ', '');
-                    
-                    // console.log('Processing article:', title, 'Date text:', dateText);
-                    
-                    // Skip the current article
-                    if (title && title.includes('{clean_title}')) {{
-                        // console.log('Skipping current article:', title);
-                        return;
-                    }}
-                    
-                    // Parse the article date
-                    let articleDate = null;
-                    if (dateText) {{
-                        // 날짜 형식: "2025년 07월 24일 01:03"
-                        const match = dateText.match(/(\\d{{4}})년\\s+(\\d{{2}})월\\s+(\\d{{2}})일\\s+(\\d{{2}}):(\\d{{2}})/);
-                        if (match) {{
-                            articleDate = new Date(match[1], match[2]-1, match[3], match[4], match[5]);
-                            // console.log('Parsed date:', articleDate);
-                        }} else {{
-                            // console.log('Date regex did not match for:', dateText);
-                        }}
-                    }}
-                    
-                    // Skip if no date found
-                    if (!articleDate) {{
-                        // console.log('Skipping article - no date found');
-                        return;
-                    }}
-                    
-                    // 현재 기사보다 오래된 기사만 표시
-                    if (articleDate >= currentDate) {{
-                        // console.log('Skipping newer or same-time article:', title);
-                        return;
-                    }}
-                    
-                    // If filters are applied, check if article matches
-                    if (filters.length > 0) {{
-                        const tagsData = article.getAttribute('data-tags');
-                        if (!tagsData) return;
-                        
-                        const articleTags = tagsData.split('|').filter(tag => tag);
-                        
-                        const hasMatchingTag = filters.some(filter => articleTags.includes(filter));
-                        if (!hasMatchingTag) return;
-                    }}
-                    
-                    // Extract thumbnail if available
-                    const thumbnailElement = article.querySelector('.article-thumbnail img');
-                    const thumbnailSrc = thumbnailElement ? thumbnailElement.getAttribute('src') : null;
-                    
-                    // Add the article to the list
-                    if (title && link && dateText) {{
-                        filteredArticles.push({{
-                            title: title,
-                            link: link,
-                            date: dateText,
-                            timestamp: articleDate,
-                            thumbnail: thumbnailSrc
-                        }});
-                    }}
-                }});
-                
-                // Sort by date (newest first among older articles)
-                filteredArticles.sort((a, b) => b.timestamp - a.timestamp);
-                
-                // Display up to 5 articles
-                if (filteredArticles.length > 0) {{
-                    // Clear existing content
-                    relatedSection.innerHTML = '';
-                    
-                    // Create articles using DOM methods to avoid CSP issues
-                    filteredArticles.slice(0, 5).forEach(article => {{
-                        const itemLink = document.createElement('a');
-                        itemLink.className = 'related-article-item';
-                        itemLink.href = article.link;
-                        
-                        // Add thumbnail if available
-                        if (article.thumbnail) {{
-                            const thumbnailDiv = document.createElement('div');
-                            thumbnailDiv.className = 'related-article-thumbnail';
-                            
-                            const img = document.createElement('img');
-                            img.src = article.thumbnail;
-                            img.alt = article.title;
-                            img.loading = 'lazy';
-                            img.onerror = function() {{
-                                this.style.display = 'none';
-                                thumbnailDiv.style.display = 'none';
-                            }};
-                            
-                            thumbnailDiv.appendChild(img);
-                            itemLink.appendChild(thumbnailDiv);
-                        }}
-                        
-                        // Content section
-                        const contentDiv = document.createElement('div');
-                        contentDiv.className = 'related-article-content';
-                        
-                        const titleElement = document.createElement('h4');
-                        titleElement.textContent = article.title;
-                        
-                        const metaDiv = document.createElement('div');
-                        metaDiv.className = 'related-article-meta';
-                        metaDiv.textContent = article.date;
-                        
-                        contentDiv.appendChild(titleElement);
-                        contentDiv.appendChild(metaDiv);
-                        itemLink.appendChild(contentDiv);
-                        
-                        relatedSection.appendChild(itemLink);
-                    }});
-                }} else {{
-                    const message = document.createElement('p');
-                    message.className = 'loading-message';
-                    if (filters.length > 0) {{
-                        message.textContent = '선택한 필터에 해당하는 이전 기사가 없습니다.';
-                    }} else {{
-                        message.textContent = '이전 기사가 없습니다.';
-                    }}
-                    relatedSection.innerHTML = '';
-                    relatedSection.appendChild(message);
-                }}
-                
-            }} catch (error) {{
-                console.error('Error loading related articles:', error);
-                const errorMessage = document.createElement('p');
-                errorMessage.className = 'loading-message';
-                errorMessage.textContent = '기사 목록을 불러올 수 없습니다.';
-                relatedSection.innerHTML = '';
-                relatedSection.appendChild(errorMessage);
-            }}
-        }}
-        
-        // Load related articles when page loads
-        document.addEventListener('DOMContentLoaded', loadRelatedArticles);
-    </script>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>{clean_title}</h1>
-            <p>
-                분석 시간: {current_time}
-                {f' <span style="font-size: 0.85rem; color: #17a2b8; margin-left: 15px;">✅ 버전 {article_data.get("version", 1)} (업데이트됨)</span>' if is_update else ''}
-            </p>
-        </div>
-        
-        {self._generate_summary_section(article_data)}
-        
-        {self._generate_ai_image_section(article_data)}
-        
-        <div class="article-content">
-{self._convert_markdown_to_html(article_data.get('comprehensive_article', article_data.get('generated_article', '')))}
-        </div>
-        
-        {self._generate_version_history_html(article_data.get('version_history', []))}
-        
-        {self._generate_sources_section(article_data)}
-        
-        <!-- Related Articles Section -->
-        <div class="related-articles">
-            <h3>📰 다른 기사</h3>
-            <div id="related-articles-list">
-                <p class="loading-message">기사 목록을 불러오는 중...</p>
-            </div>
-        </div>
-        
-        <hr>
-        <p><small>이 기사는 AI가 자동으로 생성하고 관리하는 스마트 기사입니다.</small></p>
-    </div>
-    
-    <!-- Floating Home Button -->
-    <a href="/index.html" class="fab" title="홈으로">🏠</a>
-</body>
-</html>"""
-
-        return html_template
-
-    def _generate_html_from_cache(
-        self, article_data: Dict, related_count: int, is_update: bool = False
-    ) -> str:
-        """
-        캐시된 데이터로부터 HTML 출력 생성 (API 호출 없음)
-        
-        기존 _generate_html과 동일하지만 API 호출이 필요한 작업은 수행하지 않습니다.
-        특히 _generate_three_line_summary를 호출하지 않고 캐시된 요약을 사용합니다.
-        
-        Args:
-            article_data: 기사 데이터 디텍셔너리
-            related_count: 관련 기사 수
-            is_update: 업데이트된 기사인지 여부
-            
-        Returns:
-            완전한 HTML 문서
-        """
-
-        # 기본 템플릿
-        current_time = get_kst_now().strftime("%Y-%m-%d %H:%M:%S")
-        version_info = f"(버전 {article_data.get('version', 1)})" if is_update else ""
-
-        # comprehensive_article에서 제목 추출
-        # 1. 먼저 generated_title이 있는지 확인 (가장 우선순위)
-        comprehensive_title = article_data.get('generated_title', None)
-        
-        # 2. generated_title이 없으면 comprehensive_article 내용에서 찾기
-        if not comprehensive_title:
-            comprehensive_content = article_data.get('comprehensive_article', '')
-            if comprehensive_content:
-                # 마크다운 형식에서 첫 번째 # 제목 찾기
-                import re
-                title_match = re.search(r'^#\s+(.+?)$', comprehensive_content, re.MULTILINE)
-                if title_match:
-                    comprehensive_title = title_match.group(1).strip()
-        
-        # 3. 여전히 제목을 찾지 못했다면 main_article 제목 사용 (폴백)
-        if not comprehensive_title:
-            comprehensive_title = article_data["main_article"]["title"]
-        
-        # 제목에서 독점 보도 표현 제거
-        clean_title = self.sanitize_exclusive_terms(comprehensive_title)
-        
-        # 태그 정보 추출
-        tags = article_data.get("tags", {})
-        category_tags = tags.get("category_tags", [])
-        content_tags = tags.get("content_tags", [])
-        all_tags = category_tags + content_tags
-
-        html_template = f"""<!DOCTYPE html>
-<html lang="ko">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{clean_title} - {current_time}</title>
-    <link rel="icon" type="image/svg+xml" href="/static/favicon.svg">
-    <link rel="alternate icon" href="/static/favicon.svg">
-    <meta name="article-tags" content="{','.join(all_tags)}">{f'''
-    <meta name="article-category-tags" content="{','.join(category_tags)}">''' if category_tags else ''}{f'''
-    <meta name="article-content-tags" content="{','.join(content_tags)}">''' if content_tags else ''}
-    <style>
-        body {{
-            font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif;
-            max-width: 900px;
-            margin: 0 auto;
-            padding: 20px;
-            line-height: 1.8;
-            background: #f5f5f5;
-        }}
-        .container {{
-            background: white;
-            padding: 30px;
-            border-radius: 10px;
-            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-        }}
-        .header {{
-            background: #f8f9fa;
-            padding: 20px;
-            border-radius: 10px;
-            margin-bottom: 30px;
-        }}
-        .version-badge {{
-            background: #17a2b8;
-            color: white;
-            padding: 5px 15px;
-            border-radius: 20px;
-            display: inline-block;
-            font-weight: bold;
-            margin-bottom: 10px;
-        }}
-        .update-info {{
-            background: #d4edda;
-            border: 1px solid #c3e6cb;
-            padding: 15px;
-            border-radius: 5px;
-            margin: 20px 0;
-        }}
-        .article-content {{
-            margin: 30px 0;
-            font-size: 17px;
-            line-height: 1.9;
-        }}
-        .article-content h3 {{
-            font-size: 1.4rem;
-            color: #333;
-            margin: 30px 0 15px 0;
-            padding-bottom: 10px;
-            border-bottom: 2px solid #e9ecef;
-        }}
-        .article-content p {{
-            margin: 15px 0;
-            text-align: justify;
-        }}
-        .meta {{
-            margin: 20px 0;
-            padding: 15px;
-            background: #e9ecef;
-            border-radius: 8px;
-        }}
-        .version-history {{
-            margin: 30px 0;
-            padding: 20px;
-            background: #f8f9fa;
-            border-radius: 8px;
-            border: 1px solid #dee2e6;
-        }}
-        .version-history h3 {{
-            margin-top: 0;
-            color: #495057;
-            cursor: pointer;
-            user-select: none;
-            display: flex;
-            align-items: center;
-            justify-content: space-between;
-        }}
-        .version-history h3:hover {{
-            color: #343a40;
-        }}
-        .version-toggle {{
-            font-size: 0.9em;
-            color: #6c757d;
-            transition: transform 0.3s ease;
-        }}
-        .version-toggle.open {{
-            transform: rotate(180deg);
-        }}
-        .version-list {{
-            max-height: 0;
-            overflow: hidden;
-            transition: max-height 0.3s ease;
-        }}
-        .version-list.open {{
-            max-height: 500px;
-            overflow-y: auto;
-        }}
-        .version-item {{
-            margin: 10px 0;
-            padding: 10px;
-            background: white;
-            border-radius: 4px;
-            border-left: 3px solid #17a2b8;
-        }}
-        .version-item.current {{
-            border-left-color: #28a745;
-            font-weight: bold;
-        }}
-        .version-date {{
-            font-size: 14px;
-            color: #6c757d;
-        }}
-        .sources-section {{
-            margin-top: 40px;
-            padding: 20px;
-            background: #f8f9fa;
-            border-radius: 8px;
-            border: 1px solid #dee2e6;
-        }}
-        .sources-section h4 {{
-            margin: 0 0 10px 0;
-            font-size: 1.1rem;
-            color: #495057;
-        }}
-        .source-list {{
-            margin: 5px 0;
-            font-size: 0.9rem;
-        }}
-        .source-list a {{
-            color: #1a73e8;
-            text-decoration: none;
-            margin-right: 10px;
-        }}
-        .source-list a:hover {{
-            text-decoration: underline;
-        }}
-        
-        /* Floating Action Button */
-        .fab {{
-            position: fixed;
-            bottom: 20px;
-            right: 20px;
-            width: 56px;
-            height: 56px;
-            background: #0066cc;
-            color: white;
-            border-radius: 28px;
-            border: none;
-            box-shadow: 0 2px 10px rgba(0,102,204,0.3);
-            cursor: pointer;
-            display: flex;
-            align-items: center;
-            justify-content: center;
-            text-decoration: none;
-            font-size: 24px;
-            transition: transform 0.2s, box-shadow 0.2s;
-            z-index: 1000;
-        }}
-        
-        .fab:hover {{
-            transform: scale(1.1);
-            box-shadow: 0 4px 20px rgba(0,102,204,0.4);
-        }}
-        
-        /* Related Articles Section */
-        .related-articles {{
-            margin-top: 50px;
-            padding: 20px;
-            background: #f8f9fa;
-            border-radius: 8px;
-            border: 1px solid #dee2e6;
-        }}
-        
-        .related-articles h3 {{
-            margin: 0 0 20px 0;
-            color: #495057;
-            font-size: 1.3rem;
-        }}
-        
-        .related-article-item {{
-            display: flex;
-            gap: 15px;
-            padding: 15px;
-            margin-bottom: 10px;
-            background: white;
-            border-radius: 4px;
-            border-left: 3px solid #0066cc;
-            transition: transform 0.2s;
-            text-decoration: none;
-            color: inherit;
-        }}
+            return self._format_summary_lines(cleaned_lines)
+
+        except Exception as e:
+            logger.error(f"3줄 요약 생성 실패: {e}")
+            return None  # 요약 생성 실패 시 None 반환
+
+    def _render_article_body(self, content: str) -> str:
+        """
+        기사 본문 HTML 생성 (본문 해시로 캐시)
         
-        .related-article-item:hover {{
-            transform: translateX(5px);
-            box-shadow: 0 2px 5px rgba(0,0,0,0.1);
-        }}
+        새로고침이나 재생성, 버전별 파일 저장처럼 같은 본문을 다시 렌더링할 때는
+        마크다운 변환을 다시 하지 않고 캐시된 HTML을 사용합니다.
+        캐시는 변환된 HTML의 전체 글자 수가 BODY_HTML_CACHE_MAX_CHARS를 넘지 않도록
+        오래된 항목부터 제거합니다.
+        """
+        key = hashlib.blake2b(content.encode("utf-8"), digest_size=16).hexdigest()
+        html = self._body_html_cache.get(key)
+        if html is None:
+            html = self._convert_markdown_to_html(content)
+            if len(html) <= self.BODY_HTML_CACHE_MAX_CHARS:
+                self._body_html_cache[key] = html
+                self._body_html_cache_chars += len(html)
+                while self._body_html_cache_chars > self.BODY_HTML_CACHE_MAX_CHARS:
+                    oldest = self._body_html_cache.pop(next(iter(self._body_html_cache)))
+                    self._body_html_cache_chars -= len(oldest)
+        return html
+
+    def _render_section(self, kind: str, source_data: Any, build) -> str:
+        """
+        섹션 HTML 생성 (입력 데이터 해시로 캐시)
         
-        .related-article-thumbnail {{
-            flex-shrink: 0;
-            width: 60px;
-            height: 60px;
-            border-radius: 4px;
-            overflow: hidden;
-            background: #f5f5f5;
-        }}
+        캐시된 기사 전체를 다시 렌더링할 때처럼 같은 버전 히스토리/참조 소스로
+        섹션을 반복해서 만드는 경우 build()를 다시 호출하지 않습니다.
+        """
+        key = (kind, hashlib.blake2b(dumps_json(source_data), digest_size=16).hexdigest())
+        html = self._section_html_cache.get(key)
+        if html is None:
+            html = build()
+            self._section_html_cache[key] = html
+            if len(self._section_html_cache) > self.SECTION_HTML_CACHE_MAX_ENTRIES:
+                del self._section_html_cache[next(iter(self._section_html_cache))]
+        return html
+
+    def _convert_markdown_to_html(self, text: str) -> str:
+        """마크다운 텍스트를 HTML로 변환"""
+        if self._md is None:
+            import markdown
+            
+            # Markdown 라이브러리 설정
+            # extensions:
+            # - extra: 테이블, 코드 블록, 각주, 약어, 속성 리스트 등 추가 기능
+            # - nl2br: 줄바꿈을 <br> 태그로 변환
+            # - sane_lists: 더 나은 리스트 처리
+            # - smarty: 스마트 따옴표, 대시 등
+            self._md = markdown.Markdown(extensions=_MARKDOWN_EXTENSIONS)
         
-        .related-article-thumbnail img {{
-            width: 100%;
-            height: 100%;
-            object-fit: cover;
-        }}
+        # 기사 제목 처리를 위한 전처리
+        # 첫 번째 # 제목을 찾아서 h2로 변환하고 스타일 적용
+        lines = text.split('\n')
+        processed_lines = []
+        article_title_found = False
         
-        .related-article-content {{
-            flex: 1;
-            min-width: 0;
-        }}
+        for line in lines:
+            if line.startswith('# ') and not article_title_found:
+                # 첫 번째 h1 제목은 건너뛰기 (이미 header에 표시됨)
+                article_title_found = True
+                continue  # 이 줄을 건너뛰고 다음 줄로
+            else:
+                processed_lines.append(line)
         
-        .related-article-content h4 {{
-            margin: 0 0 5px 0;
-            font-size: 1rem;
-            font-weight: 500;
-            color: #333;
-            line-height: 1.3;
-        }}
+        # 다시 합치기
+        processed_text = '\n'.join(processed_lines)
         
-        .related-article-item:hover .related-article-content h4 {{
-            color: #0066cc;
-        }}
+        # Markdown을 HTML로 변환
+        html = self._md.reset().convert(processed_text)
         
-        .related-article-meta {{
-            font-size: 0.85rem;
-            color: #6c757d;
-        }}
+        # 후처리: 외부 링크에만 target="_blank" 추가
+        # 내부 링크: /, #, /index.html, /article_xxx.html 등으로 시작하는 경우
+        # 외부 링크: http://, https://, //로 시작하는 경우
+        def add_target_blank(match):
+            href = match.group(1)
+            # 외부 링크인 경우에만 target="_blank" 추가
+            if href.startswith(('http://', 'https://', '//')):
+                return f'<a href="{href}" target="_blank">'
+            else:
+                return f'<a href="{href}">'
         
-        .loading-message {{
-            text-align: center;
-            color: #6c757d;
-            padding: 20px;
-        }}
+        html = _ANCHOR_HREF_RE.sub(add_target_blank, html)
         
-        /* Mobile responsiveness */
-        @media (max-width: 768px) {{
-            .fab {{
-                bottom: 70px;
-                right: 15px;
-            }}
-        }}
-    </style>
-    <script>
-        function toggleVersionHistory() {{
-            const versionList = document.querySelector('.version-list');
-            const toggleIcon = document.querySelector('.version-toggle');
-            
-            if (versionList.classList.contains('open')) {{
-                versionList.classList.remove('open');
-                toggleIcon.classList.remove('open');
-            }} else {{
-                versionList.classList.add('open');
-                toggleIcon.classList.add('open');
-            }}
-        }}
+        # 후처리: 모든 h2를 h3로 변경 (첫 번째 제목을 제거했으므로)
+        html = html.replace('<h2>', '<h3>').replace('</h2>', '</h3>')
         
-        // Load related articles based on current filter state
-        async function loadRelatedArticles() {{
-            const relatedSection = document.getElementById('related-articles-list');
-            // current_time 형식: 2025-07-24 02:00:29
-            const [datePart, timePart] = '{current_time}'.split(' ');
-            const [year, month, day] = datePart.split('-');
-            const [hour, minute, second] = timePart.split(':');
-            const currentDate = new Date(year, month-1, day, hour, minute, second);
-            
-            // console.log('Loading related articles...');
-            // console.log('Current date:', currentDate);
-            
-            try {{
-                // Get the current filter state from URL hash
-                const hash = window.location.hash.slice(1);
-                const filters = hash ? hash.split(',').map(tag => decodeURIComponent(tag)) : [];
-                // console.log('Active filters:', filters);
-                
-                // Fetch the main index page to get all articles
-                const response = await fetch('/index.html');
-                const html = await response.text();
-                const parser = new DOMParser();
-                const doc = parser.parseFromString(html, 'text/html');
-                
-                // Find all article items
-                const articles = doc.querySelectorAll('.article-card');
-                //console.log('Found articles:', articles.length);
-                const filteredArticles = [];
-                
-                articles.forEach(article => {{
-                    const titleElement = article.querySelector('h2');
-                    const title = titleElement?.textContent;
-                    const rawLink = article.getAttribute('href');
-                    // Fix relative path issue - ensure link starts from root
-                    const link = rawLink ? '/' + rawLink : null;
-                    const dateElement = article.querySelector('.article-meta span');
-                    const dateText = dateElement?.textContent?.replace('📅 ', '');
-                    
-                    // console.log('Processing article:', title, 'Date text:', dateText);
-                    
-                    // Skip the current article
-                    if (title && title.includes('{clean_title}')) {{
-                        // console.log('Skipping current article:', title);
-                        return;
-                    }}
-                    
-                    // Parse the article date
-                    let articleDate = null;
-                    if (dateText) {{
-                        // 날짜 형식: "2025년 07월 24일 01:03"
-                        const match = dateText.match(/(\\d{{4}})년\\s+(\\d{{2}})월\\s+(\\d{{2}})일\\s+(\\d{{2}}):(\\d{{2}})/);
-                        if (match) {{
-                            articleDate = new Date(match[1], match[2]-1, match[3], match[4], match[5]);
-                            // console.log('Parsed date:', articleDate);
-                        }} else {{
-                            // console.log('Date regex did not match for:', dateText);
-                        }}
-                    }}
-                    
-                    // Skip if no date found
-                    if (!articleDate) {{
-                        // console.log('Skipping article - no date found');
-                        return;
-                    }}
-                    
-                    // 현재 기사보다 오래된 기사만 표시
-                    if (articleDate >= currentDate) {{
-                        // console.log('Skipping newer or same-time article:', title);
-                        return;
-                    }}
-                    
-                    // If filters are applied, check if article matches
-                    if (filters.length > 0) {{
-                        const tagsData = article.getAttribute('data-tags');
-                        if (!tagsData) return;
-                        
-                        const articleTags = tagsData.split('|').filter(tag => tag);
-                        
-                        const hasMatchingTag = filters.some(filter => articleTags.includes(filter));
-                        if (!hasMatchingTag) return;
-                    }}
-                    
-                    // Extract thumbnail if available
-                    const thumbnailElement = article.querySelector('.article-thumbnail img');
-                    const thumbnailSrc = thumbnailElement ? thumbnailElement.getAttribute('src') : null;
-                    
-                    // Add the article to the list
-                    if (title && link && dateText) {{
-                        filteredArticles.push({{
-                            title: title,
-                            link: link,
-                            date: dateText,
-                            timestamp: articleDate,
-                            thumbnail: thumbnailSrc
-                        }});
-                    }}
-                }});
-                
-                // Sort by date (newest first among older articles)
-                filteredArticles.sort((a, b) => b.timestamp - a.timestamp);
-                
-                // Display up to 5 articles
-                if (filteredArticles.length > 0) {{
-                    // Clear existing content
-                    relatedSection.innerHTML = '';
-                    
-                    // Create articles using DOM methods to avoid CSP issues
-                    filteredArticles.slice(0, 5).forEach(article => {{
-                        const itemLink = document.createElement('a');
-                        itemLink.className = 'related-article-item';
-                        itemLink.href = article.link;
-                        
-                        // Add thumbnail if available
-                        if (article.thumbnail) {{
-                            const thumbnailDiv = document.createElement('div');
-                            thumbnailDiv.className = 'related-article-thumbnail';
-                            
-                            const img = document.createElement('img');
-                            img.src = article.thumbnail;
-                            img.alt = article.title;
-                            img.loading = 'lazy';
-                            img.onerror = function() {{
-                                this.style.display = 'none';
-                                thumbnailDiv.style.display = 'none';
-                            }};
-                            
-                            thumbnailDiv.appendChild(img);
-                            itemLink.appendChild(thumbnailDiv);
-                        }}
-                        
-                        // Content section
-                        const contentDiv = document.createElement('div');
-                        contentDiv.className = 'related-article-content';
-                        
-                        const titleElement = document.createElement('h4');
-                        titleElement.textContent = article.title;
-                        
-                        const metaDiv = document.createElement('div');
-                        metaDiv.className = 'related-article-meta';
-                        metaDiv.textContent = article.date;
-                        
-                        contentDiv.appendChild(titleElement);
-                        contentDiv.appendChild(metaDiv);
-                        itemLink.appendChild(contentDiv);
-                        
-                        relatedSection.appendChild(itemLink);
-                    }});
-                }} else {{
-                    const message = document.createElement('p');
-                    message.className = 'loading-message';
-                    if (filters.length > 0) {{
-                        message.textContent = '선택한 필터에 해당하는 이전 기사가 없습니다.';
-                    }} else {{
-                        message.textContent = '이전 기사가 없습니다.';
-                    }}
-                    relatedSection.innerHTML = '';
-                    relatedSection.appendChild(message);
-                }}
-                
-            }} catch (error) {{
-                console.error('Error loading related articles:', error);
-                const errorMessage = document.createElement('p');
-                errorMessage.className = 'loading-message';
-                errorMessage.textContent = '기사 목록을 불러올 수 없습니다.';
-                relatedSection.innerHTML = '';
-                relatedSection.appendChild(errorMessage);
-            }}
-        }}
+        return html
+
+    def _generate_html(
+        self, article_data: Dict, related_count: int, is_update: bool = False,
+        summary_section: Optional[str] = None, now: Optional[datetime] = None
+    ) -> str:
+        """
+        HTML 출력 생성
         
-        // Load related articles when page loads
-        document.addEventListener('DOMContentLoaded', loadRelatedArticles);
-    </script>
-</head>
-<body>
-    <div class="container">
-        <div class="header">
-            <h1>{clean_title}</h1>
-            <p>
-                분석 시간: {current_time}
-                {f' <span style="font-size: 0.85rem; color: #17a2b8; margin-left: 15px;">✅ 버전 {article_data.get("version", 1)} (업데이트됨)</span>' if is_update else ''}
-            </p>
-        </div>
+        기사 데이터를 바탕으로 완전한 HTML 페이지를 생성합니다.
         
-        {self._generate_summary_section_from_cache(article_data)}
+        Args:
+            article_data: 기사 데이터 디텍셔너리
+            related_count: 관련 기사 수
+            is_update: 업데이트된 기사인지 여부
+            summary_section: 미리 생성한 요약 섹션 HTML (없으면 여기서 생성)
+            now: 분석 시간으로 표시할 시각 (없으면 지금 시각)
+            
+        Returns:
+            완전한 HTML 문서
+        """
+
+        if summary_section is None:
+            summary_section = self._generate_summary_section(article_data)
+
+        # 기본 템플릿
+        current_time = (now or get_kst_now()).strftime("%Y-%m-%d %H:%M:%S")
+        version_info = f"(버전 {article_data.get('version', 1)})" if is_update else ""
+
+        # comprehensive_article에서 제목 추출
+        # 1. 먼저 generated_title이 있는지 확인 (가장 우선순위)
+        comprehensive_title = article_data.get('generated_title', None)
         
-        {self._generate_ai_image_section(article_data)}
+        # 2. generated_title이 없으면 comprehensive_article 내용에서 찾기
+        if not comprehensive_title:
+            # 마크다운 형식에서 첫 번째 # 제목 찾기
+            comprehensive_title = extract_markdown_title(article_data.get('comprehensive_article', ''))
         
-        <div class="article-content">
-{self._convert_markdown_to_html(article_data.get('comprehensive_article', article_data.get('generated_article', '')))}
-        </div>
+        # 3. 여전히 제목을 찾지 못했다면 main_article 제목 사용 (폴백)
+        if not comprehensive_title:
+            comprehensive_title = article_data["main_article"]["title"]
         
-        {self._generate_version_history_html(article_data.get('version_history', []))}
+        # 제목에서 독점 보도 표현 제거
+        clean_title = self.sanitize_exclusive_terms(comprehensive_title)
         
-        {self._generate_sources_section(article_data)}
+        # 태그 정보 추출
+        tags = article_data.get("tags", {})
+        category_tags = tags.get("category_tags", [])
+        content_tags = tags.get("content_tags", [])
+        all_tags = category_tags + content_tags
+
+        return _fill_template(
+            _ARTICLE_HTML_PARTS,
+            title=clean_title,
+            current_time=current_time,
+            topic_id=str(article_data.get("topic_id", "")),
+            all_tags=','.join(all_tags),
+            category_tags_meta=(
+                f'\n    <meta name="article-category-tags" content="{",".join(category_tags)}">'
+                if category_tags else ''
+            ),
+            content_tags_meta=(
+                f'\n    <meta name="article-content-tags" content="{",".join(content_tags)}">'
+                if content_tags else ''
+            ),
+            version_badge=(
+                f' <span style="font-size: 0.85rem; color: #17a2b8; margin-left: 15px;">✅ 버전 {article_data.get("version", 1)} (업데이트됨)</span>'
+                if is_update else ''
+            ),
+            summary_section=summary_section,
+            ai_image_section=self._generate_ai_image_section(article_data),
+            article_body=self._render_article_body(
+                article_data.get('comprehensive_article', article_data.get('generated_article', ''))
+            ),
+            version_history=self._render_section(
+                "version_history",
+                article_data.get('version_history', []),
+                lambda: self._generate_version_history_html(article_data.get('version_history', [])),
+            ),
+            sources_section=self._render_section(
+                "sources",
+                [article_data.get(key) for key in ("youtube_videos", "related_articles", "google_articles")],
+                lambda: self._generate_sources_section(article_data),
+            ),
+        )
+
+    def _generate_html_from_cache(
+        self, article_data: Dict, related_count: int, is_update: bool = False
+    ) -> str:
+        """
+        캐시된 데이터로부터 HTML 출력 생성 (API 호출 없음)
         
-        <!-- Related Articles Section -->
-        <div class="related-articles">
-            <h3>📰 다른 기사</h3>
-            <div id="related-articles-list">
-                <p class="loading-message">기사 목록을 불러오는 중...</p>
-            </div>
-        </div>
+        기존 _generate_html과 동일하지만 API 호출이 필요한 작업은 수행하지 않습니다.
+        특히 _generate_three_line_summary를 호출하지 않고 캐시된 요약을 사용합니다.
         
-        <hr>
-        <p><small>이 기사는 AI가 자동으로 생성하고 관리하는 스마트 기사입니다.</small></p>
-    </div>
-    
-    <!-- Floating Home Button -->
-    <a href="/index.html" class="fab" title="홈으로">🏠</a>
-</body>
-</html>"""
-
-        return html_template
+        Args:
+            article_data: 기사 데이터 디텍셔너리
+            related_count: 관련 기사 수
+            is_update: 업데이트된 기사인지 여부
+            
+        Returns:
+            완전한 HTML 문서
+        """
+        return self._generate_html(
+            article_data, related_count, is_update,
+            summary_section=self._generate_summary_section_from_cache(article_data),
+        )
 
     def _generate_summary_section_from_cache(self, article_data: Dict) -> str:
         """캐시된 요약 섹션 생성 - API 호출 없이 기존 데이터 사용"""
@@ -2688,8 +2741,8 @@ JSON 형식으로 응답해주세요:
             summary_html = f"<p>{cached_summary}</p>"
         
         # 품질 평가 정보
-        quality_rating = article_data.get("quality_rating", "Medium")
-        quality_emoji = article_data.get("quality_emoji", "😐")
+        quality_rating = article_data.get("quality_rating") or "Medium"
+        quality_emoji = article_data.get("quality_emoji") or "😐"
         
         return f"""
         <div class="meta">
@@ -2706,17 +2759,17 @@ JSON 형식으로 응답해주세요:
         if not version_history or len(version_history) <= 1:
             return ""  # 버전이 하나뿐이면 히스토리 표시 안 함
 
-        html = """
+        parts = ["""
         <div class="version-history">
             <h3 onclick="toggleVersionHistory()">
                 <span>📚 기사 업데이트 히스토리</span>
-                <span class="version-toggle">▼</span>
+                <span class="version-toggle" id="version-toggle">▼</span>
             </h3>
-            <div class="version-list">
+            <div class="version-list" id="version-list">
                 <p style="font-size: 14px; color: #6c757d; margin: 15px 0;">
                     이 주제에 대한 기사가 시간에 따라 어떻게 업데이트되었는지 확인하세요.
                 </p>
-        """
+        """]
 
         # 버전을 최신순으로 정렬
         sorted_history = sorted(version_history, key=lambda x: x["version"], reverse=True)
@@ -2727,47 +2780,30 @@ JSON 형식으로 응답해주세요:
 
             # 날짜 포맷팅
             created_at = version_info.get("created_at", "")
-            if created_at:
-                try:
-                    dt = datetime.fromisoformat(created_at)
-                    formatted_date = dt.strftime("%Y년 %m월 %d일 %H:%M")
-                except Exception as e:
-                    logger.debug(f"Date formatting failed: {e}")
-                    formatted_date = created_at
-            else:
-                formatted_date = "날짜 정보 없음"
+            formatted_date = _format_created_at(created_at) if created_at else "날짜 정보 없음"
 
             # 버전 파일 링크 생성
             article_id = version_info.get("article_id", "")
             version_num = version_info.get("version", "?")
             version_link = f"versions/article_{article_id}_v{version_num}.html"
 
-            html += f"""
-            <div class="{version_class}">
-                <div style="display: flex; justify-content: space-between; align-items: center;">
-                    <div>
-                        <a href="{version_link}" target="_blank" style="text-decoration: none; color: inherit;">
-                            <strong>버전 {version_num}</strong>
-                        </a>
-                        {' (현재)' if is_current else ''}
-                    </div>
-                    <div class="version-date">{formatted_date}</div>
-                </div>
-                {f'<div style="margin-top: 5px; font-size: 14px;">{version_info.get("title", "")}</div>' if version_info.get('title') else ''}
-                <div style="margin-top: 5px; font-size: 13px;">
-                    <a href="{version_link}" target="_blank" style="color: #1a73e8; text-decoration: none;">
-                        이 버전 보기 →
-                    </a>
-                </div>
-            </div>
-            """
-
-        html += """
+            title = version_info.get("title")
+            parts.append(_fill_template(
+                _VERSION_ITEM_PARTS,
+                version_class=version_class,
+                version_link=version_link,
+                version_num=str(version_num),
+                current_marker=" (현재)" if is_current else "",
+                formatted_date=formatted_date,
+                title_block=f'<div style="margin-top: 5px; font-size: 14px;">{title}</div>' if title else "",
+            ))
+
+        parts.append("""
             </div>
         </div>
-        """
+        """)
 
-        return html
+        return "".join(parts)
 
     def _generate_ai_image_section(self, article_data: Dict) -> str:
         """AI 생성 이미지 섹션 생성"""
@@ -2804,68 +2840,37 @@ JSON 형식으로 응답해주세요:
 
     def _generate_sources_section(self, article_data: Dict) -> str:
         """참조 소스 섹션 HTML 생성 (메타데이터 포함)"""
-        sources_html = ""
-        has_sources = False
-
         # 소스 섹션 시작
-        sources_html += """
-        <div class="sources-section">"""
-        has_sources = True
+        parts = ["""
+        <div class="sources-section">"""]
 
         # YouTube 정보가 있는 경우
-        if "youtube_videos" in article_data and article_data["youtube_videos"]:
-            sources_html += """
+        youtube_videos = article_data.get("youtube_videos")
+        if youtube_videos:
+            parts.append("""
             <h4>🎥 참조한 YouTube 영상</h4>
-            <div class="source-list">"""
-
-            for video in article_data["youtube_videos"][:5]:  # 최대 5개
-                title = video.get("title", "")
-                link = video.get("link", video.get("url", ""))  # link 또는 url 키 사용
-                if title and link:
-                    # 제목이 너무 길면 줄임
-                    display_title = title[:30] + "..." if len(title) > 30 else title
-                    sources_html += f'<a href="{link}" target="_blank">{display_title}</a>'
-
-            sources_html += """
-            </div>"""
-
-        # 추가 참조 정보 (관련 기사 + Google 검색 정보 통합)
-        all_references = []
-        
-        # 관련 기사 정보가 있는 경우
-        if "related_articles" in article_data and article_data["related_articles"]:
-            for article in article_data["related_articles"][:10]:  # 최대 10개
-                title = article.get("title", "")
-                link = article.get("link", article.get("url", ""))
-                if title and link:
-                    all_references.append({"title": title, "link": link})
-        
-        # Google 검색 정보가 있는 경우
-        if "google_articles" in article_data and article_data["google_articles"]:
-            for result in article_data["google_articles"][:5]:  # 최대 5개
-                title = result.get("title", "")
-                link = result.get("link", result.get("url", ""))  # link 또는 url 키 사용
-                if title and link:
-                    all_references.append({"title": title, "link": link})
-        
-        # 모든 참조 정보 출력
-        if all_references:
-            sources_html += """
+            <div class="source-list">""")
+            parts.extend(_source_anchors(youtube_videos, 5))  # 최대 5개
+            parts.append("""
+            </div>""")
+
+        # 추가 참조 정보 (관련 기사 최대 10개 + Google 검색 정보 최대 5개 통합)
+        reference_anchors = (
+            _source_anchors(article_data.get("related_articles"), 10)
+            + _source_anchors(article_data.get("google_articles"), 5)
+        )
+        if reference_anchors:
+            parts.append("""
             <h4 style="margin-top: 15px;">🔍 추가 참조 정보</h4>
-            <div class="source-list">"""
-            
-            for ref in all_references:
-                display_title = ref["title"][:30] + "..." if len(ref["title"]) > 30 else ref["title"]
-                sources_html += f'<a href="{ref["link"]}" target="_blank">{display_title}</a>'
-                
-            sources_html += """
-            </div>"""
+            <div class="source-list">""")
+            parts.extend(reference_anchors)
+            parts.append("""
+            </div>""")
 
-        if has_sources:
-            sources_html += """
-        </div>"""
+        parts.append("""
+        </div>""")
 
-        return sources_html
+        return "".join(parts)
 
     def get_cached_topics(self) -> List[Dict]:
         """캐시된 주제 목록 반환"""
@@ -2911,15 +2916,22 @@ def regenerate_html_for_cached_articles():
     # 버전 디렉토리 생성
     os.makedirs(f"{output_dir}/versions", exist_ok=True)
 
-    # 캐시 디렉토리의 모든 JSON 파일 읽기
-    for filename in os.listdir(cache_dir):
-        if filename.endswith(".json"):
-            filepath = os.path.join(cache_dir, filename)
-
-            # 캐시 파일 읽기
-            with open(filepath, "r", encoding="utf-8") as f:
-                article_data = json.load(f)
-
+    def write_html(version_path: str, data: bytes) -> None:
+        # 미리 인코딩한 바이트를 기록 (텍스트 래퍼의 인코딩 단계 생략)
+        # 버전 파일은 최신 HTML과 하드링크로 묶여 있을 수 있으므로 제자리에서 덮어쓰지 않고 교체
+        generator._write_outputs([(version_path, data)])
+        print(f"버전 HTML 생성: {version_path}")
+
+    # 캐시 디렉토리의 모든 JSON 파일 (scandir은 항목 이름을 stat 없이 돌려줌)
+    entries = [(entry.name, entry.path) for entry in os.scandir(cache_dir) if entry.name.endswith(".json")]
+
+    # 파일 읽기/쓰기는 스레드 풀에서 동시에 처리하고,
+    # HTML 생성은 마크다운 변환기를 공유하므로 현재 스레드에서 순서대로 처리
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        writes = []
+        # orjson이 있으면 바이트 그대로 파싱 (텍스트 디코딩 단계 생략)
+        loaded = pool.map(load_json_file, [filepath for _, filepath in entries])
+        for (filename, _), article_data in zip(entries, loaded):
             # 메타데이터 추가 (analysis result에서 가져옴)
             if "analysis" in article_data and isinstance(article_data["analysis"], dict):
                 # YouTube와 Google 정보 확인
@@ -2931,44 +2943,26 @@ def regenerate_html_for_cached_articles():
             # 파일명 생성 (topic_id 기반)
             topic_id = article_data.get("topic_id", filename.replace(".json", ""))
             version = article_data.get("version", 1)
+            version_path = f"{output_dir}/versions/article_{topic_id}_v{version}.html"
 
-            # 버전 히스토리 확인
+            # 캐시 파일에는 현재 버전 내용만 있으므로 히스토리에 현재 버전이 있을 때만 한 번 생성
+            # (버전 히스토리가 없는 구 버전 캐시는 그대로 현재 버전만 저장)
             version_history = article_data.get("version_history", [])
-            if version_history:
-                # 모든 버전에 대해 HTML 생성
-                for version_info in version_history:
-                    if version_info.get("article_id") == topic_id:
-                        # 현재 버전
-                        html_output = generator._generate_html(
-                            article_data,
-                            article_data.get("related_articles_count", 1),
-                            is_update=version > 1,
-                        )
-
-                        # 버전별 파일 저장
-                        version_filename = f"article_{topic_id}_v{version}.html"
-                        version_path = f"{output_dir}/versions/{version_filename}"
-
-                        with open(version_path, "w", encoding="utf-8") as f:
-                            f.write(html_output)
-
-                        print(f"버전 HTML 생성: {version_path}")
-            else:
-                # 버전 히스토리가 없는 경우 (구 버전)
-                html_output = generator._generate_html(
-                    article_data,
-                    article_data.get("related_articles_count", 1),
-                    is_update=version > 1,
-                )
-
-                # 현재 버전만 저장
-                version_filename = f"article_{topic_id}_v{version}.html"
-                version_path = f"{output_dir}/versions/{version_filename}"
-
-                with open(version_path, "w", encoding="utf-8") as f:
-                    f.write(html_output)
+            if version_history and not any(
+                version_info.get("article_id") == topic_id for version_info in version_history
+            ):
+                continue
+
+            html_output = generator._generate_html(
+                article_data,
+                article_data.get("related_articles_count", 1),
+                is_update=version > 1,
+            )
+            writes.append(pool.submit(write_html, version_path, html_output.encode("utf-8")))
 
-                print(f"버전 HTML 생성: {version_path}")
+        # 쓰기 중 발생한 예외를 호출자에게 전달
+        for write in writes:
+            write.result()
 
 
 def generate_top_articles(start_rank: int = 1, end_rank: int = 5):
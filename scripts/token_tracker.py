@@ -10,12 +10,52 @@ See LICENSE file for details.
 토큰 사용량 및 비용 추적 모듈
 """
 
-import json
+import atexit
 import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Optional
 
+from scripts.utils import dumps_json, loads_json
+
+# 모델명에 포함된 문자열 → 가격표 키 (구체적인 것부터 순서대로 검사)
+_MODEL_NAME_RULES = (
+    ("gpt-4.1-nano", "gpt-4.1-nano"),
+    ("gpt-4o", "gpt-4o"),
+    ("gpt-4-turbo", "gpt-4-turbo"),
+    ("gpt-4", "gpt-4"),
+    ("gpt-3.5", "gpt-3.5-turbo"),
+)
+
+
+@lru_cache(maxsize=64)
+def _normalize_model_name(model: str) -> str:
+    """모델명을 가격표 키로 변환 (같은 모델명은 캐시된 결과 사용)"""
+    model_lower = model.lower()
+    for token, model_key in _MODEL_NAME_RULES:
+        if token in model_lower:
+            return model_key
+    return "gpt-4"  # 기본값
+
+
+_NOW_ISO_TTL = 0.5  # 현재 시각 문자열 재사용 시간 (초)
+_now_iso_cache = (float("-inf"), "")  # (생성 시점의 monotonic 시각, ISO 문자열)
+
+
+def _now_iso() -> str:
+    """현재 시각 ISO 문자열 (호출이 몰릴 때는 _NOW_ISO_TTL 동안 같은 문자열 재사용)"""
+    global _now_iso_cache
+    checked_at, now_iso = _now_iso_cache
+    monotonic_now = time.monotonic()
+    if monotonic_now - checked_at > _NOW_ISO_TTL:
+        now_iso = datetime.now().isoformat()
+        _now_iso_cache = (monotonic_now, now_iso)
+    return now_iso
+
 
 class TokenTracker:
     """
@@ -24,6 +64,10 @@ class TokenTracker:
     OpenAI API 호출의 토큰 사용량을 추적하고 비용을 계산합니다.
     각 기사별로 메타데이터를 파일로 저장하여 누적 추적이 가능합니다.
     
+    API 호출마다 파일을 다시 읽고 쓰지 않도록 메타데이터는 메모리에 누적해 두고
+    flush()가 호출될 때(기사 저장 시, 프로세스 종료 시) 파일로 기록합니다.
+    누적 버퍼는 같은 프로세스의 모든 TokenTracker 인스턴스가 공유합니다.
+    
     Attributes:
         PRICING: 모델별 토큰 가격 정보 (USD per 1K tokens)
         metadata_dir: 메타데이터 저장 디렉토리
@@ -57,6 +101,16 @@ class TokenTracker:
         },
     }
     
+    # 호출마다 문자열 키 조회를 반복하지 않도록 (프롬프트, 응답) 가격을 튜플로 미리 정리
+    _PRICING_PAIRS = {model: (price["prompt"], price["completion"]) for model, price in PRICING.items()}
+    _DEFAULT_PRICING_PAIR = _PRICING_PAIRS["gpt-4"]
+    # 메타데이터의 "pricing" 블록 원본 (호출마다 복사해서 넣으므로 호출자가 고쳐도 가격표는 그대로)
+    _PRICING_BLOCKS = {
+        model: {"prompt_price": prompt_price, "completion_price": completion_price}
+        for model, (prompt_price, completion_price) in _PRICING_PAIRS.items()
+    }
+    _UNKNOWN_PRICING_BLOCK = {"prompt_price": 0, "completion_price": 0}
+    
     # 이미지 생성 가격 정보 (USD per image)
     IMAGE_PRICING = {
         "gpt-image-1": {
@@ -95,6 +149,17 @@ class TokenTracker:
         }
     }
 
+    # 아직 파일에 기록하지 않은 기사별 메타데이터 {메타데이터 파일 경로: 메타데이터}
+    # (생성기, 분석기, 이미지 생성기가 각자 만든 인스턴스가 같은 기사를 누적하므로 클래스 단위로 공유)
+    _pending: Dict[Path, Dict] = {}
+    # 동시 API 호출이 같은 기사의 메타데이터를 누적하는 경우를 직렬화
+    _lock = threading.Lock()
+
+    # get_total_usage가 파일별 사용량을 보관하는 요약 파일 (*_metadata.json 패턴과 겹치지 않는 이름)
+    TOTALS_FILENAME = "_totals.json"
+    # 특정 기사에 속하지 않는 일괄 생성 오버헤드 ID 접두사 (비용에는 포함, 기사 수에서는 제외)
+    BATCH_ID_PREFIX = "batch_"
+
     def __init__(self):
         self.metadata_dir = Path("article_metadata")
         self.metadata_dir.mkdir(exist_ok=True)
@@ -133,20 +198,18 @@ class TokenTracker:
         metadata = {
             "id": article_id,
             "title": article_title,
-            "created_at": datetime.now().isoformat(),
+            "created_at": _now_iso(),
             "model": model,
             "prompt_tokens": prompt_tokens,
             "completion_tokens": completion_tokens,
             "total_tokens": total_tokens,
             "cost_usd": cost_usd,
-            "pricing": {
-                "prompt_price": self.PRICING.get(model_key, {}).get("prompt", 0),
-                "completion_price": self.PRICING.get(model_key, {}).get("completion", 0),
-            },
+            "pricing": dict(self._PRICING_BLOCKS.get(model_key, self._UNKNOWN_PRICING_BLOCK)),
         }
 
-        # 파일로 저장
-        self._save_metadata(article_id, metadata)
+        # 기존 메타데이터에 누적 (파일에는 flush() 때 기록)
+        with self._lock:
+            self._save_metadata(article_id, metadata)
 
         return metadata
 
@@ -162,20 +225,7 @@ class TokenTracker:
         Returns:
             정규화된 모델명
         """
-        model_lower = model.lower()
-
-        if "gpt-4.1-nano" in model_lower:
-            return "gpt-4.1-nano"
-        elif "gpt-4o" in model_lower:
-            return "gpt-4o"
-        elif "gpt-4-turbo" in model_lower:
-            return "gpt-4-turbo"
-        elif "gpt-4" in model_lower:
-            return "gpt-4"
-        elif "gpt-3.5" in model_lower:
-            return "gpt-3.5-turbo"
-        else:
-            return "gpt-4"  # 기본값
+        return _normalize_model_name(model)
 
     def _calculate_cost(self, prompt_tokens: int, completion_tokens: int, model: str) -> float:
         """
@@ -191,18 +241,18 @@ class TokenTracker:
         Returns:
             USD 비용 (소수점 6자리까지)
         """
-        pricing = self.PRICING.get(model, self.PRICING["gpt-4"])
+        prompt_price, completion_price = self._PRICING_PAIRS.get(model, self._DEFAULT_PRICING_PAIR)
 
-        prompt_cost = (prompt_tokens / 1000) * pricing["prompt"]
-        completion_cost = (completion_tokens / 1000) * pricing["completion"]
+        prompt_cost = (prompt_tokens / 1000) * prompt_price
+        completion_cost = (completion_tokens / 1000) * completion_price
 
         return round(prompt_cost + completion_cost, 6)
 
     def _save_metadata(self, article_id: str, metadata: Dict):
         """
-        메타데이터 파일로 저장 (기존 데이터가 있으면 토큰 누적)
+        메타데이터 저장 (기존 데이터가 있으면 토큰 누적)
         
-        기사 메타데이터를 JSON 파일로 저장합니다.
+        기사 메타데이터를 메모리 버퍼에 저장하고, flush() 때 JSON 파일로 기록합니다.
         동일한 기사에 대한 여러 API 호출이 있을 경우 토큰을 누적합니다.
         
         Args:
@@ -212,11 +262,9 @@ class TokenTracker:
         filename = self.metadata_dir / f"{article_id}_metadata.json"
 
         # 기존 메타데이터 확인
-        if filename.exists():
+        existing_data = self._load_existing(filename)
+        if existing_data is not None:
             try:
-                with open(filename, "r", encoding="utf-8") as f:
-                    existing_data = json.load(f)
-
                 # 토큰 누적
                 metadata["prompt_tokens"] += existing_data.get("prompt_tokens", 0)
                 metadata["completion_tokens"] += existing_data.get("completion_tokens", 0)
@@ -233,7 +281,7 @@ class TokenTracker:
 
                 # 첫 번째 호출의 생성 시간 유지
                 metadata["created_at"] = existing_data.get("created_at", metadata["created_at"])
-                metadata["last_updated"] = datetime.now().isoformat()
+                metadata["last_updated"] = _now_iso()
 
             except Exception as e:
                 print(f"Warning: Could not read existing metadata for {article_id}: {e}")
@@ -241,8 +289,7 @@ class TokenTracker:
         else:
             metadata["api_calls"] = 1
 
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
+        self._pending[filename] = metadata
 
     def track_image_generation(
         self, model: str, quality: str, size: str, article_id: str, article_title: str = None,
@@ -282,7 +329,7 @@ class TokenTracker:
         metadata = {
             "id": article_id,
             "title": article_title,
-            "created_at": datetime.now().isoformat(),
+            "created_at": _now_iso(),
             "type": "image_generation",
             "model": model,
             "quality": quality,
@@ -291,8 +338,9 @@ class TokenTracker:
             "provider": "runware" if "runware" in model else "openai"
         }
         
-        # 파일로 저장 (기존 메타데이터에 추가)
-        self._save_image_metadata(article_id, metadata)
+        # 기존 메타데이터에 추가 (파일에는 flush() 때 기록)
+        with self._lock:
+            self._save_image_metadata(article_id, metadata)
         
         return metadata
     
@@ -301,11 +349,9 @@ class TokenTracker:
         filename = self.metadata_dir / f"{article_id}_metadata.json"
         
         # 기존 메타데이터 확인
-        if filename.exists():
+        existing_data = self._load_existing(filename)
+        if existing_data is not None:
             try:
-                with open(filename, "r", encoding="utf-8") as f:
-                    existing_data = json.load(f)
-                
                 # 이미지 생성 정보 추가
                 if "image_generations" not in existing_data:
                     existing_data["image_generations"] = []
@@ -320,7 +366,7 @@ class TokenTracker:
                 
                 # 전체 비용 업데이트
                 existing_data["total_cost_usd"] = existing_data.get("cost_usd", 0) + metadata["cost_usd"]
-                existing_data["last_updated"] = datetime.now().isoformat()
+                existing_data["last_updated"] = _now_iso()
                 
                 metadata = existing_data
             except Exception as e:
@@ -341,14 +387,53 @@ class TokenTracker:
                 "cost_usd": metadata["cost_usd"]
             }]
         
-        with open(filename, "w", encoding="utf-8") as f:
-            json.dump(metadata, f, ensure_ascii=False, indent=2)
+        self._pending[filename] = metadata
+
+    def _load_existing(self, filename: Path) -> Optional[Dict]:
+        """
+        기사의 기존 메타데이터 (메모리에 누적 중인 값 우선, 없으면 파일에서 한 번 로드)
+        
+        파일이 없거나 읽을 수 없으면 None을 반환합니다.
+        """
+        pending = self._pending.get(filename)
+        if pending is not None:
+            return pending
+        # 존재 여부를 따로 stat하지 않고 바로 열어 봄 (없으면 새 기사)
+        try:
+            with open(filename, "rb") as f:
+                return loads_json(f.read())
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Warning: Could not read existing metadata for {filename.name}: {e}")
+            return None
+
+    @classmethod
+    def flush(cls):
+        """
+        메모리에 누적된 메타데이터를 파일로 기록
+        
+        임시 파일에 쓴 뒤 교체하므로 기록 도중에 읽더라도 완전한 파일만 보입니다.
+        기록한 항목은 버퍼에서 제거되며, 이후 호출은 파일에서 다시 누적을 시작합니다.
+        기록에 실패하면 예외를 그대로 올리고, 아직 기록하지 못한 항목은 버퍼에 남겨
+        다음 flush()(프로세스 종료 시 포함)에서 다시 시도합니다.
+        """
+        with cls._lock:
+            for filename, metadata in list(cls._pending.items()):
+                tmp_file = filename.with_name(filename.name + ".tmp")
+                with open(tmp_file, "wb") as f:
+                    f.write(dumps_json(metadata))
+                os.replace(tmp_file, filename)
+                # 파일 교체까지 끝난 항목만 버퍼에서 제거
+                del cls._pending[filename]
     
     def get_total_usage(self) -> Dict:
         """
         전체 사용량 통계
         
         모든 기사의 토큰 사용량과 비용을 집계하여 반환합니다.
+        일괄 생성 오버헤드(BATCH_ID_PREFIX로 시작하는 ID)는 토큰과 비용에는 포함하되
+        기사 수에는 세지 않습니다.
         
         Returns:
             전체 통계 디텍셔너리 {
@@ -360,30 +445,55 @@ class TokenTracker:
                 "average_cost_per_article": 기사당 평균 비용
             }
         """
-        total_prompt = 0
-        total_completion = 0
-        total_text_cost = 0
-        total_image_cost = 0
-        article_count = 0
-        total_images = 0
-
-        for metadata_file in self.metadata_dir.glob("*_metadata.json"):
-            try:
-                with open(metadata_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    total_prompt += data.get("prompt_tokens", 0)
-                    total_completion += data.get("completion_tokens", 0)
-                    total_text_cost += data.get("cost_usd", 0)
-                    
-                    # 이미지 생성 비용 추가
-                    if "image_generations" in data:
-                        for img in data["image_generations"]:
-                            total_image_cost += img.get("cost_usd", 0)
-                            total_images += 1
-                    
-                    article_count += 1
-            except Exception as e:
-                print(f"Error reading {metadata_file}: {e}")
+        # 아직 기록하지 않은 메타데이터까지 집계에 포함
+        self.flush()
+
+        # 파일별 사용량 요약 캐시 (수정 시각/크기가 그대로인 파일은 다시 읽지 않음)
+        totals_path = self.metadata_dir / self.TOTALS_FILENAME
+        cached_usage = self._load_usage_cache(totals_path)
+        file_usage = {}
+        stale = []
+
+        # scandir은 디렉토리를 한 번만 읽고, 파일마다 stat만으로 변경 여부를 확인
+        with os.scandir(self.metadata_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith("_metadata.json"):
+                    continue
+                try:
+                    stat = entry.stat()
+                except Exception as e:
+                    print(f"Error reading {entry.path}: {e}")
+                    continue
+                cached = cached_usage.get(entry.name)
+                if cached and cached["mtime_ns"] == stat.st_mtime_ns and cached["size"] == stat.st_size:
+                    file_usage[entry.name] = cached
+                    continue
+                # 자리만 잡아 두고 (집계 순서 유지) 내용은 아래에서 한꺼번에 읽음
+                file_usage[entry.name] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "usage": None}
+                stale.append(entry)
+
+        # 바뀐 파일은 스레드 풀에서 동시에 읽음 (파일 읽기와 orjson 파싱 중에는 GIL이 풀림)
+        stale_paths = [entry.path for entry in stale]
+        if len(stale) > 1:
+            with ThreadPoolExecutor(max_workers=min(16, len(stale))) as pool:
+                usages = list(pool.map(self._try_read_file_usage, stale_paths))
+        else:
+            usages = [self._try_read_file_usage(path) for path in stale_paths]
+        changed = False
+        for entry, usage in zip(stale, usages):
+            if usage is None:
+                del file_usage[entry.name]
+            else:
+                file_usage[entry.name]["usage"] = usage
+                changed = True
+
+        if changed or len(file_usage) != len(cached_usage):
+            self._save_usage_cache(totals_path, file_usage)
+
+        # 파일별 사용량을 열 단위로 묶어 내장 sum으로 합산 (파이썬 수준 += 루프 제거)
+        columns = list(zip(*(cached["usage"] for cached in file_usage.values()))) or [()] * 5
+        total_prompt, total_completion, total_text_cost, total_image_cost, total_images = map(sum, columns)
+        article_count = sum(1 for name in file_usage if not name.startswith(self.BATCH_ID_PREFIX))
 
         total_cost = total_text_cost + total_image_cost
 
@@ -399,3 +509,47 @@ class TokenTracker:
             "average_cost_per_article": round(total_cost / max(article_count, 1), 3),
             "average_images_per_article": round(total_images / max(article_count, 1), 2),
         }
+
+    @staticmethod
+    def _read_file_usage(path: str) -> list:
+        """메타데이터 파일 하나의 사용량 [프롬프트 토큰, 응답 토큰, 텍스트 비용, 이미지 비용, 이미지 수]"""
+        with open(path, "rb") as f:
+            data = loads_json(f.read())
+        image_generations = data.get("image_generations", [])
+        return [
+            data.get("prompt_tokens", 0),
+            data.get("completion_tokens", 0),
+            data.get("cost_usd", 0),
+            sum(img.get("cost_usd", 0) for img in image_generations),
+            len(image_generations),
+        ]
+
+    @classmethod
+    def _try_read_file_usage(cls, path: str) -> Optional[list]:
+        """메타데이터 파일 하나의 사용량 (읽기 실패 시 None)"""
+        try:
+            return cls._read_file_usage(path)
+        except Exception as e:
+            print(f"Error reading {path}: {e}")
+            return None
+
+    @staticmethod
+    def _load_usage_cache(totals_path: Path) -> Dict:
+        """파일별 사용량 요약 캐시 로드 (없거나 손상되면 빈 캐시)"""
+        try:
+            with open(totals_path, "rb") as f:
+                return loads_json(f.read())
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _save_usage_cache(totals_path: Path, file_usage: Dict):
+        """파일별 사용량 요약 캐시 저장 (임시 파일에 쓴 뒤 교체)"""
+        tmp_file = totals_path.with_name(totals_path.name + ".tmp")
+        with open(tmp_file, "wb") as f:
+            f.write(dumps_json(file_usage))
+        os.replace(tmp_file, totals_path)
+
+
+# 프로세스 종료 시 남은 메타데이터 기록
+atexit.register(TokenTracker.flush)
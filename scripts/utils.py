@@ -10,18 +10,34 @@ See LICENSE file for details.
 Utility functions for KONA project
 """
 
+import json
 import os
+import re
 import time
 import logging
+import logging.handlers
+import threading
+from collections import deque
+from functools import lru_cache
 from typing import Optional, Dict, Any
 from pathlib import Path
 from dotenv import load_dotenv
 from datetime import datetime, timezone, timedelta
 
+try:
+    import orjson
+except ImportError:  # orjson이 없으면 표준 json 사용
+    orjson = None
+
 # Load environment variables
 load_dotenv()
 
 
+# 로깅 핸들러는 프로세스당 한 번만 구성
+_logging_configured = False
+_logging_lock = threading.Lock()
+
+
 # Configure logging
 def setup_logging(name: str = "kona") -> logging.Logger:
     """
@@ -29,6 +45,7 @@ def setup_logging(name: str = "kona") -> logging.Logger:
     
     표준화된 로깅 설정을 구성합니다.
     파일과 콘솔에 동시에 로그를 출력합니다.
+    핸들러는 처음 호출될 때 한 번만 만들고, 로그 파일은 자정마다 교체됩니다.
     
     Args:
         name: 로거 이름 (기본값: "kona")
@@ -36,16 +53,21 @@ def setup_logging(name: str = "kona") -> logging.Logger:
     Returns:
         구성된 로거 객체
     """
-    log_dir = Path("logs")
-    log_dir.mkdir(exist_ok=True)
-
-    log_file = log_dir / f"{name}_{datetime.now().strftime('%Y%m%d')}.log"
-
-    logging.basicConfig(
-        level=logging.INFO,
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[logging.FileHandler(log_file), logging.StreamHandler()],
-    )
+    global _logging_configured
+    with _logging_lock:
+        if not _logging_configured:
+            log_dir = Path("logs")
+            log_dir.mkdir(exist_ok=True)
+
+            # 날짜를 파일명에 넣는 대신 자정에 교체 (자정을 넘겨 실행되는 프로세스도 날짜별로 나뉨)
+            file_handler = logging.handlers.TimedRotatingFileHandler(log_dir / f"{name}.log", when="midnight")
+
+            logging.basicConfig(
+                level=logging.INFO,
+                format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+                handlers=[file_handler, logging.StreamHandler()],
+            )
+            _logging_configured = True
 
     return logging.getLogger(name)
 
@@ -103,6 +125,10 @@ def parse_iso_to_kst(iso_string: str) -> datetime:
     return dt.astimezone(KST)
 
 
+# OpenAI API 키를 사용하는 AI_MODEL 값
+_OPENAI_MODELS = frozenset({"openai", "gpt-4", "gpt-4.1-nano", "gpt-4o", "gpt-3.5-turbo"})
+
+
 class APIKeyManager:
     """
     Manage API keys for different services
@@ -123,6 +149,13 @@ class APIKeyManager:
         self.gpt4_key = os.getenv("OPENAI_API_KEY")
         self.active_model = os.getenv("AI_MODEL", "claude").lower()
         self.debug = os.getenv("DEBUG", "False").lower() == "true"
+        # 활성 모델은 생성 후 바뀌지 않으므로 해당 키를 한 번만 골라 둠
+        if self.active_model == "claude":
+            self._active_key = self.claude_key
+        elif self.active_model in _OPENAI_MODELS:
+            self._active_key = self.gpt4_key
+        else:
+            self._active_key = None
 
     def get_active_key(self) -> Optional[str]:
         """
@@ -133,11 +166,7 @@ class APIKeyManager:
         Returns:
             API 키 문자열 (없으면 None)
         """
-        if self.active_model == "claude":
-            return self.claude_key
-        elif self.active_model in ["openai", "gpt-4", "gpt-4.1-nano", "gpt-4o", "gpt-3.5-turbo"]:
-            return self.gpt4_key
-        return None
+        return self._active_key
 
     def has_valid_key(self) -> bool:
         """
@@ -148,7 +177,26 @@ class APIKeyManager:
         Returns:
             유효한 키가 있으면 True, 없으면 False
         """
-        return self.get_active_key() is not None
+        return self._active_key is not None
+
+
+@lru_cache(maxsize=None)
+def get_openai_client(api_key: str):
+    """
+    Get a shared OpenAI client for the given API key
+    
+    API 키별로 하나의 OpenAI 클라이언트를 만들어 재사용합니다.
+    생성기/분석기 인스턴스마다 새 연결 풀을 만들지 않도록 합니다.
+    
+    Args:
+        api_key: OpenAI API 키
+        
+    Returns:
+        openai.OpenAI 클라이언트
+    """
+    import openai
+
+    return openai.OpenAI(api_key=api_key)
 
 
 class RateLimiter:
@@ -159,7 +207,7 @@ class RateLimiter:
     
     Attributes:
         calls_per_minute: 분당 허용 호출 수
-        calls: 최근 호출 시간 리스트
+        calls: 최근 호출 시각 (time.monotonic 기준, 오래된 순)
     """
 
     def __init__(self, calls_per_minute: int = 10):
@@ -170,7 +218,10 @@ class RateLimiter:
             calls_per_minute: 분당 허용 API 호출 수 (기본값: 10)
         """
         self.calls_per_minute = calls_per_minute
-        self.calls = []
+        # 제한 판단에는 최근 calls_per_minute개의 호출 시각만 필요 (넘치면 가장 오래된 기록부터 버림)
+        self.calls = deque(maxlen=calls_per_minute)
+        # 여러 스레드가 같은 limiter를 공유해도 호출 기록이 꼬이지 않도록 보호
+        self._lock = threading.Lock()
 
     def wait_if_needed(self):
         """
@@ -178,19 +229,30 @@ class RateLimiter:
         
         속도 제한을 초과할 경우 적절한 시간만큼 대기합니다.
         1분 이상 오래된 호출 기록은 자동으로 제거합니다.
+        스레드 안전하며, 대기는 잠금 밖에서 하므로 다른 스레드의 확인을 막지 않습니다.
+        깨어난 뒤에는 시각을 다시 읽어 제한을 다시 확인하고, 통과한 시각을 기록합니다.
         """
-        now = time.time()
-        # Remove calls older than 1 minute
-        self.calls = [call_time for call_time in self.calls if now - call_time < 60]
+        while True:
+            with self._lock:
+                # 시스템 시계 조정(NTP 등)에 영향을 받지 않도록 monotonic 시계 사용
+                now = time.monotonic()
+                # Remove calls older than 1 minute (오래된 순이므로 앞에서부터 제거)
+                while self.calls and now - self.calls[0] >= 60:
+                    self.calls.popleft()
+
+                if len(self.calls) < self.calls_per_minute:
+                    self.calls.append(now)
+                    return
+
+                # Wait until the oldest call is more than 1 minute old
+                sleep_time = 60 - (now - self.calls[0]) + 1
+
+            logging.info(f"Rate limit reached. Waiting {sleep_time:.1f} seconds...")
+            time.sleep(sleep_time)
 
-        if len(self.calls) >= self.calls_per_minute:
-            # Wait until the oldest call is more than 1 minute old
-            sleep_time = 60 - (now - self.calls[0]) + 1
-            if sleep_time > 0:
-                logging.info(f"Rate limit reached. Waiting {sleep_time:.1f} seconds...")
-                time.sleep(sleep_time)
 
-        self.calls.append(now)
+# HTML 태그
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
 
 
 def clean_text(text: str) -> str:
@@ -209,15 +271,14 @@ def clean_text(text: str) -> str:
     if not text:
         return ""
 
-    # Remove excessive whitespace
+    # Remove excessive whitespace (앞뒤 공백도 함께 제거됨)
     text = " ".join(text.split())
 
-    # Remove HTML tags if any
-    import re
+    # Remove HTML tags if any (태그가 없으면 정규식 검사와 strip 생략)
+    if "<" in text:
+        text = _HTML_TAG_RE.sub("", text).strip()
 
-    text = re.sub(r"<[^>]+>", "", text)
-
-    return text.strip()
+    return text
 
 
 def truncate_text(text: str, max_length: int = 500) -> str:
@@ -238,15 +299,96 @@ def truncate_text(text: str, max_length: int = 500) -> str:
         return text
 
     # Find the last complete sentence within the limit
-    sentences = text[:max_length].split(".")
-    if len(sentences) > 1:
-        return ".".join(sentences[:-1]) + "."
+    # (분할/재결합 없이 마지막 마침표 위치만 찾아 한 번에 자름)
+    end = text.rfind(".", 0, max_length)
+    if end != -1:
+        return text[:end + 1]
 
     # If no sentence boundary, truncate at word boundary
     words = text[:max_length].split()
     return " ".join(words[:-1]) + "..."
 
 
+# 마크다운 본문의 첫 번째 "# 제목" 줄
+_MARKDOWN_TITLE_RE = re.compile(r"^#\s+(.+?)$", re.MULTILINE)
+
+
+def extract_markdown_title(content: str) -> Optional[str]:
+    """
+    Extract the first level-1 heading from markdown
+    
+    마크다운 본문에서 첫 번째 '# 제목'을 찾아 반환합니다.
+    본문이 제목 줄로 시작하는 일반적인 경우는 정규식 없이 첫 줄만 확인합니다.
+    
+    Args:
+        content: 마크다운 본문
+        
+    Returns:
+        제목 문자열 (없으면 None)
+    """
+    if not content:
+        return None
+
+    if content.startswith("# "):
+        title = content.split("\n", 1)[0][2:].strip()
+        if title:
+            return title
+
+    match = _MARKDOWN_TITLE_RE.search(content)
+    return match.group(1).strip() if match else None
+
+
+_JSON_MMAP_MIN_SIZE = 4 * 1024 * 1024  # 이 크기 이상의 JSON 파일은 메모리 맵으로 파싱
+
+
+def loads_json(raw) -> Any:
+    """JSON 문자열/바이트 파싱 (orjson이 있으면 사용)"""
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def dumps_json(data: Any) -> bytes:
+    """JSON 직렬화 (들여쓰기 2칸, 한글은 그대로 UTF-8 바이트로)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
+
+
+def load_json_file(path) -> Any:
+    """
+    JSON 파일 로드 (orjson이 있으면 사용)
+    
+    파일 내용은 바이트로 읽어 파싱하고, 파싱이 끝나면 원본 버퍼는 바로 해제되도록
+    함수 안에서만 참조합니다. 호출자는 필요한 하위 트리만 남기면 됩니다.
+    큰 파일은 orjson이 있으면 메모리 맵을 그대로 파싱해 파일 전체를 복사해 두지 않습니다.
+    """
+    with open(path, "rb") as f:
+        if orjson is not None and os.fstat(f.fileno()).st_size >= _JSON_MMAP_MIN_SIZE:
+            import mmap
+
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                with memoryview(mapped) as view:
+                    return orjson.loads(view)
+        raw = f.read()
+    return loads_json(raw)
+
+
+def _find_latest_file(directory: str, prefix: str) -> Optional[Path]:
+    """
+    디렉토리에서 이름이 가장 뒤인(타임스탬프가 가장 최근인) prefix*.json 파일 찾기
+    
+    정렬 없이 scandir 한 번으로 최댓값만 고릅니다. 디렉토리가 없으면 None.
+    """
+    try:
+        with os.scandir(directory) as entries:
+            latest = max(
+                (entry.name for entry in entries if entry.name.startswith(prefix) and entry.name.endswith(".json")),
+                default=None,
+            )
+    except FileNotFoundError:
+        return None
+    return Path(directory) / latest if latest is not None else None
+
+
 def load_latest_news_data() -> Optional[Dict[str, Any]]:
     """
     Load the most recent news data file
@@ -257,51 +399,55 @@ def load_latest_news_data() -> Optional[Dict[str, Any]]:
     Returns:
         뉴스 데이터 디텍셔너리 (실패 시 None)
     """
-    import json
-
     # 먼저 네이버 뉴스 디렉토리 확인
-    naver_dir = Path("news_data/naver")
-    if naver_dir.exists():
-        naver_files = sorted(naver_dir.glob("all_news_*.json"), reverse=True)
-        if naver_files:
-            latest_file = naver_files[0]
-            logging.info(f"Loading Naver news data from: {latest_file}")
-
-            try:
-                with open(latest_file, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    # 네이버 뉴스 형식을 표준 형식으로 변환
-                    if "data" in data:
-                        return {
-                            "news": {"naver": data["data"]},
-                            "collected_at": data.get("collected_at", ""),
-                            "total_articles": data.get("total_articles", 0),
-                        }
-                    return {"news": {"naver": data}}
-            except Exception as e:
-                logging.error(f"Error loading Naver news data: {e}")
-
-    # 일반 뉴스 디렉토리 확인
-    news_dir = Path("news_data")
-    if not news_dir.exists():
-        return None
-
-    # Find the most recent news file
-    news_files = sorted(news_dir.glob("news_*.json"), reverse=True)
-    if not news_files:
+    latest_file = _find_latest_file("news_data/naver", "all_news_")
+    if latest_file is not None:
+        logging.info(f"Loading Naver news data from: {latest_file}")
+
+        try:
+            data = load_json_file(latest_file)
+            # 네이버 뉴스 형식을 표준 형식으로 변환 (기사 목록 외의 최상위 필드는 버림)
+            if "data" in data:
+                return {
+                    "news": {"naver": data["data"]},
+                    "collected_at": data.get("collected_at", ""),
+                    "total_articles": data.get("total_articles", 0),
+                }
+            return {"news": {"naver": data}}
+        except Exception as e:
+            logging.error(f"Error loading Naver news data: {e}")
+
+    # 일반 뉴스 디렉토리 확인 (Find the most recent news file)
+    latest_file = _find_latest_file("news_data", "news_")
+    if latest_file is None:
         return None
 
-    latest_file = news_files[0]
     logging.info(f"Loading news data from: {latest_file}")
 
     try:
-        with open(latest_file, "r", encoding="utf-8") as f:
-            return json.load(f)
+        return load_json_file(latest_file)
     except Exception as e:
         logging.error(f"Error loading news data: {e}")
         return None
 
 
+class _TitleCharFilter(dict):
+    """
+    파일명에 쓸 수 없는 문자를 지우는 str.translate용 테이블
+    
+    처음 보는 문자만 판별해 채워 두므로 전체 유니코드 표를 미리 만들 필요가 없습니다.
+    """
+
+    def __missing__(self, code: int) -> Optional[int]:
+        char = chr(code)
+        value = code if char.isalnum() or char in " -_" else None
+        self[code] = value
+        return value
+
+
+_TITLE_CHAR_FILTER = _TitleCharFilter()
+
+
 def save_generated_article(
     article: Dict[str, Any], output_dir: Path = Path("generated_articles")
 ) -> str:
@@ -318,16 +464,14 @@ def save_generated_article(
     Returns:
         저장된 파일 경로
     """
-    import json
-
     output_dir.mkdir(exist_ok=True)
 
     # Create filename from title and timestamp
-    safe_title = "".join(c for c in article["title"] if c.isalnum() or c in (" ", "-", "_"))[:50]
+    safe_title = article["title"].translate(_TITLE_CHAR_FILTER)[:50]
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     filename = output_dir / f"{safe_title}_{timestamp}.json"
 
-    with open(filename, "w", encoding="utf-8") as f:
-        json.dump(article, f, ensure_ascii=False, indent=2)
+    with open(filename, "wb") as f:
+        f.write(dumps_json(article))
 
     return str(filename)
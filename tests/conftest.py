@@ -0,0 +1,12 @@
+"""
+Copyright (c) 2025 pjeehoon and KONA Project Contributors
+This file is part of KONA (Korean Open News by AI).
+Unauthorized commercial use is prohibited.
+See LICENSE file for details.
+"""
+
+import sys
+from pathlib import Path
+
+# 프로젝트 루트를 경로에 추가 (scripts 패키지 import용)
+sys.path.insert(0, str(Path(__file__).parent.parent))
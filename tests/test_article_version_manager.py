@@ -0,0 +1,72 @@
+"""
+Copyright (c) 2025 pjeehoon and KONA Project Contributors
+This file is part of KONA (Korean Open News by AI).
+Unauthorized commercial use is prohibited.
+See LICENSE file for details.
+"""
+
+"""
+ArticleVersionManager 버전 히스토리 테스트
+"""
+
+import pytest
+
+from scripts.article_version_manager import ArticleVersionManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    return ArticleVersionManager(cache_dir=str(tmp_path))
+
+
+def create_chain(manager, length):
+    ids = []
+    parent_id = None
+    for number in range(1, length + 1):
+        parent_id = manager.create_article_version({"title": f"기사 v{number}"}, parent_id=parent_id)
+        ids.append(parent_id)
+    return ids
+
+
+def test_history_after_create_is_served_from_cache(manager, monkeypatch):
+    v1, v2, v3 = create_chain(manager, 3)
+
+    # 생성 직후의 조회는 부모 체인을 다시 따라가지 않음
+    monkeypatch.setattr(manager, "topic_index", dict(manager.topic_index))
+    for article_id in (v1, v2):
+        del manager.topic_index[article_id]
+
+    history = manager.get_article_history(v3)
+    assert [(h["version"], h["article_id"], h["is_current"]) for h in history] == [
+        (3, v3, True),
+        (2, v2, False),
+        (1, v1, False),
+    ]
+
+
+def test_cached_history_matches_history_rebuilt_from_index(manager, tmp_path):
+    ids = create_chain(manager, 3)
+    cached = {article_id: manager.get_article_history(article_id) for article_id in ids}
+
+    reloaded = ArticleVersionManager(cache_dir=str(tmp_path))
+    for article_id in ids:
+        assert reloaded.get_article_history(article_id) == cached[article_id]
+
+
+def test_creating_a_version_keeps_parent_history(manager):
+    v1, v2 = create_chain(manager, 2)
+    before = manager.get_article_history(v1)
+
+    manager.create_article_version({"title": "기사 v3"}, parent_id=v2)
+
+    assert manager.get_article_history(v1) == before
+    assert [h["article_id"] for h in before] == [v1]
+
+
+def test_returned_history_is_a_copy(manager):
+    (v1,) = create_chain(manager, 1)
+
+    manager.get_article_history(v1)[0]["title"] = "변경"
+
+    assert manager.get_article_history(v1)[0]["title"] == "기사 v1"
+    assert manager.get_article_history("unknown") == []
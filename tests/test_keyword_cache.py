@@ -0,0 +1,209 @@
+"""
+Copyright (c) 2025 pjeehoon and KONA Project Contributors
+This file is part of KONA (Korean Open News by AI).
+Unauthorized commercial use is prohibited.
+See LICENSE file for details.
+"""
+
+"""
+KeywordCache 테스트
+"""
+
+import os
+
+import pytest
+
+from scripts.keyword_cache import KeywordCache
+from scripts.utils import load_json_file
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    return str(tmp_path / "keywords" / "keyword_cache.json")
+
+
+@pytest.fixture
+def cache(cache_file):
+    cache = KeywordCache(cache_file)
+    yield cache
+    # atexit 때 삭제된 임시 디렉토리에 기록하지 않도록 정리
+    cache._dirty = False
+
+
+def test_make_key_depends_on_model_title_and_content_prefix():
+    key = KeywordCache.make_key("gpt-4.1-nano", "제목", "본문")
+    assert key == KeywordCache.make_key("gpt-4.1-nano", "제목", "본문")
+    assert key != KeywordCache.make_key("gpt-4o", "제목", "본문")
+    assert key != KeywordCache.make_key("gpt-4.1-nano", "다른 제목", "본문")
+    assert key != KeywordCache.make_key("gpt-4.1-nano", "제목", "다른 본문")
+    # 본문은 앞 300자만 키에 반영
+    body = "가" * 300
+    assert KeywordCache.make_key("m", "제목", body + "A") == KeywordCache.make_key("m", "제목", body + "B")
+    # 본문 없음과 빈 본문은 같은 키
+    assert KeywordCache.make_key("m", "제목") == KeywordCache.make_key("m", "제목", "")
+
+
+def test_get_returns_copy_of_stored_keywords(cache):
+    key = cache.make_key("m", "제목", "본문")
+    assert cache.get(key) is None
+    cache.set(key, "제목", ["경제", "금리"])
+
+    keywords = cache.get(key)
+    assert keywords == ["경제", "금리"]
+    keywords.append("변경")
+    assert cache.get(key) == ["경제", "금리"]
+    assert cache.stats() == {"hits": 2, "similar_hits": 0, "misses": 1, "entries": 1}
+
+
+def test_set_evicts_oldest_entry_beyond_max_entries(cache_file):
+    cache = KeywordCache(cache_file, max_entries=2)
+    cache.set("a", "제목 A", ["a"])
+    cache.set("b", "제목 B", ["b"])
+    # 다시 저장한 항목은 가장 최근 항목이 됨
+    cache.set("a", "제목 A", ["a2"])
+    cache.set("c", "제목 C", ["c"])
+
+    assert list(cache.entries) == ["a", "c"]
+    assert cache.get("b") is None
+    assert cache.get("a") == ["a2"]
+    cache._dirty = False
+
+
+def test_set_does_not_write_until_flush(cache, cache_file):
+    cache.set("a", "제목", ["경제"])
+    assert not os.path.exists(cache_file)
+
+    cache.flush()
+    assert load_json_file(cache_file) == {"a": {"title": "제목", "keywords": ["경제"]}}
+    assert not os.path.exists(f"{cache_file}.tmp")
+
+
+def test_flush_skips_write_when_not_dirty(cache, cache_file):
+    cache.set("a", "제목", ["경제"])
+    cache.flush()
+    os.remove(cache_file)
+
+    cache.flush()
+    assert not os.path.exists(cache_file)
+
+    cache.set("b", "제목 B", ["금리"])
+    cache.flush()
+    assert set(load_json_file(cache_file)) == {"a", "b"}
+
+
+def test_flushed_cache_is_reloaded(cache, cache_file):
+    cache.set("a", "제목", ["경제"], model_name="m", title_only=True)
+    cache.flush()
+
+    reloaded = KeywordCache(cache_file)
+    assert reloaded.get("a") == ["경제"]
+    assert reloaded.entries["a"] == {"title": "제목", "keywords": ["경제"], "model": "m", "title_only": True}
+
+
+def test_corrupt_cache_file_starts_empty(cache_file):
+    os.makedirs(os.path.dirname(cache_file))
+    with open(cache_file, "w", encoding="utf-8") as f:
+        f.write("{not json")
+
+    cache = KeywordCache(cache_file)
+    assert cache.entries == {}
+
+    # 손상된 파일은 다음 flush 때 올바른 내용으로 교체
+    cache.set("a", "제목", ["경제"])
+    cache.flush()
+    assert load_json_file(cache_file) == {"a": {"title": "제목", "keywords": ["경제"]}}
+
+
+def test_find_similar_matches_same_model_title_only_entries(cache):
+    title = "삼성전자 2분기 영업이익 10조 돌파"
+    cache.set("k1", title, ["삼성전자", "영업이익"], model_name="m", title_only=True)
+
+    assert cache.find_similar("m", title) == ["삼성전자", "영업이익"]
+    # 다른 모델로 추출한 항목은 재사용하지 않음
+    assert cache.find_similar("other", title) is None
+    assert cache.find_similar("m", "") is None
+
+
+def test_find_similar_ignores_entries_extracted_with_content(cache):
+    title = "삼성전자 2분기 영업이익 10조 돌파"
+    cache.set("k1", title, ["삼성전자"], model_name="m", title_only=False)
+    cache.set("k2", "모델 정보 없는 항목", ["기타"])
+
+    assert cache.find_similar("m", title) is None
+    assert cache.find_similar("m", "모델 정보 없는 항목") is None
+
+
+def test_get_falls_back_to_similar_title_and_counts_one_miss(cache):
+    title = "삼성전자 2분기 영업이익 10조 돌파"
+    cache.set(cache.make_key("m", title), title, ["삼성전자"], model_name="m", title_only=True)
+
+    assert cache.get(cache.make_key("m", title + "!"), "m", title + "!") == ["삼성전자"]
+    assert cache.get(cache.make_key("m", "전혀 다른 뉴스"), "m", "전혀 다른 뉴스") is None
+    assert cache.stats() == {"hits": 0, "similar_hits": 1, "misses": 1, "entries": 1}
+
+
+def test_shingle_index_stays_consistent_after_eviction_and_overwrite(cache_file):
+    cache = KeywordCache(cache_file, max_entries=2)
+    title_a = "삼성전자 2분기 영업이익 10조 돌파"
+    title_b = "한은 기준금리 동결 물가 우려"
+    cache.set("a", title_a, ["a"], model_name="m", title_only=True)
+    # 역색인을 만든 뒤의 변경도 반영되는지 확인
+    assert cache.find_similar("m", title_a) == ["a"]
+
+    cache.set("b", title_b, ["b"], model_name="m", title_only=True)
+    cache.set("c", "폭우로 도로 곳곳 통제", ["c"], model_name="m", title_only=True)
+
+    # 밀려난 항목은 역색인에서도 제거
+    assert "a" not in cache.entries
+    assert cache.find_similar("m", title_a) is None
+    assert all("a" not in keys for keys in cache._shingle_index.values())
+    assert set(cache._shingles) == {"b", "c"}
+
+    # 같은 키에 다른 제목을 저장하면 이전 제목의 3-gram은 남지 않음
+    cache.set("b", title_a, ["b2"], model_name="m", title_only=True)
+    assert cache.find_similar("m", title_b) is None
+    assert cache.find_similar("m", title_a) == ["b2"]
+    cache._dirty = False
+
+
+@pytest.mark.parametrize(
+    "stored, query",
+    [
+        ("삼성전자, 2분기 영업이익 10조 돌파", "삼성전자 2분기 영업이익 10조 돌파"),
+        ("한은 기준금리 동결…물가 우려", "한은, 기준금리 동결…물가 우려"),
+        ("'갑질 논란' 국회의원 사과", "\"갑질 논란\" 국회의원 사과"),
+        ("[속보] 한은 기준금리 동결", "한은 기준금리 동결"),
+    ],
+)
+def test_find_similar_matches_punctuation_and_prefix_edits(cache, stored, query):
+    cache.set("k", stored, ["키워드"], model_name="m", title_only=True)
+    assert cache.find_similar("m", query) == ["키워드"]
+
+
+@pytest.mark.parametrize(
+    "stored, query",
+    [
+        ("한은 기준금리 동결", "한은 기준금리 인하"),
+        ("손흥민 시즌 10호골 폭발", "손흥민 시즌 11호골 폭발"),
+        ("코스피 2% 상승 마감", "코스닥 2% 상승 마감"),
+        ("서울 아파트값 3주 연속 상승", "서울 아파트값 3주 연속 하락"),
+        ("이재명 대표 검찰 출석", "이재명 대표 검찰 소환 통보"),
+    ],
+)
+def test_find_similar_rejects_titles_reporting_different_facts(cache, stored, query):
+    cache.set("k", stored, ["키워드"], model_name="m", title_only=True)
+    assert cache.find_similar("m", query) is None
+
+
+def test_find_similar_threshold_boundary(cache):
+    from scripts.keyword_cache import TITLE_SIMILARITY_THRESHOLD
+
+    stored = "[속보] 한은 기준금리 동결"
+    cache.set("k", stored, ["키워드"], model_name="m", title_only=True)
+    query = "한은 기준금리 동결"
+    shingles, stored_shingles = cache._title_shingles(query), cache._title_shingles(stored)
+    score = len(shingles & stored_shingles) / len(shingles | stored_shingles)
+
+    assert cache.find_similar("m", query, threshold=score) == ["키워드"]
+    assert cache.find_similar("m", query, threshold=score + 0.01) is None
+    assert TITLE_SIMILARITY_THRESHOLD <= score
@@ -0,0 +1,111 @@
+"""
+Copyright (c) 2025 pjeehoon and KONA Project Contributors
+This file is part of KONA (Korean Open News by AI).
+Unauthorized commercial use is prohibited.
+See LICENSE file for details.
+"""
+
+"""
+RateLimiter 테스트 (가짜 시계 사용)
+"""
+
+import threading
+
+import pytest
+
+from scripts import utils
+from scripts.utils import RateLimiter
+
+
+class FakeClock:
+    def __init__(self, limiter: RateLimiter = None):
+        self.now = 1000.0
+        self.sleeps = []
+        self.limiter = limiter
+        self.lock_held_during_sleep = []
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        if self.limiter is not None:
+            self.lock_held_during_sleep.append(self.limiter._lock.locked())
+        self.sleeps.append(seconds)
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(utils, "time", clock)
+    return clock
+
+
+def test_calls_under_limit_do_not_wait(clock):
+    limiter = RateLimiter(calls_per_minute=3)
+    for _ in range(3):
+        limiter.wait_if_needed()
+        clock.now += 1
+
+    assert clock.sleeps == []
+    assert list(limiter.calls) == [1000.0, 1001.0, 1002.0]
+
+
+def test_call_over_limit_waits_and_records_time_after_sleep(clock):
+    limiter = RateLimiter(calls_per_minute=2)
+    clock.limiter = limiter
+    limiter.wait_if_needed()
+    clock.now += 10
+    limiter.wait_if_needed()
+    clock.now += 5
+
+    limiter.wait_if_needed()
+
+    # 가장 오래된 호출(1000초)이 1분을 넘길 때까지 (+1초 여유) 대기
+    assert clock.sleeps == [46.0]
+    # 기록되는 시각은 대기 전이 아니라 대기가 끝난 시각
+    assert list(limiter.calls) == [1010.0, 1061.0]
+    # 대기하는 동안 잠금을 잡고 있지 않음
+    assert clock.lock_held_during_sleep == [False]
+
+
+def test_old_calls_expire_after_a_minute(clock):
+    limiter = RateLimiter(calls_per_minute=1)
+    limiter.wait_if_needed()
+    clock.now += 60
+
+    limiter.wait_if_needed()
+
+    assert clock.sleeps == []
+    assert list(limiter.calls) == [1060.0]
+
+
+def test_waiting_thread_does_not_block_other_threads(monkeypatch):
+    limiter = RateLimiter(calls_per_minute=1)
+    limiter.wait_if_needed()
+    sleeping = threading.Event()
+    release = threading.Event()
+
+    class BlockingClock(FakeClock):
+        def sleep(self, seconds):
+            sleeping.set()
+            release.wait(5)
+            self.now += seconds
+
+    clock = BlockingClock()
+    limiter.calls[0] = clock.now
+    monkeypatch.setattr(utils, "time", clock)
+    waiter = threading.Thread(target=limiter.wait_if_needed)
+    waiter.start()
+    try:
+        assert sleeping.wait(5)
+
+        # 다른 스레드는 잠금을 바로 얻을 수 있음
+        assert limiter._lock.acquire(timeout=1)
+        limiter._lock.release()
+    finally:
+        release.set()
+        waiter.join(5)
+
+    assert not waiter.is_alive()
+    assert list(limiter.calls) == [1061.0]
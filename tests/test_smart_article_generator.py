@@ -0,0 +1,43 @@
+"""
+Copyright (c) 2025 pjeehoon and KONA Project Contributors
+This file is part of KONA (Korean Open News by AI).
+Unauthorized commercial use is prohibited.
+See LICENSE file for details.
+"""
+
+"""
+SmartArticleGenerator 테스트 (API 클라이언트 없이 확인 가능한 부분)
+"""
+
+import threading
+from types import SimpleNamespace
+
+from scripts.smart_article_generator import SmartArticleGenerator
+
+
+def make_generator(enable_quality_eval: bool) -> SmartArticleGenerator:
+    generator = SmartArticleGenerator.__new__(SmartArticleGenerator)
+    generator.enable_quality_eval = enable_quality_eval
+    generator.quality_evaluator = SimpleNamespace(
+        evaluate_article=lambda article: ("High", "🟢", {"length": len(article["generated_article"])})
+    )
+    return generator
+
+
+def test_run_with_quality_eval_runs_task_inline_when_disabled():
+    generator = make_generator(enable_quality_eval=False)
+    caller = threading.get_ident()
+
+    result, quality = generator._run_with_quality_eval("본문", lambda x: (x, threading.get_ident()), "태그")
+
+    assert result == ("태그", caller)
+    assert quality == ("", "", {})
+
+
+def test_run_with_quality_eval_overlaps_task_with_evaluation_when_enabled():
+    generator = make_generator(enable_quality_eval=True)
+
+    result, quality = generator._run_with_quality_eval("본문", lambda x: x * 2, "태그")
+
+    assert result == "태그태그"
+    assert quality == ("High", "🟢", {"length": 2})
@@ -0,0 +1,206 @@
+"""
+Copyright (c) 2025 pjeehoon and KONA Project Contributors
+This file is part of KONA (Korean Open News by AI).
+Unauthorized commercial use is prohibited.
+See LICENSE file for details.
+"""
+
+"""
+TokenTracker 테스트 (메타데이터 버퍼링, flush, 사용량 요약 캐시)
+"""
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+from scripts import token_tracker as token_tracker_module
+from scripts.token_tracker import TokenTracker
+from scripts.utils import dumps_json, load_json_file
+
+PROJECT_ROOT = Path(__file__).parent.parent
+
+
+def make_response(prompt_tokens: int, completion_tokens: int):
+    return SimpleNamespace(
+        usage=SimpleNamespace(
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            total_tokens=prompt_tokens + completion_tokens,
+        )
+    )
+
+
+@pytest.fixture
+def tracker(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    TokenTracker._pending.clear()
+    yield TokenTracker()
+    # atexit flush가 다른 테스트 디렉토리에 기록하지 않도록 정리
+    TokenTracker._pending.clear()
+
+
+def metadata_path(article_id: str) -> Path:
+    return Path("article_metadata") / f"{article_id}_metadata.json"
+
+
+def test_calls_accumulate_in_memory_until_flush(tracker):
+    tracker.track_api_call(make_response(1000, 500), "gpt-4.1-nano", "article_1", "제목")
+    tracker.track_api_call(make_response(2000, 1000), "gpt-4.1-nano", "article_1", "제목")
+
+    assert not metadata_path("article_1").exists()
+    pending = TokenTracker._pending[metadata_path("article_1")]
+    assert pending["prompt_tokens"] == 3000
+    assert pending["completion_tokens"] == 1500
+    assert pending["total_tokens"] == 4500
+    assert pending["api_calls"] == 2
+    assert pending["cost_usd"] == round(3 * 0.0001 + 1.5 * 0.0004, 6)
+
+    TokenTracker.flush()
+
+    assert TokenTracker._pending == {}
+    saved = load_json_file(metadata_path("article_1"))
+    assert saved["total_tokens"] == 4500
+    assert saved["api_calls"] == 2
+    assert not Path(f"{metadata_path('article_1')}.tmp").exists()
+
+
+def test_accumulation_continues_from_flushed_file(tracker):
+    tracker.track_api_call(make_response(1000, 500), "gpt-4o", "article_1")
+    TokenTracker.flush()
+
+    tracker.track_api_call(make_response(100, 50), "gpt-4o", "article_1")
+    TokenTracker.flush()
+
+    saved = load_json_file(metadata_path("article_1"))
+    assert saved["prompt_tokens"] == 1100
+    assert saved["completion_tokens"] == 550
+    assert saved["api_calls"] == 2
+    assert "last_updated" in saved
+
+
+def test_instances_share_the_pending_buffer(tracker):
+    tracker.track_api_call(make_response(10, 10), "gpt-4.1-nano", "article_1")
+    TokenTracker().track_image_generation("gpt-image-1", "low", "1024x1024", "article_1")
+
+    pending = TokenTracker._pending[metadata_path("article_1")]
+    assert pending["prompt_tokens"] == 10
+    assert pending["image_generations"][0]["cost_usd"] == 0.011
+
+
+def test_returned_pricing_block_is_not_shared(tracker):
+    metadata = tracker.track_api_call(make_response(10, 10), "gpt-4.1-nano", "article_1")
+    metadata["pricing"]["prompt_price"] = 999
+
+    other = tracker.track_api_call(make_response(10, 10), "gpt-4.1-nano", "article_2")
+    assert other["pricing"] == {"prompt_price": 0.0001, "completion_price": 0.0004}
+
+
+def test_failed_flush_keeps_unwritten_entries_buffered(tracker, monkeypatch):
+    tracker.track_api_call(make_response(10, 10), "gpt-4.1-nano", "article_ok")
+    tracker.track_api_call(make_response(20, 20), "gpt-4.1-nano", "article_fail")
+
+    real_replace = os.replace
+
+    def failing_replace(src, dst):
+        if Path(dst).name.startswith("article_fail"):
+            raise OSError("disk full")
+        real_replace(src, dst)
+
+    monkeypatch.setattr(token_tracker_module.os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        TokenTracker.flush()
+
+    assert metadata_path("article_ok").exists()
+    assert list(TokenTracker._pending) == [metadata_path("article_fail")]
+
+    # 다음 flush에서 남은 항목을 다시 기록
+    monkeypatch.setattr(token_tracker_module.os, "replace", real_replace)
+    TokenTracker.flush()
+    assert TokenTracker._pending == {}
+    assert load_json_file(metadata_path("article_fail"))["total_tokens"] == 40
+
+
+def test_persist_article_flushes_pending_metadata(tracker, tmp_path):
+    from scripts.smart_article_generator import SmartArticleGenerator
+
+    generator = SmartArticleGenerator.__new__(SmartArticleGenerator)
+    generator.output_dir = str(tmp_path / "smart_articles")
+    generator.versions_dir = f"{generator.output_dir}/versions"
+    os.makedirs(generator.versions_dir)
+    generator.token_tracker = tracker
+
+    tracker.track_api_call(make_response(10, 10), "gpt-4.1-nano", "article_1")
+    paths = generator._persist_article("topic", 1, "<html></html>", latest_filename="article_1.html")
+
+    assert Path(paths["html_path"]).read_text(encoding="utf-8") == "<html></html>"
+    assert TokenTracker._pending == {}
+    assert load_json_file(metadata_path("article_1"))["total_tokens"] == 20
+
+
+def test_pending_metadata_is_flushed_at_exit(tmp_path):
+    script = (
+        "from types import SimpleNamespace as NS\n"
+        "from scripts.token_tracker import TokenTracker\n"
+        "usage = NS(prompt_tokens=5, completion_tokens=7, total_tokens=12)\n"
+        "TokenTracker().track_api_call(NS(usage=usage), 'gpt-4.1-nano', 'article_exit')\n"
+    )
+    env = dict(os.environ, PYTHONPATH=str(PROJECT_ROOT))
+    subprocess.run([sys.executable, "-c", script], cwd=tmp_path, env=env, check=True)
+
+    saved = load_json_file(tmp_path / "article_metadata" / "article_exit_metadata.json")
+    assert saved["total_tokens"] == 12
+
+
+def test_get_total_usage_flushes_and_sums(tracker):
+    tracker.track_api_call(make_response(1000, 1000), "gpt-4.1-nano", "article_1")
+    tracker.track_api_call(make_response(2000, 0), "gpt-4.1-nano", "article_2")
+    tracker.track_image_generation("gpt-image-1", "low", "1024x1024", "article_2")
+    tracker.track_api_call(make_response(500, 0), "gpt-4.1-nano", "batch_20250101_000000")
+
+    usage = tracker.get_total_usage()
+
+    assert TokenTracker._pending == {}
+    # 배치 오버헤드는 토큰에는 포함되지만 기사 수에서는 제외
+    assert usage["total_articles"] == 2
+    assert usage["total_prompt_tokens"] == 3500
+    assert usage["total_completion_tokens"] == 1000
+    assert usage["total_tokens"] == 4500
+    assert usage["total_images"] == 1
+
+
+def test_get_total_usage_reuses_totals_for_unchanged_files(tracker):
+    tracker.track_api_call(make_response(1000, 0), "gpt-4.1-nano", "article_1")
+    tracker.get_total_usage()
+
+    totals_path = Path("article_metadata") / TokenTracker.TOTALS_FILENAME
+    totals = load_json_file(totals_path)
+    assert set(totals) == {"article_1_metadata.json"}
+    stat = metadata_path("article_1").stat()
+    assert totals["article_1_metadata.json"]["mtime_ns"] == stat.st_mtime_ns
+    assert totals["article_1_metadata.json"]["size"] == stat.st_size
+
+    # 수정 시각/크기가 그대로인 파일은 다시 읽지 않고 요약 값을 사용
+    totals["article_1_metadata.json"]["usage"][0] = 777
+    totals_path.write_bytes(dumps_json(totals))
+    assert tracker.get_total_usage()["total_prompt_tokens"] == 777
+
+    # 파일이 바뀌면 다시 읽음
+    tracker.track_api_call(make_response(1, 0), "gpt-4.1-nano", "article_1")
+    assert tracker.get_total_usage()["total_prompt_tokens"] == 1001
+
+    # 삭제된 파일은 요약에서도 빠짐
+    metadata_path("article_1").unlink()
+    assert tracker.get_total_usage()["total_articles"] == 0
+    assert load_json_file(totals_path) == {}
+
+
+def test_get_total_usage_ignores_corrupt_totals_file(tracker):
+    tracker.track_api_call(make_response(100, 0), "gpt-4.1-nano", "article_1")
+    tracker.flush()
+    (Path("article_metadata") / TokenTracker.TOTALS_FILENAME).write_text("{broken", encoding="utf-8")
+
+    assert tracker.get_total_usage()["total_prompt_tokens"] == 100